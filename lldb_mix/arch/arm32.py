@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from lldb_mix.arch.abi import AAPCS32
 from lldb_mix.arch.base import (
     ArchProfile,
     BranchDecision,
     ReadPointer,
-    parse_target_operand,
     resolve_reg_operand,
 )
 from lldb_mix.arch.info import ArchInfo
@@ -70,8 +71,15 @@ class Arm32Arch(ArchProfile):
                 out.append(" ")
         return "".join(out)
 
-    def is_conditional_branch(self, mnemonic: str) -> bool:
-        mnem = (mnemonic or "").lower()
+    def known_mnemonics(self) -> Iterable[str]:
+        names = [*super().known_mnemonics(), *_CB_MNEMONICS]
+        for base in _BRANCH_BASES:
+            names.append(base)
+            for cond in _CONDITIONS:
+                names.extend((f"{base}{cond}", f"{base}.{cond}"))
+        return names
+
+    def _conditional(self, mnem: str) -> bool:
         if mnem in _CB_MNEMONICS:
             return True
         base, cond = _split_condition(mnem)
@@ -79,14 +87,18 @@ class Arm32Arch(ArchProfile):
             return True
         return False
 
-    def is_unconditional_branch(self, mnemonic: str) -> bool:
-        base, cond = _split_condition(mnemonic)
+    def _unconditional(self, mnem: str) -> bool:
+        base, cond = _split_condition(mnem)
         return base in {"b", "bx"} and (cond is None or cond == "al")
 
-    def is_call(self, mnemonic: str) -> bool:
-        base, _ = _split_condition(mnemonic)
+    def _call(self, mnem: str) -> bool:
+        base, _ = _split_condition(mnem)
         return base in _CALL_BASES
 
+    def _condition(self, mnem: str) -> str:
+        _, cond = _split_condition(mnem)
+        return cond or ""
+
     def resolve_flow_target(
         self,
         mnemonic: str,
@@ -100,23 +112,22 @@ class Arm32Arch(ArchProfile):
         if not self.is_branch_like(mnemonic):
             return None
         mnem = (mnemonic or "").lower()
-        aliases = self.register_aliases(regs)
         parts = [p.strip() for p in operands.split(",")] if operands else []
 
         if mnem in _CB_MNEMONICS:
             if len(parts) < 2:
                 return None
-            return parse_target_operand(parts[1], regs, aliases)
+            return self.target_operand(parts[1], regs)
 
         base, _ = _split_condition(mnem)
         if base in _BRANCH_BASES:
             if not parts:
                 return None
-            return parse_target_operand(parts[0], regs, aliases)
+            return self.target_operand(parts[0], regs)
 
         if not parts:
             return None
-        return parse_target_operand(parts[0], regs, aliases)
+        return self.target_operand(parts[0], regs)
 
     def branch_decision(
         self,
@@ -159,8 +170,8 @@ class Arm32Arch(ArchProfile):
         return None
 
     def branch_taken(self, mnemonic: str, flags: int) -> tuple[bool, str]:
-        _, cond = _split_condition(mnemonic)
-        if not cond or cond not in _CONDITIONS:
+        cond = self.classify(mnemonic).condition
+        if not cond:
             return False, ""
         n = 1 if (flags & (1 << 31)) else 0
         z = 1 if (flags & (1 << 30)) else 0
@@ -169,6 +180,10 @@ class Arm32Arch(ArchProfile):
         func, reason = _CONDITIONS[cond]
         return func(n, z, c, v), reason
 
+    def pc_relative_base(self, next_pc: int | None) -> int | None:
+        _ = next_pc
+        return None
+
     def register_aliases(self, regs: dict[str, int]) -> dict[str, str]:
         aliases: dict[str, str] = {}
         lower = {name.lower() for name in regs}
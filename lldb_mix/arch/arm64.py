@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from lldb_mix.arch.base import (
     ArchProfile,
     BranchDecision,
     ReadPointer,
-    parse_target_operand,
     resolve_reg_operand,
 )
 from lldb_mix.arch.info import ArchInfo
@@ -30,6 +31,8 @@ _CONDITIONS = {
     "al": (lambda n, z, c, v: True, ""),
 }
 
+_BRANCH_MNEMONICS = {"b", "bl", "blr", "br", "ret", "cbz", "cbnz", "tbz", "tbnz"}
+
 
 class Arm64Arch(ArchProfile):
     def format_flags(self, value: int) -> str:
@@ -50,18 +53,29 @@ class Arm64Arch(ArchProfile):
                 out.append(" ")
         return "".join(out)
 
-    def is_conditional_branch(self, mnemonic: str) -> bool:
-        return mnemonic.lower().startswith("b.")
+    def known_mnemonics(self) -> Iterable[str]:
+        return (
+            *super().known_mnemonics(),
+            *_BRANCH_MNEMONICS,
+            *(f"b.{cond}" for cond in _CONDITIONS),
+        )
 
-    def is_unconditional_branch(self, mnemonic: str) -> bool:
-        mnem = mnemonic.lower()
+    def _conditional(self, mnem: str) -> bool:
+        return mnem.startswith("b.")
+
+    def _unconditional(self, mnem: str) -> bool:
         return mnem in {"b", "br"}
 
-    def is_branch_like(self, mnemonic: str) -> bool:
-        mnem = mnemonic.lower()
-        if mnem in {"b", "bl", "blr", "br", "ret", "cbz", "cbnz", "tbz", "tbnz"}:
+    def _branch_like(self, mnem: str) -> bool:
+        if mnem in _BRANCH_MNEMONICS:
             return True
-        return self.is_conditional_branch(mnemonic)
+        return self._conditional(mnem)
+
+    def _condition(self, mnem: str) -> str:
+        if not mnem.startswith("b."):
+            return ""
+        cond = mnem[2:]
+        return cond if cond in _CONDITIONS else ""
 
     def resolve_flow_target(
         self,
@@ -77,26 +91,25 @@ class Arm64Arch(ArchProfile):
             return None
 
         mnem = mnemonic.lower()
-        aliases = self.register_aliases(regs)
         if mnem.startswith("ret"):
             parts = [p.strip() for p in operands.split(",")] if operands else []
             if parts:
-                return parse_target_operand(parts[0], regs, aliases)
-            return resolve_reg_operand("lr", regs, aliases)
+                return self.target_operand(parts[0], regs)
+            return self.target_operand("lr", regs)
 
         parts = [p.strip() for p in operands.split(",")] if operands else []
         if mnem in {"cbz", "cbnz"}:
             if len(parts) < 2:
                 return None
-            return parse_target_operand(parts[1], regs, aliases)
+            return self.target_operand(parts[1], regs)
         if mnem in {"tbz", "tbnz"}:
             if len(parts) < 3:
                 return None
-            return parse_target_operand(parts[2], regs, aliases)
+            return self.target_operand(parts[2], regs)
 
         if not parts:
             return None
-        return parse_target_operand(parts[0], regs, aliases)
+        return self.target_operand(parts[0], regs)
 
     def branch_decision(
         self,
@@ -156,12 +169,8 @@ class Arm64Arch(ArchProfile):
         return None
 
     def branch_taken(self, mnemonic: str, flags: int) -> tuple[bool, str]:
-        mnem = mnemonic.lower()
-        if not mnem.startswith("b."):
-            return False, ""
-
-        cond = mnem.split(".", 1)[1]
-        if cond not in _CONDITIONS:
+        cond = self.classify(mnemonic).condition
+        if not cond:
             return False, ""
 
         n = 1 if (flags & (1 << 31)) else 0
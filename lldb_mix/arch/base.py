@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 from lldb_mix.arch.abi import AbiSpec
+from lldb_mix.arch.mnemonics import MnemonicClass, MnemonicTable
+from lldb_mix.arch.operands import operand_analyzer
 
 ReadPointer = Callable[[int, int], Optional[int]]
 
@@ -16,9 +18,6 @@ class BranchDecision:
     kind: str
 
 
-_REG_BOUNDARY = r"(?<![A-Za-z0-9_])(?:{name})(?![A-Za-z0-9_])"
-
-
 @dataclass(frozen=True)
 class ArchProfile:
     name: str
@@ -34,6 +33,9 @@ class ArchProfile:
     break_bytes: bytes = b""
     abi: AbiSpec | None = None
     call_mnemonics: tuple[str, ...] = ()
+    mnemonics: MnemonicTable = field(
+        default_factory=MnemonicTable, compare=False, repr=False
+    )
 
     def disasm_flavor(self) -> str:
         name = (self.name or "").lower()
@@ -44,13 +46,23 @@ class ArchProfile:
     def format_flags(self, value: int) -> str:
         return ""
 
+    def known_mnemonics(self) -> Iterable[str]:
+        return (*self.call_mnemonics, "call", "ret")
+
+    def build_mnemonic_table(self) -> None:
+        self.mnemonics.build(self._classify, self.known_mnemonics())
+
+    def classify(self, mnemonic: str) -> MnemonicClass:
+        entry = self.mnemonics.entries.get(mnemonic)
+        if entry is None:
+            entry = self.mnemonics.add(mnemonic, self._classify)
+        return entry
+
     def is_conditional_branch(self, mnemonic: str) -> bool:
-        _ = mnemonic
-        return False
+        return self.classify(mnemonic).conditional
 
     def is_unconditional_branch(self, mnemonic: str) -> bool:
-        _ = mnemonic
-        return False
+        return self.classify(mnemonic).unconditional
 
     def branch_taken(self, mnemonic: str, flags: int) -> tuple[bool, str]:
         _ = mnemonic
@@ -58,22 +70,52 @@ class ArchProfile:
         return False, ""
 
     def is_call(self, mnemonic: str) -> bool:
-        mnem = mnemonic.lower()
+        return self.classify(mnemonic).call
+
+    def is_return(self, mnemonic: str) -> bool:
+        return self.classify(mnemonic).ret
+
+    def is_branch_like(self, mnemonic: str) -> bool:
+        return self.classify(mnemonic).branch_like
+
+    def _classify(self, mnem: str) -> MnemonicClass:
+        return MnemonicClass(
+            conditional=self._conditional(mnem),
+            unconditional=self._unconditional(mnem),
+            call=self._call(mnem),
+            ret=self._return(mnem),
+            branch_like=self._branch_like(mnem),
+            condition=self._condition(mnem),
+        )
+
+    def _conditional(self, mnem: str) -> bool:
+        _ = mnem
+        return False
+
+    def _unconditional(self, mnem: str) -> bool:
+        _ = mnem
+        return False
+
+    def _call(self, mnem: str) -> bool:
         if self.call_mnemonics:
             return mnem in self.call_mnemonics
         return mnem.startswith("call")
 
-    def is_return(self, mnemonic: str) -> bool:
-        return (mnemonic or "").lower().startswith("ret")
+    def _return(self, mnem: str) -> bool:
+        return mnem.startswith("ret")
 
-    def is_branch_like(self, mnemonic: str) -> bool:
+    def _branch_like(self, mnem: str) -> bool:
         return (
-            self.is_return(mnemonic)
-            or self.is_conditional_branch(mnemonic)
-            or self.is_unconditional_branch(mnemonic)
-            or self.is_call(mnemonic)
+            self._return(mnem)
+            or self._conditional(mnem)
+            or self._unconditional(mnem)
+            or self._call(mnem)
         )
 
+    def _condition(self, mnem: str) -> str:
+        _ = mnem
+        return ""
+
     def resolve_flow_target(
         self,
         mnemonic: str,
@@ -88,8 +130,7 @@ class ArchProfile:
             return None
         if not operands:
             return None
-        op = operands.split(",", 1)[0].strip()
-        return parse_target_operand(op, regs)
+        return self.target_operand(operands.split(",", 1)[0].strip(), regs)
 
     def branch_decision(
         self,
@@ -100,15 +141,16 @@ class ArchProfile:
         include_unconditional: bool = False,
         include_calls: bool = False,
     ) -> BranchDecision | None:
-        if self.is_conditional_branch(mnemonic):
+        kind = self.classify(mnemonic)
+        if kind.conditional:
             taken, reason = self.branch_taken(mnemonic, flags)
             if reason:
                 return BranchDecision(taken, reason, "conditional")
-        if include_calls and self.is_call(mnemonic):
+        if include_calls and kind.call:
             return BranchDecision(True, "", "call")
-        if include_unconditional and self.is_return(mnemonic):
+        if include_unconditional and kind.ret:
             return BranchDecision(True, "", "return")
-        if include_unconditional and self.is_unconditional_branch(mnemonic):
+        if include_unconditional and kind.unconditional:
             return BranchDecision(True, "", "unconditional")
         return None
 
@@ -116,32 +158,30 @@ class ArchProfile:
         _ = regs
         return {}
 
-    def mem_operand_targets(self, operands: str, regs: dict[str, int]) -> list[int]:
+    def mem_operand_targets(
+        self, operands: str, regs: dict[str, int], next_pc: int | None = None
+    ) -> list[int]:
         if not operands or not regs:
             return []
-        aliases = self.register_aliases(regs)
-        reg_map = {name.lower(): name for name in regs}
-        reg_map.update(aliases)
-        reg_names = sorted(reg_map.keys(), key=len, reverse=True)
-        if not reg_names:
-            return []
-        pattern = re.compile(
-            _REG_BOUNDARY.format(name="|".join(re.escape(name) for name in reg_names)),
-            re.IGNORECASE,
-        )
+        pc_base = self.pc_relative_base(next_pc)
         targets: list[int] = []
-        for expr in re.findall(r"\[([^\]]+)\]", operands):
-            cleaned = expr.replace("#", "").replace("!", "")
-            regs_in = _regs_in_text(cleaned, pattern, reg_map)
-            if len(regs_in) != 1:
-                continue
-            base = regs.get(regs_in[0])
-            if base is None:
-                continue
-            offset = _parse_offset(cleaned)
-            targets.append(base + offset)
+        for operand in operand_analyzer(self, regs).mem_operands(operands):
+            addr = operand.evaluate(regs, pc_base)
+            if addr is not None:
+                targets.append(addr)
         return targets
 
+    def pc_relative_base(self, next_pc: int | None) -> int | None:
+        return next_pc
+
+    def target_operand(self, op: str, regs: dict[str, int]) -> int | None:
+        if not op:
+            return None
+        operand = operand_analyzer(self, regs).operand(op)
+        if operand is None or operand.indirect:
+            return None
+        return operand.evaluate(regs)
+
 
 def parse_immediate(text: str) -> int | None:
     if not text:
@@ -193,32 +233,3 @@ def parse_target_operand(
     if parsed is not None:
         return parsed
     return resolve_reg_operand(op, regs, aliases)
-
-def _regs_in_text(
-    text: str,
-    pattern: re.Pattern[str],
-    reg_map: dict[str, str],
-) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for match in pattern.finditer(text):
-        key = match.group(0).lower()
-        canon = reg_map.get(key)
-        if not canon or canon in seen:
-            continue
-        seen.add(canon)
-        out.append(canon)
-    return out
-
-
-def _parse_offset(expr: str) -> int:
-    match = re.search(r"([+-])\\s*(0x[0-9a-fA-F]+|\\d+)", expr)
-    if not match:
-        return 0
-    sign = -1 if match.group(1) == "-" else 1
-    try:
-        value = int(match.group(2), 0)
-    except ValueError:
-        return 0
-    return sign * value
-
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Iterable
 
 from lldb_mix.arch.reginfo import (
@@ -30,6 +30,7 @@ class ArchInfo:
     pc_reg_name: str | None
     sp_reg_name: str | None
     flags_reg_name: str | None
+    gpr_set: str = ""
 
     @staticmethod
     def from_lldb(target: Any | None, frame: Any | None) -> "ArchInfo":
@@ -39,15 +40,19 @@ class ArchInfo:
         reg_sets = _safe_get_reg_sets(frame)
         gpr_regs = select_gpr_set(reg_sets, ptr_size, _PC_CANDIDATES, _SP_CANDIDATES)
         gpr_names = tuple(reg.name for reg in gpr_regs)
+        gpr_set = _set_name(reg_sets, gpr_regs)
         pc_value = _safe_get_pc(frame)
         sp_value = _safe_get_sp(frame)
-        reg_values = _safe_get_reg_values(frame)
         pc_reg_name = find_named_reg(gpr_names, reg_sets, _PC_CANDIDATES)
         sp_reg_name = find_named_reg(gpr_names, reg_sets, _SP_CANDIDATES)
         flags_reg_name = find_named_reg(gpr_names, reg_sets, _FLAGS_CANDIDATES)
+        reg_values: dict[str, int] | None = None
         if pc_reg_name is None and pc_value is not None:
+            reg_values = _safe_get_reg_values(frame)
             pc_reg_name = find_reg_by_value(reg_sets, reg_values, ptr_size, pc_value)
         if sp_reg_name is None and sp_value is not None:
+            if reg_values is None:
+                reg_values = _safe_get_reg_values(frame)
             sp_reg_name = find_reg_by_value(reg_sets, reg_values, ptr_size, sp_value)
         return ArchInfo(
             triple=triple,
@@ -60,8 +65,12 @@ class ArchInfo:
             pc_reg_name=pc_reg_name,
             sp_reg_name=sp_reg_name,
             flags_reg_name=flags_reg_name,
+            gpr_set=gpr_set,
         )
 
+    def with_frame(self, frame: Any | None) -> "ArchInfo":
+        return replace(self, pc_value=_safe_get_pc(frame), sp_value=_safe_get_sp(frame))
+
     @staticmethod
     def from_register_sets(
         triple: str,
@@ -78,6 +87,7 @@ class ArchInfo:
         normalized = {name: tuple(normalize_reg_info(regs)) for name, regs in reg_sets.items()}
         gpr_regs = select_gpr_set(normalized, ptr_size, _PC_CANDIDATES, _SP_CANDIDATES)
         gpr_names = tuple(reg.name for reg in gpr_regs)
+        gpr_set = _set_name(normalized, gpr_regs)
         reg_values_norm = normalize_reg_values(reg_values)
         if not pc_reg_name:
             pc_reg_name = find_named_reg(gpr_names, normalized, _PC_CANDIDATES)
@@ -106,9 +116,21 @@ class ArchInfo:
             pc_reg_name=pc_reg_name,
             sp_reg_name=sp_reg_name,
             flags_reg_name=flags_reg_name,
+            gpr_set=gpr_set,
         )
 
 
+def _set_name(
+    reg_sets: dict[str, tuple[RegInfo, ...]], regs: tuple[RegInfo, ...]
+) -> str:
+    if not regs:
+        return ""
+    for name, candidate in reg_sets.items():
+        if candidate is regs:
+            return name
+    return ""
+
+
 def _safe_get_triple(target: Any | None) -> str:
     if not target:
         return ""
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+MAX_CACHED_MNEMONICS = 4096
+
+
+@dataclass(frozen=True)
+class MnemonicClass:
+    conditional: bool = False
+    unconditional: bool = False
+    call: bool = False
+    ret: bool = False
+    branch_like: bool = False
+    condition: str = ""
+
+
+PLAIN = MnemonicClass()
+
+Classifier = Callable[[str], MnemonicClass]
+
+
+class MnemonicTable:
+    def __init__(self, max_entries: int = MAX_CACHED_MNEMONICS):
+        self.max_entries = max_entries
+        self._known: dict[str, MnemonicClass] = {}
+        self.entries: dict[str, MnemonicClass] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def build(self, classify: Classifier, mnemonics: Iterable[str]) -> None:
+        known: dict[str, MnemonicClass] = {}
+        for mnem in mnemonics:
+            key = mnem.lower()
+            entry = _intern(classify(key))
+            known[key] = entry
+            known[key.upper()] = entry
+        self._known = known
+        self.entries = dict(known)
+
+    def lookup(self, mnemonic: str, classify: Classifier) -> MnemonicClass:
+        entry = self.entries.get(mnemonic)
+        if entry is not None:
+            return entry
+        return self.add(mnemonic, classify)
+
+    def add(self, mnemonic: str, classify: Classifier) -> MnemonicClass:
+        entry = _intern(classify((mnemonic or "").lower()))
+        if len(self.entries) >= self.max_entries:
+            self.entries = dict(self._known)
+        self.entries[mnemonic] = entry
+        return entry
+
+
+def _intern(entry: MnemonicClass) -> MnemonicClass:
+    return PLAIN if entry == PLAIN else entry
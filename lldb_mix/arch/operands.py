@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+MAX_CACHED_OPERANDS = 4096
+MAX_ANALYZERS = 16
+
+_REG_BOUNDARY = r"(?<![A-Za-z0-9_])(?:{name})(?![A-Za-z0-9_])"
+_MEM_EXPR = re.compile(r"(?:(?<![A-Za-z0-9_])([a-z]s)\s*:\s*)?\[([^\]]+)\]", re.I)
+_OFFSET = re.compile(r"([+-])\s*(0x[0-9a-fA-F]+|\d+)")
+_LEADING_INT = re.compile(r"[-+]?0x[0-9a-fA-F]+|[-+]?\d+")
+_BASE_OFFSET = re.compile(r"^([-+]?0x[0-9a-fA-F]+|[-+]?\d+)?\(([^)]+)\)$")
+_TERM = re.compile(r"([+-]?)\s*([^+-]+)")
+_SHIFT = re.compile(r"^(lsl|[su]xt[wx])(?:\s+(\d+))?$", re.IGNORECASE)
+_MISSING = object()
+
+RegisterHit = tuple[str, str]
+MemBase = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class Operand:
+    base: str | None = None
+    index: str | None = None
+    scale: int = 1
+    disp: int = 0
+    indirect: bool = False
+    pc_relative: bool = False
+    extend: str | None = None
+
+    def evaluate(
+        self, regs: dict[str, int], pc_base: int | None = None
+    ) -> int | None:
+        value = self.disp
+        if self.pc_relative:
+            if pc_base is None:
+                return None
+            value += pc_base
+        elif self.base is not None:
+            base = regs.get(self.base)
+            if base is None:
+                return None
+            value += base
+        if self.index is not None:
+            index = regs.get(self.index)
+            if index is None:
+                return None
+            if self.extend:
+                index = _extend(index, self.extend)
+            value += index * self.scale
+        return value
+
+
+class OperandAnalyzer:
+    def __init__(self, reg_map: dict[str, str], pc_reg: str = ""):
+        self.reg_map = reg_map
+        self.pc_reg = reg_map.get(pc_reg.lower(), pc_reg) if pc_reg else None
+        names = sorted(reg_map, key=len, reverse=True)
+        self.pattern = None
+        if names:
+            self.pattern = re.compile(
+                _REG_BOUNDARY.format(name="|".join(re.escape(name) for name in names)),
+                re.IGNORECASE,
+            )
+        self._registers: dict[str, tuple[RegisterHit, ...]] = {}
+        self._mem: dict[str, tuple[MemBase, ...]] = {}
+        self._operands: dict[str, Operand | None] = {}
+        self._mem_operands: dict[str, tuple[Operand, ...]] = {}
+
+    def registers(self, text: str) -> tuple[RegisterHit, ...]:
+        cached = self._registers.get(text)
+        if cached is not None:
+            return cached
+        seen: set[str] = set()
+        hits: list[RegisterHit] = []
+        if self.pattern is not None:
+            for match in self.pattern.finditer(text):
+                display = match.group(0)
+                canon = self.reg_map.get(display.lower())
+                if not canon or canon in seen:
+                    continue
+                seen.add(canon)
+                hits.append((display, canon))
+        result = tuple(hits)
+        _store(self._registers, text, result)
+        return result
+
+    def mem_bases(self, operands: str) -> tuple[MemBase, ...]:
+        cached = self._mem.get(operands)
+        if cached is not None:
+            return cached
+        bases: list[MemBase] = []
+        for segment, expr in _MEM_EXPR.findall(operands):
+            if segment:
+                continue
+            cleaned = expr.replace("#", "").replace("!", "")
+            hits = self.registers(cleaned)
+            if len(hits) != 1 or hits[0][1] == self.pc_reg:
+                continue
+            bases.append((hits[0][1], parse_offset(cleaned)))
+        result = tuple(bases)
+        _store(self._mem, operands, result)
+        return result
+
+    def operand(self, text: str) -> Operand | None:
+        cached = self._operands.get(text, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        result = self._parse_operand(text.strip())
+        _store(self._operands, text, result)
+        return result
+
+    def mem_operands(self, operands: str) -> tuple[Operand, ...]:
+        cached = self._mem_operands.get(operands)
+        if cached is not None:
+            return cached
+        parsed = (
+            None if segment else self._parse_mem(expr)
+            for segment, expr in _MEM_EXPR.findall(operands)
+        )
+        result = tuple(item for item in parsed if item is not None)
+        _store(self._mem_operands, operands, result)
+        return result
+
+    def _parse_operand(self, op: str) -> Operand | None:
+        if not op:
+            return None
+        if "[" in op:
+            match = _MEM_EXPR.search(op)
+            if not match or match.group(1):
+                return None
+            return self._parse_mem(match.group(2))
+        match = _BASE_OFFSET.match(op)
+        if match:
+            canon = self.reg_map.get(match.group(2).strip().lower())
+            disp = _parse_int(match.group(1) or "0")
+            if not canon or disp is None:
+                return None
+            return Operand(base=canon, disp=disp, indirect=True)
+        value = _parse_int(op[1:] if op.startswith("#") else op)
+        if value is None:
+            match = _LEADING_INT.match(op)
+            value = _parse_int(match.group(0)) if match else None
+        if value is not None:
+            return Operand(disp=value)
+        canon = self.reg_map.get(op.lower())
+        return Operand(base=canon) if canon else None
+
+    def _parse_mem(self, expr: str) -> Operand | None:
+        if ":" in expr:
+            return None
+        base: str | None = None
+        index: str | None = None
+        scale = 1
+        disp = 0
+        extend: str | None = None
+        for part in expr.replace("#", "").replace("!", "").split(","):
+            part = part.strip()
+            shift = _SHIFT.match(part)
+            if shift:
+                kind = shift.group(1).lower()
+                extend = kind if kind != "lsl" else None
+                scale = 1 << int(shift.group(2) or 0)
+                continue
+            for sign, term in _TERM.findall(part):
+                term = term.strip()
+                if not term:
+                    continue
+                if "*" in term:
+                    scaled = self._scaled_index(term)
+                    if scaled is None or sign == "-" or index is not None:
+                        return None
+                    index, scale = scaled
+                    continue
+                canon = self.reg_map.get(term.lower())
+                if canon is None:
+                    value = _parse_int(term)
+                    if value is None:
+                        return None
+                    disp += -value if sign == "-" else value
+                    continue
+                if sign == "-":
+                    return None
+                if base is None:
+                    base = canon
+                elif index is None:
+                    index = canon
+                else:
+                    return None
+        if base is None and index is None:
+            return None
+        if index is None:
+            scale = 1
+            extend = None
+        pc_relative = base is not None and base == self.pc_reg
+        return Operand(base, index, scale, disp, True, pc_relative, extend)
+
+    def _scaled_index(self, term: str) -> tuple[str, int] | None:
+        left, _, right = (piece.strip() for piece in term.partition("*"))
+        for name, factor in ((left, right), (right, left)):
+            canon = self.reg_map.get(name.lower())
+            if canon is None:
+                continue
+            value = _parse_int(factor)
+            return (canon, value) if value is not None else None
+        return None
+
+
+_ANALYZERS: dict[tuple[str, tuple[str, ...], str], OperandAnalyzer] = {}
+
+
+def operand_analyzer(arch: Any, reg_names: Iterable[str]) -> OperandAnalyzer:
+    pc_reg = getattr(arch, "pc_reg", "") or ""
+    gprs = tuple(getattr(arch, "gpr_names", None) or ())
+    key = (getattr(arch, "name", ""), gprs or tuple(reg_names), pc_reg)
+    analyzer = _ANALYZERS.get(key)
+    if analyzer is not None:
+        return analyzer
+    names = key[1] + tuple(
+        name for name in (pc_reg, getattr(arch, "sp_reg", "") or "") if name
+    )
+    reg_map = {name.lower(): name for name in names}
+    try:
+        reg_map.update(arch.register_aliases(dict.fromkeys(names, 0)))
+    except Exception:
+        pass
+    analyzer = OperandAnalyzer(reg_map, pc_reg)
+    if len(_ANALYZERS) >= MAX_ANALYZERS:
+        _ANALYZERS.clear()
+    _ANALYZERS[key] = analyzer
+    return analyzer
+
+
+def parse_offset(expr: str) -> int:
+    match = _OFFSET.search(expr)
+    if not match:
+        return 0
+    sign = -1 if match.group(1) == "-" else 1
+    try:
+        value = int(match.group(2), 0)
+    except ValueError:
+        return 0
+    return sign * value
+
+
+def _extend(value: int, kind: str) -> int:
+    bits = 32 if kind.endswith("w") else 64
+    value &= (1 << bits) - 1
+    if kind.startswith("s") and value >> (bits - 1):
+        value -= 1 << bits
+    return value
+
+
+def _parse_int(text: str) -> int | None:
+    try:
+        return int(text, 0)
+    except ValueError:
+        return None
+
+
+def _store(cache: dict, key: str, value: object) -> None:
+    if len(cache) >= MAX_CACHED_OPERANDS:
+        cache.clear()
+    cache[key] = value
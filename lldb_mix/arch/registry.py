@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import replace
 import importlib
 import pkgutil
-from typing import Callable
+from typing import Any, Callable
 
 from lldb_mix.arch.abi import abi_matches_arch, lookup_abi, select_abi
 from lldb_mix.arch.base import ArchProfile
@@ -11,11 +11,14 @@ from lldb_mix.arch.info import ArchInfo
 from lldb_mix.arch.match import allows_family, explicit_family, family_in_text
 from lldb_mix.arch.view import ArchView
 
+MAX_CACHED_ARCHES = 16
+
 _MATCHERS: list[tuple[ArchProfile, Callable[[ArchInfo], int]]] = []
 _PROFILES_LOADED = False
 
 
 def register_profile(profile: ArchProfile, matcher: Callable[[ArchInfo], int]) -> None:
+    profile.build_mnemonic_table()
     _MATCHERS.append((profile, matcher))
 
 
@@ -43,6 +46,61 @@ def detect_arch_info(info: ArchInfo, abi_override: str | None = None) -> ArchVie
     return ArchView(info=info, profile=profile)
 
 
+class ArchCache:
+    def __init__(self, max_entries: int = MAX_CACHED_ARCHES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._views: dict[tuple[int, int, str, str], ArchView] = {}
+
+    def get(self, target, frame, abi_override: str | None = None) -> ArchView:
+        key = _arch_key(target, frame, abi_override)
+        if key is None:
+            return detect_arch(target, frame, abi_override)
+        view = self._views.get(key)
+        if view is not None:
+            self.hits += 1
+            return replace(view, info=view.info.with_frame(frame))
+        self.misses += 1
+        view = detect_arch(target, frame, abi_override)
+        if not view.info.gpr_names:
+            return view
+        if len(self._views) >= self.max_entries:
+            self._views.clear()
+        self._views[key] = view
+        return view
+
+    def clear(self) -> None:
+        self._views.clear()
+
+
+def _arch_key(
+    target: Any, frame: Any, abi_override: str | None
+) -> tuple[int, int, str, str] | None:
+    if not target or not frame:
+        return None
+    try:
+        process = target.GetProcess()
+        if not process or not process.IsValid():
+            return None
+        return (
+            int(process.GetUniqueID()),
+            _thread_id(frame),
+            target.GetTriple() or "",
+            abi_override or "auto",
+        )
+    except Exception:
+        return None
+
+
+def _thread_id(frame: Any) -> int:
+    try:
+        thread = frame.GetThread()
+        return int(thread.GetThreadID()) if thread else 0
+    except Exception:
+        return 0
+
+
 def select_profile(info: ArchInfo) -> ArchProfile | None:
     _ensure_profiles_loaded()
     family = _explicit_family(info)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import re
+from collections.abc import Iterable
 
 from lldb_mix.arch.abi import RISCV_ABI, RISCV_X_ABI
 from lldb_mix.arch.base import (
@@ -8,10 +8,10 @@ from lldb_mix.arch.base import (
     BranchDecision,
     ReadPointer,
     parse_immediate,
-    parse_leading_int,
     resolve_reg_operand,
 )
 from lldb_mix.arch.info import ArchInfo
+from lldb_mix.arch.operands import operand_analyzer
 from lldb_mix.arch.registry import register_profile
 
 RISCV_ALIAS_TO_X = {
@@ -156,21 +156,17 @@ _RISCV_JUMPS = {
     "ret",
 }
 
-_BASE_OFFSET_RE = re.compile(
-    r"^(?P<offset>[-+]?0x[0-9a-fA-F]+|[-+]?\d+)?\((?P<reg>[^)]+)\)$"
-)
-
-
 class RiscvArch(ArchProfile):
-    def is_unconditional_branch(self, mnemonic: str) -> bool:
-        mnem = mnemonic.lower()
+    def known_mnemonics(self) -> Iterable[str]:
+        return (*super().known_mnemonics(), *_RISCV_BRANCHES, *_RISCV_JUMPS)
+
+    def _unconditional(self, mnem: str) -> bool:
         return mnem in {"b", "j", "jr", "c.j", "c.jr"}
 
-    def is_branch_like(self, mnemonic: str) -> bool:
-        mnem = mnemonic.lower()
+    def _branch_like(self, mnem: str) -> bool:
         if mnem in _RISCV_BRANCHES or mnem in _RISCV_JUMPS:
             return True
-        return super().is_branch_like(mnemonic)
+        return super()._branch_like(mnem)
 
     def resolve_flow_target(
         self,
@@ -186,44 +182,37 @@ class RiscvArch(ArchProfile):
             return None
 
         mnem = mnemonic.lower()
-        aliases = self.register_aliases(regs)
-
         if mnem == "ret":
-            return resolve_reg_operand("ra", regs, aliases)
+            return self.target_operand("ra", regs)
 
         parts = [p.strip() for p in operands.split(",")] if operands else []
         if mnem in _RISCV_BRANCHES:
             if mnem in {"beqz", "bnez", "c.beqz", "c.bnez"}:
                 if len(parts) < 2:
                     return None
-                return _parse_target_operand(parts[1], regs, aliases)
+                return self.target_operand(parts[1], regs)
             if len(parts) < 3:
                 return None
-            return _parse_target_operand(parts[2], regs, aliases)
+            return self.target_operand(parts[2], regs)
 
         if mnem in {"b", "j", "c.j"}:
             if not parts:
                 return None
-            return _parse_target_operand(parts[0], regs, aliases)
+            return self.target_operand(parts[0], regs)
 
         if mnem == "jal":
             if len(parts) == 1:
-                return _parse_target_operand(parts[0], regs, aliases)
-            return _parse_target_operand(parts[1], regs, aliases)
+                return self.target_operand(parts[0], regs)
+            return self.target_operand(parts[1], regs)
 
         if mnem in {"jalr", "jr", "c.jr", "c.jalr"}:
             if not parts:
                 return None
             if mnem in {"jr", "c.jr"}:
-                base = _parse_base_offset(parts[0], regs, aliases)
-                if base is not None:
-                    return base
-                return resolve_reg_operand(parts[0], regs, aliases)
+                return self._reg_target(parts[0], regs)
             if len(parts) == 1:
-                return resolve_reg_operand(parts[0], regs, aliases)
-            base = _parse_base_offset(parts[1], regs, aliases)
-            if base is None:
-                base = resolve_reg_operand(parts[1], regs, aliases)
+                return self._reg_target(parts[0], regs, allow_offset=False)
+            base = self._reg_target(parts[1], regs)
             if base is None:
                 return None
             offset = 0
@@ -235,7 +224,7 @@ class RiscvArch(ArchProfile):
 
         if not parts:
             return None
-        return _parse_target_operand(parts[0], regs, aliases)
+        return self.target_operand(parts[0], regs)
 
     def branch_decision(
         self,
@@ -321,19 +310,33 @@ class RiscvArch(ArchProfile):
                 aliases[reg] = alias
         return aliases
 
-    def mem_operand_targets(self, operands: str, regs: dict[str, int]) -> list[int]:
+    def mem_operand_targets(
+        self, operands: str, regs: dict[str, int], next_pc: int | None = None
+    ) -> list[int]:
         if not operands or not regs:
             return []
-        aliases = self.register_aliases(regs)
+        analyzer = operand_analyzer(self, regs)
         targets: list[int] = []
-        parts = [part.strip() for part in operands.split(",") if part.strip()]
-        for part in parts:
-            base = _parse_base_offset(part, regs, aliases)
-            if base is not None:
-                targets.append(base)
+        for part in operands.split(","):
+            operand = analyzer.operand(part)
+            if operand is None or not operand.indirect:
+                continue
+            addr = operand.evaluate(regs)
+            if addr is not None:
+                targets.append(addr)
         if targets:
             return targets
-        return super().mem_operand_targets(operands, regs)
+        return super().mem_operand_targets(operands, regs, next_pc)
+
+    def _reg_target(
+        self, op: str, regs: dict[str, int], allow_offset: bool = True
+    ) -> int | None:
+        operand = operand_analyzer(self, regs).operand(op)
+        if operand is None or operand.base is None:
+            return None
+        if operand.indirect and not allow_offset:
+            return None
+        return operand.evaluate(regs)
 
 
 RISCV32_X_ARCH = RiscvArch(
@@ -442,36 +445,6 @@ register_profile(RISCV64_ABI_ARCH, lambda info: _match_riscv(info, 64, True))
 register_profile(RISCV64_X_ARCH, lambda info: _match_riscv(info, 64, False))
 
 
-def _parse_target_operand(
-    op: str, regs: dict[str, int], aliases: dict[str, str]
-) -> int | None:
-    if not op:
-        return None
-    parsed = parse_immediate(op)
-    if parsed is None:
-        parsed = parse_leading_int(op)
-    if parsed is not None:
-        return parsed
-    return resolve_reg_operand(op, regs, aliases)
-
-
-def _parse_base_offset(
-    op: str, regs: dict[str, int], aliases: dict[str, str]
-) -> int | None:
-    match = _BASE_OFFSET_RE.match(op.strip())
-    if not match:
-        return None
-    reg_name = match.group("reg").strip()
-    base = resolve_reg_operand(reg_name, regs, aliases)
-    if base is None:
-        return None
-    offset_text = match.group("offset") or "0"
-    offset = parse_immediate(offset_text)
-    if offset is None:
-        return None
-    return base + offset
-
-
 def _riscv_rd(operands: str) -> str | None:
     parts = [p.strip() for p in operands.split(",") if p.strip()]
     if not parts:
@@ -6,6 +6,8 @@ from typing import Any
 from lldb_mix.arch.base import ArchProfile, BranchDecision, ReadPointer
 from lldb_mix.arch import abi as arch_abi
 from lldb_mix.arch.info import ArchInfo
+from lldb_mix.arch.mnemonics import PLAIN, MnemonicClass
+from lldb_mix.arch.operands import OperandAnalyzer, operand_analyzer
 from lldb_mix.core.regs import find_register_any
 
 
@@ -117,6 +119,11 @@ class ArchView:
             return self.profile.format_flags(value)
         return ""
 
+    def classify(self, mnemonic: str) -> MnemonicClass:
+        if self.profile and hasattr(self.profile, "classify"):
+            return self.profile.classify(mnemonic)
+        return PLAIN
+
     def is_conditional_branch(self, mnemonic: str) -> bool:
         if self.profile and hasattr(self.profile, "is_conditional_branch"):
             return self.profile.is_conditional_branch(mnemonic)
@@ -185,9 +192,14 @@ class ArchView:
             return self.profile.register_aliases(regs)
         return {}
 
-    def mem_operand_targets(self, operands: str, regs: dict[str, int]) -> list[int]:
+    def operand_analyzer(self, regs: dict[str, int]) -> OperandAnalyzer:
+        return operand_analyzer(self, regs)
+
+    def mem_operand_targets(
+        self, operands: str, regs: dict[str, int], next_pc: int | None = None
+    ) -> list[int]:
         if self.profile and hasattr(self.profile, "mem_operand_targets"):
-            return self.profile.mem_operand_targets(operands, regs)
+            return self.profile.mem_operand_targets(operands, regs, next_pc)
         return []
 
     def arg_reg(self, index: int) -> str | None:
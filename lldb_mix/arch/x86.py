@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from lldb_mix.arch.base import (
     ArchProfile,
     BranchDecision,
     ReadPointer,
-    parse_target_operand,
 )
 from lldb_mix.arch.info import ArchInfo
 from lldb_mix.arch.registry import register_profile
@@ -86,19 +87,28 @@ class X86Arch(ArchProfile):
                 out.append(" ")
         return "".join(out)
 
-    def is_conditional_branch(self, mnemonic: str) -> bool:
-        return mnemonic.lower() in _COND_MNEMONICS
+    def known_mnemonics(self) -> Iterable[str]:
+        return (
+            *super().known_mnemonics(),
+            *_COND_MNEMONICS,
+            *_LOOP_MNEMONICS,
+            *_JCXZ_MNEMONICS,
+            "jmp",
+            "jmpl", "calll", "retl",
+        )
+
+    def _conditional(self, mnem: str) -> bool:
+        return mnem in _COND_MNEMONICS
 
-    def is_unconditional_branch(self, mnemonic: str) -> bool:
-        return mnemonic.lower().startswith("jmp")
+    def _unconditional(self, mnem: str) -> bool:
+        return mnem.startswith("jmp")
 
-    def is_branch_like(self, mnemonic: str) -> bool:
-        mnem = mnemonic.lower()
+    def _branch_like(self, mnem: str) -> bool:
         if mnem.startswith("ret"):
             return True
         if mnem in _LOOP_MNEMONICS or mnem in _JCXZ_MNEMONICS:
             return True
-        return super().is_branch_like(mnemonic)
+        return super()._branch_like(mnem)
 
     def resolve_flow_target(
         self,
@@ -120,8 +130,7 @@ class X86Arch(ArchProfile):
             return read_pointer(sp, ptr_size)
         if not operands:
             return None
-        op = operands.split(",", 1)[0].strip()
-        return parse_target_operand(op, regs)
+        return self.target_operand(operands.split(",", 1)[0].strip(), regs)
 
     def branch_decision(
         self,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import shlex
 import struct
 
+from lldb_mix.commands.context import invalidate_reader
 from lldb_mix.commands.utils import emit_result
 from lldb_mix.arch.registry import detect_arch_from_frame
 from lldb_mix.core.disasm import read_instructions
@@ -161,6 +162,7 @@ def antidebug_callback_step2(frame, bp_loc, internal_dict):
             value ^= 0x800
         patch = struct.pack("<I", value)
         process.WriteMemory(oldp + 0x20, patch, error)
+        invalidate_reader()
     process.Continue()
     return 0
 
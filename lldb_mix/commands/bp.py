@@ -8,7 +8,7 @@ from lldb_mix.core.breakpoints import clear_breakpoints, collect_breakpoints
 from lldb_mix.core.session import Session
 from lldb_mix.core.state import SETTINGS
 from lldb_mix.deref import format_addr
-from lldb_mix.ui.style import colorize
+from lldb_mix.ui.style import colorize, span_style
 from lldb_mix.ui.table import Column, render_table
 from lldb_mix.ui.terminal import get_terminal_size
 from lldb_mix.ui.theme import get_theme
@@ -101,7 +101,8 @@ def _handle_list(debugger) -> list[str]:
         columns.append(Column("offset", "OFF", role="value", optional=True, priority=1))
 
     lines = [header]
-    lines.extend(render_table(rows, columns, term_width, _style))
+    style = span_style(theme, SETTINGS.enable_color)
+    lines.extend(render_table(rows, columns, term_width, style))
     return lines
 
 
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import shlex
+
+from lldb_mix.commands.utils import emit_result
+from lldb_mix.core.addressing import AddressResolver
+from lldb_mix.core.cfg import format_graph_dot, format_graph_text
+from lldb_mix.core.session import Session
+from lldb_mix.core.snapshot import capture_snapshot
+from lldb_mix.core.state import DECODES, GRAPHS, SETTINGS
+from lldb_mix.deref import format_addr
+from lldb_mix.ui.style import colorize
+from lldb_mix.ui.theme import get_theme
+
+
+def cmd_cfg(debugger, command, result, internal_dict) -> None:
+    try:
+        import lldb
+    except Exception:
+        print("[lldb-mix] cfg not available outside LLDB")
+        return
+
+    args = shlex.split(command)
+    if args and args[0] in ("-h", "--help", "help"):
+        emit_result(result, _usage(), lldb)
+        return
+
+    dot, token, error = _parse_args(args)
+    if error:
+        emit_result(result, f"[lldb-mix] {error}\n{_usage()}", lldb)
+        return
+
+    session = Session(debugger)
+    snapshot = capture_snapshot(session)
+    if not snapshot:
+        emit_result(result, "[lldb-mix] cfg (no target)", lldb)
+        return
+
+    target = session.target()
+    if not target:
+        emit_result(result, "[lldb-mix] target unavailable", lldb)
+        return
+
+    resolver = AddressResolver(snapshot.regs, snapshot.arch, session.frame())
+    addr = resolver.resolve(token)
+    if addr is None:
+        emit_result(result, "[lldb-mix] invalid address or expression", lldb)
+        return
+
+    DECODES.bind(session.process(), snapshot.maps)
+    graph = GRAPHS.get(DECODES, target, addr, snapshot.arch)
+    if graph is None:
+        emit_result(result, "[lldb-mix] function unavailable", lldb)
+        return
+
+    ptr_size = snapshot.arch.ptr_size or 8
+    if dot:
+        emit_result(result, "\n".join(format_graph_dot(graph, ptr_size)), lldb)
+        return
+
+    theme = get_theme(SETTINGS.theme)
+    header = (
+        f"[cfg] {graph.name} {format_addr(graph.start, ptr_size)}"
+        f"-{format_addr(graph.end, ptr_size)}"
+        f" blocks={len(graph.blocks)} edges={len(graph.edges)}"
+    )
+    lines = [colorize(header, "title", theme, SETTINGS.enable_color)]
+    lines.extend(format_graph_text(graph, ptr_size))
+    emit_result(result, "\n".join(lines), lldb)
+
+
+def _parse_args(args: list[str]) -> tuple[bool, str | None, str | None]:
+    dot = False
+    token = None
+    for arg in args:
+        if arg in ("-d", "--dot"):
+            dot = True
+            continue
+        if token is not None:
+            return dot, None, "too many arguments"
+        token = arg
+    return dot, token, None
+
+
+def _usage() -> str:
+    return "[lldb-mix] usage: cfg [-d|--dot] [<addr|reg|pc>]"
@@ -15,7 +15,7 @@ from lldb_mix.core.lldb_formats import sync_formats
 from lldb_mix.core.state import SETTINGS
 from lldb_mix.core.stop_hooks import ensure_stop_hook, remove_stop_hook
 from lldb_mix.core.stop_output import apply_quiet, capture_defaults, restore_defaults
-from lldb_mix.ui.style import colorize
+from lldb_mix.ui.style import colorize, span_style
 from lldb_mix.ui.table import Column, render_table
 from lldb_mix.ui.terminal import get_terminal_size
 from lldb_mix.ui.theme import get_theme
@@ -83,7 +83,8 @@ def _handle_list() -> str:
         Column("value", "VALUE", role="value", optional=True, truncate="right"),
     ]
     lines = [header]
-    lines.extend(render_table(rows, columns, term_width, _style))
+    style = span_style(theme, SETTINGS.enable_color)
+    lines.extend(render_table(rows, columns, term_width, style))
     return "\n".join(lines)
 
 
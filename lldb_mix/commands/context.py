@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 from lldb_mix.context.manager import ContextManager
-from lldb_mix.core.memory import ProcessMemoryReader
+from lldb_mix.core.history import HistoryWatch
+from lldb_mix.core.memory import CachedMemoryReader, process_stop_key
+from lldb_mix.core.profile import format_profile
 from lldb_mix.core.session import Session
 from lldb_mix.core.snapshot import capture_snapshot
-from lldb_mix.core.state import SETTINGS
-from lldb_mix.core.symbols import TargetSymbolResolver
+from lldb_mix.core.state import PROFILER, READERS, SETTINGS, SYMBOLS
+from lldb_mix.ui.style import colorize, span_style
 from lldb_mix.ui.theme import get_theme
 
 
 _MANAGER: ContextManager | None = None
+_READER: CachedMemoryReader | None = None
+_HISTORY = HistoryWatch()
 
 
 def _manager() -> ContextManager:
@@ -21,19 +25,80 @@ def _manager() -> ContextManager:
     return _MANAGER
 
 
-def render_context(debugger) -> str:
+def _reader(process) -> CachedMemoryReader:
+    global _READER
+    key = process_stop_key(process)
+    if _READER is None or _READER.stop_key() != key or key is None:
+        _READER = CachedMemoryReader(READERS.get(process, SETTINGS.memory_backend))
+    else:
+        _READER.invalidate()
+    _READER.reset_stats()
+    return _READER
+
+
+def invalidate_reader() -> None:
+    if _READER is not None:
+        _READER.invalidate()
+    if _MANAGER is not None:
+        _MANAGER.deref_cache.clear()
+
+
+def cache_stats() -> dict[str, tuple[int, int]]:
+    stats: dict[str, tuple[int, int]] = {}
+    if _READER is not None:
+        stats["memory"] = (_READER.hits, _READER.misses)
+    if _MANAGER is not None:
+        stats["deref"] = (_MANAGER.deref_cache.hits, _MANAGER.deref_cache.misses)
+    return stats
+
+
+def render_context(debugger, profile: bool = False) -> str:
     session = Session(debugger)
     snapshot = capture_snapshot(session)
     if not snapshot:
         return "[lldb-mix] context stub (no target)"
 
     process = session.process()
-    reader = ProcessMemoryReader(process) if process else None
+    reader = _reader(process) if process else None
     target = session.target()
-    resolver = TargetSymbolResolver(target) if target else None
+    resolver = SYMBOLS.bind(target) if target else None
+
+    manager = _manager()
+    lines = manager.render(snapshot, reader, resolver, target, process, profile)
+    quiet = False
+    if SETTINGS.render_mode == "diff" and not profile:
+        history = _command_output(debugger, "command history")
+        quiet = _HISTORY.quiet_step(history, process_stop_key(process))
+    else:
+        _HISTORY.reset()
+    if profile:
+        lines.append("")
+        lines.extend(_profile_lines(manager))
+    return manager.frame(lines, full=not quiet)
+
+
+def _command_output(debugger, command: str) -> str:
+    try:
+        import lldb
+
+        res = lldb.SBCommandReturnObject()
+        debugger.GetCommandInterpreter().HandleCommand(command, res)
+    except Exception:
+        return ""
+    return res.GetOutput() or ""
+
+
+def _profile_lines(manager: ContextManager) -> list[str]:
+    def _style(text: str, role: str) -> str:
+        return colorize(text, role, manager.theme, SETTINGS.enable_color)
 
-    lines = _manager().render(snapshot, reader, resolver, target, process)
-    return "\n".join(lines)
+    lines = [_style("[profile]", "title")]
+    lines.extend(format_profile(
+        PROFILER.last,
+        manager.last_size[0],
+        span_style(manager.theme, SETTINGS.enable_color),
+    ))
+    return lines
 
 
 def render_context_if_enabled(debugger) -> str | None:
@@ -62,8 +127,10 @@ def cmd_context(debugger, command, result, internal_dict) -> None:
         print("[lldb-mix] context not available outside LLDB")
         return
 
-    if command.strip():
-        message = "[lldb-mix] context takes no arguments (use conf)"
+    args = command.split()
+    profile = args == ["--profile"]
+    if args and not profile:
+        message = "[lldb-mix] usage: context [--profile] (use conf for settings)"
         try:
             result.PutCString(message)
             result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
@@ -71,7 +138,7 @@ def cmd_context(debugger, command, result, internal_dict) -> None:
             print(message)
         return
 
-    message = render_context(debugger)
+    message = render_context(debugger, profile)
     try:
         result.PutCString(message)
         result.SetStatus(lldb.eReturnStatusSuccessFinishResult)
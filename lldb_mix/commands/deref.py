@@ -5,17 +5,15 @@ import shlex
 
 from lldb_mix.commands.utils import emit_result
 from lldb_mix.core.addressing import AddressResolver, parse_int
-from lldb_mix.core.memory import ProcessMemoryReader
 from lldb_mix.core.modules import format_module_offset
 from lldb_mix.core.settings import Settings
 from lldb_mix.core.session import Session
 from lldb_mix.core.snapshot import capture_snapshot
-from lldb_mix.core.state import SETTINGS
-from lldb_mix.core.symbols import TargetSymbolResolver
+from lldb_mix.core.state import READERS, SETTINGS, SYMBOLS
 from lldb_mix.deref import (
-    classify_token,
-    deref_chain,
+    deref_nodes,
     find_region,
+    format_node,
     format_addr,
     format_region,
     format_symbol,
@@ -67,17 +65,17 @@ def cmd_deref(debugger, command, result, internal_dict) -> None:
         return
 
     settings = _settings_with_depth(parsed.depth)
-    reader = ProcessMemoryReader(process)
-    resolver = TargetSymbolResolver(target)
+    reader = READERS.get(process, SETTINGS.memory_backend)
+    resolver = SYMBOLS.bind(target)
     ptr_size = snapshot.arch.ptr_size or 8
-    chain = deref_chain(
-        addr,
+    chain = deref_nodes(
+        [addr],
         reader,
         snapshot.maps,
         resolver,
         settings,
         ptr_size,
-    )
+    )[0]
 
     theme = get_theme(SETTINGS.theme)
 
@@ -105,10 +103,9 @@ def cmd_deref(debugger, command, result, internal_dict) -> None:
     if chain:
         label = _style("chain:", "label")
         parts: list[str] = []
-        for token in chain:
-            kind = classify_token(token)
-            role = _token_role(kind)
-            parts.append(_style(token, role))
+        for node in chain:
+            role = _token_role(node.kind)
+            parts.append(_style(format_node(node, ptr_size), role))
         lines.append(f"{label} {' -> '.join(parts)}")
 
     emit_result(result, "\n".join(lines), lldb)
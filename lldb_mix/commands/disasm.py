@@ -7,7 +7,7 @@ from lldb_mix.core.addressing import AddressResolver, parse_int
 from lldb_mix.core.disasm import read_instructions
 from lldb_mix.core.session import Session
 from lldb_mix.core.snapshot import capture_snapshot
-from lldb_mix.core.state import SETTINGS
+from lldb_mix.core.state import DECODES, SETTINGS
 from lldb_mix.deref import format_addr
 from lldb_mix.ui.style import colorize
 from lldb_mix.ui.theme import get_theme
@@ -31,8 +31,15 @@ def cmd_u(debugger, command, result, internal_dict) -> None:
         emit_result(result, "[lldb-mix] u (no target)", lldb)
         return
 
+    whole_function = False
+    if args and args[0] in ("-f", "--function"):
+        whole_function = True
+        args = args[1:]
+
     resolver = AddressResolver(snapshot.regs, snapshot.arch, session.frame())
     addr, count, error = _parse_args(args, resolver)
+    if whole_function and len(args) > 1:
+        error = "too many arguments"
     if error:
         emit_result(result, f"[lldb-mix] {error}\n{_usage()}", lldb)
         return
@@ -47,14 +54,28 @@ def cmd_u(debugger, command, result, internal_dict) -> None:
         return
 
     flavor = snapshot.arch.disasm_flavor()
-    insts = read_instructions(target, addr, count, flavor=flavor)
+    DECODES.bind(session.process(), snapshot.maps)
+    ptr_size = snapshot.arch.ptr_size or 8
+    marker = 0
+    if whole_function:
+        disasm = DECODES.function(target, addr, flavor)
+        if disasm is None:
+            emit_result(result, "[lldb-mix] function unavailable", lldb)
+            return
+        insts = disasm.slice(0, len(disasm))
+        marker = disasm.index_of(addr)
+        header = (
+            f"[u] {disasm.name} {format_addr(disasm.start, ptr_size)}"
+            f"-{format_addr(disasm.end, ptr_size)} count={len(insts)}"
+        )
+    else:
+        insts = read_instructions(target, addr, count, flavor, DECODES)
+        header = f"[u] {format_addr(addr, ptr_size)} count={count}"
     if not insts:
         emit_result(result, "[lldb-mix] disassembly unavailable", lldb)
         return
 
     theme = get_theme(SETTINGS.theme)
-    ptr_size = snapshot.arch.ptr_size or 8
-    header = f"[u] {format_addr(addr, ptr_size)} count={count}"
     header = colorize(header, "title", theme, SETTINGS.enable_color)
 
     def _style(text: str, role: str) -> str:
@@ -67,6 +88,7 @@ def cmd_u(debugger, command, result, internal_dict) -> None:
             ptr_size,
             SETTINGS.show_opcodes,
             _style,
+            marker,
         )
     )
 
@@ -103,7 +125,7 @@ def _default_count() -> int:
 
 
 def _usage() -> str:
-    return "[lldb-mix] usage: u [<addr|reg|pc>] [count]"
+    return "[lldb-mix] usage: u [<addr|reg|pc>] [count] | u -f [<addr|reg|pc>]"
 
 
 def _format_instructions(
@@ -111,6 +133,7 @@ def _format_instructions(
     ptr_size: int,
     show_opcodes: bool,
     style,
+    marker: int | None = 0,
 ) -> list[str]:
     if style is None:
         style = _passthrough_style
@@ -124,8 +147,8 @@ def _format_instructions(
 
     lines: list[str] = []
     for idx, inst in enumerate(insts):
-        prefix = "=>" if idx == 0 else "  "
-        prefix_role = "pc_marker" if idx == 0 else "muted"
+        prefix = "=>" if idx == marker else "  "
+        prefix_role = "pc_marker" if idx == marker else "muted"
         prefix_colored = style(prefix, prefix_role)
         addr_colored = style(format_addr(inst.address, ptr_size), "addr")
         bytes_text = ""
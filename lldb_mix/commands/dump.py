@@ -2,12 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from lldb_mix.core.memory import ProcessMemoryReader
 from lldb_mix.commands.utils import emit_result
 from lldb_mix.core.addressing import AddressResolver, parse_int
 from lldb_mix.core.session import Session
 from lldb_mix.core.snapshot import capture_snapshot
-from lldb_mix.core.state import SETTINGS
+from lldb_mix.core.state import READERS, SETTINGS
 from lldb_mix.deref import format_addr
 from lldb_mix.ui.hexdump import hexdump, hexdump_words
 from lldb_mix.ui.style import colorize
@@ -65,7 +64,7 @@ def cmd_dump(debugger, command, result, internal_dict) -> None:
         emit_result(result, "[lldb-mix] process unavailable", lldb)
         return
 
-    reader = ProcessMemoryReader(process)
+    reader = READERS.get(process, SETTINGS.memory_backend)
     data = reader.read(parsed.addr, parsed.length)
     theme = get_theme(SETTINGS.theme)
     ptr_size = snapshot.arch.ptr_size or 8
@@ -209,7 +208,7 @@ def _cmd_word_dump(
         emit_result(result, "[lldb-mix] process unavailable", lldb)
         return
 
-    reader = ProcessMemoryReader(process)
+    reader = READERS.get(process, SETTINGS.memory_backend)
     data = reader.read(parsed.addr, parsed.length)
     theme = get_theme(SETTINGS.theme)
     ptr_size = snapshot.arch.ptr_size or 8
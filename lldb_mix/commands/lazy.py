@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+from lldb_mix.commands.registry import COMMANDS, CommandSpec
+from lldb_mix.ui.console import err
+
+Handler = Callable[[Any, str, Any, dict], None]
+
+_HANDLERS: dict[str, Handler] = {}
+
+
+def resolve_handler(spec: CommandSpec) -> Handler:
+    handler = _HANDLERS.get(spec.handler)
+    if handler is None:
+        module = importlib.import_module(spec.module)
+        handler = getattr(module, spec.handler.rsplit(".", 1)[1])
+        _HANDLERS[spec.handler] = handler
+    return handler
+
+
+def _trampoline(spec: CommandSpec) -> Handler:
+    def run(debugger, command, result, internal_dict) -> None:
+        try:
+            handler = resolve_handler(spec)
+        except Exception as exc:
+            message = f"failed to import {spec.module}: {exc}"
+            try:
+                result.SetError(f"[lldb-mix] {message}")
+            except Exception:
+                err(message)
+            return
+        handler(debugger, command, result, internal_dict)
+
+    run.__name__ = spec.trampoline.rsplit(".", 1)[1]
+    run.__doc__ = spec.help
+    return run
+
+
+for _spec in COMMANDS:
+    globals()[_spec.trampoline.rsplit(".", 1)[1]] = _trampoline(_spec)
@@ -5,7 +5,7 @@ import shlex
 from lldb_mix.commands.registry import COMMANDS
 from lldb_mix.commands.utils import emit_result
 from lldb_mix.core.state import SETTINGS
-from lldb_mix.ui.style import colorize
+from lldb_mix.ui.style import colorize, span_style
 from lldb_mix.ui.table import Column, render_table
 from lldb_mix.ui.terminal import get_terminal_size
 from lldb_mix.ui.theme import get_theme
@@ -69,7 +69,8 @@ def cmd_mixhelp(debugger, command, result, internal_dict) -> None:
         )
 
     lines = [header]
-    lines.extend(render_table(rows, columns, term_width, _style))
+    style = span_style(theme, SETTINGS.enable_color)
+    lines.extend(render_table(rows, columns, term_width, style))
     emit_result(result, "\n".join(lines), lldb)
 
 
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import shlex
+
+from lldb_mix.commands.context import cache_stats
+from lldb_mix.commands.utils import emit_result
+from lldb_mix.core.memory import READ_COUNTERS
+from lldb_mix.core.profile import format_profile
+from lldb_mix.core.state import (
+    ARCHES,
+    CODE_BYTES,
+    DECODES,
+    PROFILER,
+    REGIONS,
+    SETTINGS,
+    SYMBOLS,
+)
+from lldb_mix.ui.style import colorize, span_style
+from lldb_mix.ui.table import Column, render_table
+from lldb_mix.ui.terminal import get_terminal_size
+from lldb_mix.ui.theme import get_theme
+
+
+def cmd_mixstats(debugger, command, result, internal_dict) -> None:
+    try:
+        import lldb
+    except Exception:
+        print("[lldb-mix] mixstats not available outside LLDB")
+        return
+
+    args = shlex.split(command)
+    if args and args[0] in ("-h", "--help", "help"):
+        emit_result(result, _usage(), lldb)
+        return
+    if len(args) > 1:
+        emit_result(result, _usage(), lldb)
+        return
+
+    sub = args[0] if args else "show"
+    if sub == "on":
+        PROFILER.enabled = True
+        emit_result(result, "[lldb-mix] context profiling on", lldb)
+        return
+    if sub == "off":
+        PROFILER.enabled = False
+        emit_result(result, "[lldb-mix] context profiling off", lldb)
+        return
+    if sub == "reset":
+        PROFILER.reset()
+        READ_COUNTERS.reads = 0
+        READ_COUNTERS.bytes = 0
+        emit_result(result, "[lldb-mix] stats reset", lldb)
+        return
+    if sub != "show":
+        emit_result(result, f"[lldb-mix] unknown mixstats subcommand: {sub}", lldb)
+        return
+    emit_result(result, "\n".join(_render_stats()), lldb)
+
+
+def _render_stats() -> list[str]:
+    theme = get_theme(SETTINGS.theme)
+    term_width, _ = get_terminal_size()
+
+    def _style(text: str, role: str) -> str:
+        return colorize(text, role, theme, SETTINGS.enable_color)
+
+    state = "on" if PROFILER.enabled else "off"
+    header = (
+        f"[lldb-mix] profiling {state}, renders={PROFILER.renders}, "
+        f"averaged over last {PROFILER.window}"
+    )
+    lines = [_style(header, "title")]
+    averages = PROFILER.averages()
+    if averages:
+        style = span_style(theme, SETTINGS.enable_color)
+        lines.extend(format_profile(averages, term_width, style))
+    else:
+        lines.append(_style("(no profiled renders; use mixstats on)", "muted"))
+
+    rows = [
+        {"key": "memory reads (total)", "value": str(READ_COUNTERS.reads)},
+        {"key": "bytes read (total)", "value": str(READ_COUNTERS.bytes)},
+    ]
+    for name, (hits, misses) in cache_stats().items():
+        rows.append(_cache_row(f"{name} cache (last render)", hits, misses))
+    rows.append(
+        _cache_row("instruction cache (last command)", DECODES.hits, DECODES.misses)
+    )
+    totals = {
+        "arch": (ARCHES.hits, ARCHES.misses),
+        "symbol": (SYMBOLS.hits, SYMBOLS.misses),
+    }
+    for name, (hits, misses) in totals.items():
+        rows.append(_cache_row(f"{name} cache (total)", hits, misses))
+    rows.append(
+        {
+            "key": "code bytes (total)",
+            "value": f"hits={CODE_BYTES.hits} fallbacks={CODE_BYTES.fallbacks}",
+        }
+    )
+    rows.append({"key": "region reads (total)", "value": str(REGIONS.reads)})
+    columns = [
+        Column("key", "COUNTER", role="label"),
+        Column("value", "VALUE", role="value"),
+    ]
+    lines.append("")
+    style = span_style(theme, SETTINGS.enable_color)
+    lines.extend(render_table(rows, columns, term_width, style))
+    return lines
+
+
+def _cache_row(key: str, hits: int, misses: int) -> dict[str, str]:
+    return {"key": key, "value": f"hits={hits} misses={misses}"}
+
+
+def _usage() -> str:
+    return "[lldb-mix] usage: mixstats [on|off|reset]"
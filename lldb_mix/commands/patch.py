@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import shlex
 
-from lldb_mix.commands.context import render_context_if_enabled
+from lldb_mix.commands.context import invalidate_reader, render_context_if_enabled
 from lldb_mix.commands.utils import emit_result
 from lldb_mix.core.addressing import AddressResolver, parse_int
 from lldb_mix.core.patches import format_bytes, parse_hex_bytes
@@ -10,8 +10,8 @@ from lldb_mix.core.session import Session
 from lldb_mix.core.snapshot import capture_snapshot
 from lldb_mix.core.state import PATCHES, SETTINGS
 from lldb_mix.deref import format_addr
-from lldb_mix.ui.style import colorize
-from lldb_mix.ui.table import Column, render_table
+from lldb_mix.ui.style import span_style
+from lldb_mix.ui.table import Column, StyleFn, render_table
 from lldb_mix.ui.terminal import get_terminal_size
 from lldb_mix.ui.theme import get_theme
 
@@ -40,10 +40,8 @@ def cmd_patch(debugger, command, result, internal_dict) -> None:
         theme = get_theme(SETTINGS.theme)
         term_width, _ = get_terminal_size()
 
-        def _style(text: str, role: str) -> str:
-            return colorize(text, role, theme, SETTINGS.enable_color)
-
-        emit_result(result, "\n".join(_list_patches(ptr_size, term_width, _style)), lldb)
+        style = span_style(theme, SETTINGS.enable_color)
+        emit_result(result, "\n".join(_list_patches(ptr_size, term_width, style)), lldb)
         return
 
     process = session.process()
@@ -68,6 +66,7 @@ def cmd_patch(debugger, command, result, internal_dict) -> None:
             emit_result(result, "[lldb-mix] patch restore failed", lldb)
             return
         PATCHES.remove(addr)
+        invalidate_reader()
         message = (
             f"[lldb-mix] patch restored {format_addr(addr, ptr_size)} len={entry.size}"
         )
@@ -100,6 +99,7 @@ def cmd_patch(debugger, command, result, internal_dict) -> None:
         PATCHES.remove(addr)
         emit_result(result, "[lldb-mix] patch write failed", lldb)
         return
+    invalidate_reader()
 
     summary = (
         f"[lldb-mix] patch {subcmd} {format_addr(addr, ptr_size)} len={len(payload)}"
@@ -175,10 +175,10 @@ def _write_memory(process, addr: int, data: bytes, lldb_module) -> bool:
     return written == len(data)
 
 
-def _list_patches(ptr_size: int, term_width: int, style) -> list[str]:
+def _list_patches(ptr_size: int, term_width: int, style: StyleFn) -> list[str]:
     entries = PATCHES.list()
     if not entries:
-        return [style("[lldb-mix] patches: (none)", "muted")]
+        return [style("[lldb-mix] patches: (none)", "muted").render()]
 
     rows = []
     for entry in entries:
@@ -195,7 +195,7 @@ def _list_patches(ptr_size: int, term_width: int, style) -> list[str]:
         Column("len", "LEN", role="value", align="right"),
         Column("bytes", "BYTES", role="byte", optional=True, truncate="right"),
     ]
-    lines = [style("[lldb-mix] patches:", "title")]
+    lines = [style("[lldb-mix] patches:", "title").render()]
     lines.extend(render_table(rows, columns, term_width, style))
     return lines
 
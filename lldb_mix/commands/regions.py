@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from lldb_mix.commands.utils import emit_result, module_fullpath
-from lldb_mix.core.memory import read_memory_regions, regions_unavailable_message
+from lldb_mix.core.memory import regions_unavailable_message
 from lldb_mix.core.session import Session
-from lldb_mix.core.state import SETTINGS
+from lldb_mix.core.state import REGIONS, SETTINGS
 from lldb_mix.deref import format_addr
-from lldb_mix.ui.style import colorize
-from lldb_mix.ui.table import Column, render_table
+from lldb_mix.ui.style import span_style
+from lldb_mix.ui.table import Column, StyleFn, render_table
 from lldb_mix.ui.terminal import get_terminal_size
 from lldb_mix.ui.theme import get_theme
 
@@ -17,7 +17,7 @@ def format_regions_table(
     target,
     lldb_module,
     term_width: int,
-    style,
+    style: StyleFn,
 ) -> list[str]:
     rows = []
     max_name_len = len("NAME")
@@ -90,6 +90,13 @@ def cmd_regions(debugger, command, result, internal_dict) -> None:
     if args and args[0] in ("-h", "--help", "help"):
         emit_result(result, _usage(), lldb)
         return
+    refresh = False
+    for arg in args:
+        if arg in ("-r", "--refresh"):
+            refresh = True
+            continue
+        emit_result(result, f"[lldb-mix] unknown argument: {arg}\n{_usage()}", lldb)
+        return
 
     session = Session(debugger)
     process = session.process()
@@ -98,7 +105,7 @@ def cmd_regions(debugger, command, result, internal_dict) -> None:
         emit_result(result, "[lldb-mix] process unavailable", lldb)
         return
 
-    regions = read_memory_regions(process)
+    regions = REGIONS.get(process, reuse=SETTINGS.region_cache, refresh=refresh)
     if not regions:
         emit_result(result, regions_unavailable_message(process), lldb)
         return
@@ -107,17 +114,17 @@ def cmd_regions(debugger, command, result, internal_dict) -> None:
     theme = get_theme(SETTINGS.theme)
     term_width, _ = get_terminal_size()
 
-    def _style(text: str, role: str) -> str:
-        return colorize(text, role, theme, SETTINGS.enable_color)
-
-    header = _style(f"[regions] {len(regions)} regions", "title")
+    style = span_style(theme, SETTINGS.enable_color)
+    header = style(f"[regions] {len(regions)} regions", "title").render()
     lines = [header]
-    lines.extend(format_regions_table(regions, ptr_size, target, lldb, term_width, _style))
+    lines.extend(
+        format_regions_table(regions, ptr_size, target, lldb, term_width, style)
+    )
     emit_result(result, "\n".join(lines), lldb)
 
 
 def _usage() -> str:
-    return "[lldb-mix] usage: regions"
+    return "[lldb-mix] usage: regions [-r|--refresh]"
 
 
 def _module_path(target, addr: int, lldb_module) -> str:
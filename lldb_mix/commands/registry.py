@@ -4,6 +4,8 @@ from dataclasses import dataclass
 
 from lldb_mix.ui.console import err
 
+LAZY_MODULE = "lldb_mix.commands.lazy"
+
 
 @dataclass(frozen=True)
 class AliasSpec:
@@ -22,6 +24,10 @@ class CommandSpec:
     def module(self) -> str:
         return self.handler.rsplit(".", 1)[0]
 
+    @property
+    def trampoline(self) -> str:
+        return f"{LAZY_MODULE}.cmd_{self.name}"
+
 
 COMMANDS: tuple[CommandSpec, ...] = (
     CommandSpec(
@@ -65,6 +71,11 @@ COMMANDS: tuple[CommandSpec, ...] = (
         handler="lldb_mix.commands.disasm.cmd_u",
         help="Disassemble around an address.",
     ),
+    CommandSpec(
+        name="cfg",
+        handler="lldb_mix.commands.cfg.cmd_cfg",
+        help="Show the control-flow graph of a function.",
+    ),
     CommandSpec(
         name="findmem",
         handler="lldb_mix.commands.search.cmd_findmem",
@@ -136,6 +147,11 @@ COMMANDS: tuple[CommandSpec, ...] = (
         handler="lldb_mix.commands.deref.cmd_deref",
         help="Follow pointer chain for an address.",
     ),
+    CommandSpec(
+        name="mixstats",
+        handler="lldb_mix.commands.mixstats.cmd_mixstats",
+        help="Show per-pane render timing and cache counters.",
+    ),
     CommandSpec(
         name="mixhelp",
         handler="lldb_mix.commands.mixhelp.cmd_mixhelp",
@@ -145,46 +161,41 @@ COMMANDS: tuple[CommandSpec, ...] = (
 
 
 def register_commands(debugger) -> None:
-    loaded = _import_command_modules(debugger)
+    if not _import_module(debugger, LAZY_MODULE):
+        return
     for spec in COMMANDS:
-        if spec.module not in loaded:
-            continue
         _register_command(debugger, _command_add(spec))
         for alias in spec.aliases:
             _register_command(debugger, _command_alias(alias, spec.name))
 
 
-def _import_command_modules(debugger) -> set[str]:
+def _import_module(debugger, module: str) -> bool:
     try:
         import lldb
     except Exception as exc:
         err(f"failed to import lldb for command imports: {exc}")
-        return set()
-
-    loaded: set[str] = set()
-    modules = {spec.module for spec in COMMANDS}
-    for module in sorted(modules):
-        res = lldb.SBCommandReturnObject()
-        debugger.GetCommandInterpreter().HandleCommand(
-            f"command script import {module}",
-            res,
-        )
-        if res.Succeeded():
-            loaded.add(module)
-            continue
-        error = res.GetError() or res.GetOutput() or ""
-        message = error.strip() or "unknown error"
-        err(f"failed to import {module}: {message}")
-    return loaded
+        return False
+
+    res = lldb.SBCommandReturnObject()
+    debugger.GetCommandInterpreter().HandleCommand(
+        f"command script import {module}",
+        res,
+    )
+    if res.Succeeded():
+        return True
+    error = res.GetError() or res.GetOutput() or ""
+    message = error.strip() or "unknown error"
+    err(f"failed to import {module}: {message}")
+    return False
 
 
 def _command_add(spec: CommandSpec) -> str:
     help_text = _escape_help(spec.help)
     if help_text:
         return (
-            f'command script add -h "{help_text}" -f {spec.handler} {spec.name}'
+            f'command script add -h "{help_text}" -f {spec.trampoline} {spec.name}'
         )
-    return f"command script add -f {spec.handler} {spec.name}"
+    return f"command script add -f {spec.trampoline} {spec.name}"
 
 
 def _command_alias(alias: AliasSpec, target: str) -> str:
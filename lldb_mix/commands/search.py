@@ -5,16 +5,12 @@ import shlex
 
 from lldb_mix.commands.utils import emit_result, module_fullpath
 from lldb_mix.core.addressing import parse_int
-from lldb_mix.core.memory import (
-    ProcessMemoryReader,
-    read_memory_regions,
-    regions_unavailable_message,
-)
+from lldb_mix.core.memory import regions_unavailable_message
 from lldb_mix.core.session import Session
-from lldb_mix.core.state import SETTINGS
+from lldb_mix.core.state import READERS, REGIONS, SETTINGS
 from lldb_mix.deref import format_addr
-from lldb_mix.ui.style import colorize
-from lldb_mix.ui.table import Column, render_table
+from lldb_mix.ui.style import colorize, span_style
+from lldb_mix.ui.table import Column, StyleFn, render_table
 from lldb_mix.ui.terminal import get_terminal_size
 from lldb_mix.ui.theme import get_theme
 
@@ -46,12 +42,12 @@ def cmd_findmem(debugger, command, result, internal_dict) -> None:
         emit_result(result, "[lldb-mix] process unavailable", lldb)
         return
 
-    regions = read_memory_regions(process)
+    regions = REGIONS.get(process, reuse=SETTINGS.region_cache)
     if not regions:
         emit_result(result, regions_unavailable_message(process), lldb)
         return
 
-    reader = ProcessMemoryReader(process)
+    reader = READERS.get(process, SETTINGS.memory_backend)
     ptr_size = target.GetAddressByteSize() or 8
     theme = get_theme(SETTINGS.theme)
     term_width, _ = get_terminal_size()
@@ -59,6 +55,8 @@ def cmd_findmem(debugger, command, result, internal_dict) -> None:
     def _style(text: str, role: str) -> str:
         return colorize(text, role, theme, SETTINGS.enable_color)
 
+    _span = span_style(theme, SETTINGS.enable_color)
+
     header = f"[findmem] {parsed.kind} len={len(parsed.pattern)}"
     if parsed.count > 0:
         header += f" count={parsed.count}"
@@ -101,7 +99,7 @@ def cmd_findmem(debugger, command, result, internal_dict) -> None:
                         if rows:
                             lines.extend(
                                 _format_hit_table(
-                                    rows, has_name, has_path, term_width, _style
+                                    rows, has_name, has_path, term_width, _span
                                 )
                             )
                         else:
@@ -122,7 +120,7 @@ def cmd_findmem(debugger, command, result, internal_dict) -> None:
         return
 
     lines.extend(scan_lines)
-    lines.extend(_format_hit_table(rows, has_name, has_path, term_width, _style))
+    lines.extend(_format_hit_table(rows, has_name, has_path, term_width, _span))
     emit_result(result, "\n".join(lines), lldb)
 
 
@@ -252,7 +250,7 @@ def _format_hit_table(
     has_name: bool,
     has_path: bool,
     term_width: int,
-    style,
+    style: StyleFn,
 ) -> list[str]:
     columns = [
         Column("addr", "ADDR", role="addr"),
@@ -15,7 +15,7 @@ from lldb_mix.core.session_store import (
     save_session,
 )
 from lldb_mix.core.state import SETTINGS, WATCHLIST
-from lldb_mix.ui.style import colorize
+from lldb_mix.ui.style import colorize, span_style
 from lldb_mix.ui.table import Column, render_table
 from lldb_mix.ui.terminal import get_terminal_size
 from lldb_mix.ui.theme import get_theme
@@ -112,7 +112,8 @@ def _handle_list() -> str:
     columns = [Column("session", "SESSION", role="muted", truncate="left")]
 
     lines = [_style("[lldb-mix] sessions:", "title")]
-    lines.extend(render_table(rows, columns, term_width, _style))
+    style = span_style(theme, SETTINGS.enable_color)
+    lines.extend(render_table(rows, columns, term_width, style))
     return "\n".join(lines)
 
 
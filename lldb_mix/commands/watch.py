@@ -6,7 +6,7 @@ from lldb_mix.commands.context import render_context_if_enabled
 from lldb_mix.commands.utils import emit_result
 from lldb_mix.core.addressing import parse_int
 from lldb_mix.core.state import SETTINGS, WATCHLIST
-from lldb_mix.ui.style import colorize
+from lldb_mix.ui.style import colorize, span_style
 from lldb_mix.ui.table import Column, render_table
 from lldb_mix.ui.terminal import get_terminal_size
 from lldb_mix.ui.theme import get_theme
@@ -104,7 +104,8 @@ def _handle_list() -> list[str]:
         )
 
     lines = [_style("[lldb-mix] watches:", "title")]
-    lines.extend(render_table(rows, columns, term_width, _style))
+    style = span_style(theme, SETTINGS.enable_color)
+    lines.extend(render_table(rows, columns, term_width, style))
     return lines
 
 
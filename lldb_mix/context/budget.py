@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+BUDGET_MARK = "(budget)"
+DEGRADE_RATIO = 0.85
+DEGRADED_STACK_LINES = 4
+
+
+class RenderBudget:
+    def __init__(
+        self, limit_ms: int, clock: Callable[[], float] = time.perf_counter
+    ):
+        self.clock = clock
+        self.limit = limit_ms / 1000.0
+        self.start = clock()
+        self.skipped = 0
+
+    def elapsed(self) -> float:
+        return self.clock() - self.start
+
+    def low(self) -> bool:
+        return self.elapsed() >= self.limit * DEGRADE_RATIO
+
+    def exhausted(self) -> bool:
+        return self.elapsed() >= self.limit
+
+    def skip(self) -> None:
+        self.skipped += 1
+
+
+def render_budget(limit_ms: int) -> RenderBudget | None:
+    if limit_ms <= 0:
+        return None
+    return RenderBudget(limit_ms)
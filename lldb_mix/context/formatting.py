@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from lldb_mix.context.types import PaneContext
 from lldb_mix.deref import (
-    classify_token,
-    deref_chain,
+    DerefNode,
+    deref_nodes,
+    format_node,
     last_addr,
     region_tag,
     summarize_chain,
 )
+from lldb_mix.ui.styled import StyledText
 
 
 @dataclass(frozen=True)
@@ -25,28 +28,51 @@ def deref_summary(
     ptr_size: int,
     allow_kinds: tuple[str, ...] | None = ("string", "symbol", "region"),
 ) -> DerefSummary | None:
+    return deref_summaries(ctx, [value], ptr_size, allow_kinds)[0]
+
+
+def deref_summaries(
+    ctx: PaneContext,
+    values: Sequence[int],
+    ptr_size: int,
+    allow_kinds: tuple[str, ...] | None = ("string", "symbol", "region"),
+) -> list[DerefSummary | None]:
     if not ctx.settings.aggressive_deref or not ctx.reader:
-        return None
+        return [None] * len(values)
+    if ctx.budget is not None and ctx.budget.low():
+        if values:
+            ctx.budget.skip()
+        return [None] * len(values)
 
-    chain = deref_chain(
-        value,
+    nodes_for = ctx.deref_cache.nodes if ctx.deref_cache else deref_nodes
+    chains = nodes_for(
+        values,
         ctx.reader,
         ctx.snapshot.maps,
         ctx.resolver,
         ctx.settings,
         ptr_size,
     )
-    summary = summarize_chain(chain)
+    return [_summarize(ctx, nodes, ptr_size, allow_kinds) for nodes in chains]
+
+
+def _summarize(
+    ctx: PaneContext,
+    nodes: list[DerefNode],
+    ptr_size: int,
+    allow_kinds: tuple[str, ...] | None,
+) -> DerefSummary | None:
+    summary = summarize_chain(nodes)
     if not summary:
         return None
-    kind = classify_token(summary)
+    kind = summary.kind
     if allow_kinds is not None and kind not in allow_kinds:
         return None
 
     tag = None
     if kind == "symbol":
-        tag = region_tag(last_addr(chain), ctx.snapshot.maps)
-    return DerefSummary(summary, kind, tag)
+        tag = region_tag(last_addr(nodes), ctx.snapshot.maps)
+    return DerefSummary(format_node(summary, ptr_size), kind, tag)
 
 
 def deref_role(kind: str) -> str:
@@ -59,10 +85,9 @@ def deref_role(kind: str) -> str:
     return "muted"
 
 
-def format_deref_suffix(pane, ctx: PaneContext, info: DerefSummary) -> str:
-    arrow = pane.style(ctx, "->", "arrow")
-    summary_text = pane.style(ctx, info.text, deref_role(info.kind))
-    suffix = f"{arrow} {summary_text}"
+def format_deref_suffix(pane, ctx: PaneContext, info: DerefSummary) -> StyledText:
+    arrow = pane.span(ctx, "->", "arrow")
+    suffix = arrow + " " + pane.span(ctx, info.text, deref_role(info.kind))
     if info.tag:
-        suffix = f"{suffix} {pane.style(ctx, info.tag, 'muted')}"
+        suffix = suffix + " " + pane.span(ctx, info.tag, "muted")
     return suffix
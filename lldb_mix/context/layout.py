@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import replace
 
+from lldb_mix.context.budget import BUDGET_MARK
 from lldb_mix.context.panes.base import Pane
 from lldb_mix.context.types import PaneContext
-from lldb_mix.ui.text import pad_ansi, truncate_ansi
+from lldb_mix.ui.styled import StyledText, join_text
 
 COLUMN_GAP = 2
 MIN_COLUMN_WIDTH = 60
@@ -37,7 +38,7 @@ def render_rows(groups: list[list[Pane]], ctx: PaneContext) -> list[str]:
         if idx:
             lines.append("")
         if len(group) == 1:
-            lines.extend(group[0].render(ctx))
+            lines.extend(_pane_lines(group[0], ctx))
             continue
         if allow_columns and _has_column_hints(group):
             lines.extend(_render_columns(group, ctx))
@@ -58,7 +59,7 @@ def _render_single_column(group: list[Pane], ctx: PaneContext) -> list[str]:
     for pane in group:
         if lines:
             lines.append("")
-        lines.extend(pane.render(ctx))
+        lines.extend(_pane_lines(pane, ctx))
     return lines
 
 
@@ -78,7 +79,7 @@ def _render_row_pairs(group: list[Pane], ctx: PaneContext) -> list[str]:
         if row_idx:
             lines.append("")
         if len(row) == 1:
-            lines.extend(row[0].render(ctx))
+            lines.extend(_pane_lines(row[0], ctx))
             continue
         col_width = _column_width(ctx.term_width, len(row))
         blocks = [_render_pane(pane, ctx, col_width) for pane in row]
@@ -103,36 +104,62 @@ def _render_columns(group: list[Pane], ctx: PaneContext) -> list[str]:
     return _join_columns([left, right], col_width)
 
 
-def _render_column(panes: list[Pane], ctx: PaneContext, col_width: int) -> list[str]:
-    lines: list[str] = []
+def _render_column(
+    panes: list[Pane], ctx: PaneContext, col_width: int
+) -> list[StyledText]:
+    lines: list[StyledText] = []
     for pane in panes:
         if lines:
-            lines.append(" " * col_width)
+            lines.append(StyledText.plain(" " * col_width))
         lines.extend(_render_pane(pane, ctx, col_width))
     return lines
 
 
-def _render_pane(pane: Pane, ctx: PaneContext, width: int) -> list[str]:
+def _render_pane(pane: Pane, ctx: PaneContext, width: int) -> list[StyledText]:
     sub_ctx = replace(ctx, term_width=width)
-    pane_lines = pane.render(sub_ctx)
-    return [pad_ansi(truncate_ansi(line, width), width) for line in pane_lines]
+    return [line.fit(width) for line in _pane_text(pane, sub_ctx)]
 
 
-def _join_columns(blocks: list[list[str]], col_width: int) -> list[str]:
-    heights = [len(block) for block in blocks]
-    row_height = max(heights, default=0)
-    padded_blocks: list[list[str]] = []
-    for block in blocks:
-        padded = list(block)
-        if len(padded) < row_height:
-            padded.extend([" " * col_width] * (row_height - len(padded)))
-        padded_blocks.append(padded)
+def _pane_lines(pane: Pane, ctx: PaneContext) -> list[str]:
+    if _over_budget(ctx):
+        return [pane.title(ctx), pane.style(ctx, BUDGET_MARK, "muted")]
+    return _budgeted(pane, ctx, pane.render, pane.style)
 
-    joined: list[str] = []
+
+def _pane_text(pane: Pane, ctx: PaneContext) -> list[StyledText]:
+    if _over_budget(ctx):
+        return [pane.title_text(ctx), pane.span(ctx, BUDGET_MARK, "muted")]
+    return _budgeted(pane, ctx, pane.render_text, pane.span)
+
+
+def _over_budget(ctx: PaneContext) -> bool:
+    return ctx.budget is not None and ctx.budget.exhausted()
+
+
+def _budgeted(pane: Pane, ctx: PaneContext, render, style):
+    if ctx.budget is None:
+        return _measure(pane, ctx, render)
+    skipped = ctx.budget.skipped
+    lines = _measure(pane, ctx, render)
+    if ctx.budget.skipped > skipped:
+        lines.append(style(ctx, BUDGET_MARK, "muted"))
+    return lines
+
+
+def _measure(pane: Pane, ctx: PaneContext, render):
+    if ctx.profiler is None:
+        return render(ctx)
+    return ctx.profiler.measure(pane.name, lambda: render(ctx))
+
+
+def _join_columns(blocks: list[list[StyledText]], col_width: int) -> list[str]:
+    row_height = max((len(block) for block in blocks), default=0)
+    blank = StyledText.plain(" " * col_width)
     gap = " " * COLUMN_GAP
+    joined: list[str] = []
     for idx in range(row_height):
-        line = gap.join(block[idx] for block in padded_blocks).rstrip()
-        joined.append(line)
+        row = [block[idx] if idx < len(block) else blank for block in blocks]
+        joined.append(join_text(gap, row).rstrip().render())
     return joined
 
 
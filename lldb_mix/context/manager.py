@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from lldb_mix.context.budget import render_budget
 from lldb_mix.context.header import render_header
 from lldb_mix.context.layout import layout_panes, render_rows
 from lldb_mix.context.panes.args import ArgsPane
@@ -14,7 +15,10 @@ from lldb_mix.context.panes.watch import WatchPane
 from lldb_mix.context.types import PaneContext
 from lldb_mix.core.settings import Settings
 from lldb_mix.core.snapshot import ContextSnapshot
-from lldb_mix.core.state import WATCHLIST
+from lldb_mix.core.memory import process_stop_key
+from lldb_mix.core.state import DECODES, GRAPHS, PROFILER, WATCHLIST
+from lldb_mix.deref import DerefCache
+from lldb_mix.ui.repaint import DiffRenderer
 from lldb_mix.ui.terminal import clear_screen_code, get_terminal_size
 from lldb_mix.ui.theme import Theme
 
@@ -24,6 +28,9 @@ class ContextManager:
         self.settings = settings
         self.theme = theme
         self.last_regs: dict[str, int] = {}
+        self.deref_cache = DerefCache()
+        self.repaint = DiffRenderer()
+        self.last_size: tuple[int, int] = (0, 0)
         self.panes: dict[str, Pane] = {
             "args": ArgsPane(),
             "regs": RegsPane(),
@@ -42,8 +49,16 @@ class ContextManager:
         resolver: object | None,
         target: object | None,
         process: object | None,
+        profile: bool = False,
     ) -> list[str]:
         term_width, term_height = get_terminal_size()
+        self.last_size = (term_width, term_height)
+        self.deref_cache.bind(process_stop_key(process))
+        self.deref_cache.clear()
+        DECODES.bind(process, snapshot.maps)
+        profiler = PROFILER if profile or PROFILER.enabled else None
+        if profiler is not None:
+            profiler.begin()
         ctx = PaneContext(
             snapshot=snapshot,
             settings=self.settings,
@@ -56,10 +71,19 @@ class ContextManager:
             watchlist=WATCHLIST,
             term_width=term_width,
             term_height=term_height,
+            deref_cache=self.deref_cache,
+            decode_cache=DECODES,
+            graphs=GRAPHS,
+            profiler=profiler,
+            budget=render_budget(self.settings.render_budget_ms),
         )
         lines: list[str] = []
-        header_lines = render_header(ctx)
-        if self.settings.clear_screen and header_lines:
+        if profiler is None:
+            header_lines = render_header(ctx)
+        else:
+            header_lines = profiler.measure("header", lambda: render_header(ctx))
+        diff = self.settings.render_mode == "diff"
+        if self.settings.clear_screen and header_lines and not diff:
             header_lines[0] = clear_screen_code() + header_lines[0]
         lines.extend(header_lines)
 
@@ -74,9 +98,17 @@ class ContextManager:
 
         rows = layout_panes(panes, term_width)
         lines.extend(render_rows(rows, ctx))
+        if profiler is not None:
+            profiler.end()
         self.last_regs = dict(snapshot.regs)
         return lines
 
+    def frame(self, lines: list[str], full: bool = False) -> str:
+        if self.settings.render_mode != "diff":
+            self.repaint.reset()
+            return "\n".join(lines)
+        return self.repaint.frame(lines, self.last_size, full)
+
     def show(
         self,
         snapshot: ContextSnapshot,
@@ -85,5 +117,5 @@ class ContextManager:
         target: object | None,
         process: object | None,
     ) -> None:
-        for line in self.render(snapshot, reader, resolver, target, process):
-            print(line)
+        lines = self.render(snapshot, reader, resolver, target, process)
+        print(self.frame(lines, full=True))
@@ -1,22 +1,18 @@
 from __future__ import annotations
 
-from lldb_mix.context.formatting import deref_summary, format_deref_suffix
-from lldb_mix.context.panes.base import Pane
+from lldb_mix.context.formatting import deref_summaries, format_deref_suffix
+from lldb_mix.context.panes.base import TextPane
 from lldb_mix.context.types import PaneContext
 from lldb_mix.core.disasm import read_instructions
 from lldb_mix.core.flow import resolve_flow_target
 from lldb_mix.deref import format_addr, format_symbol
+from lldb_mix.ui.styled import StyledText
 
 
-class ArgsPane(Pane):
+class ArgsPane(TextPane):
     name = "args"
     column = 1
 
-    def title(self, ctx: PaneContext | None = None) -> str:
-        if ctx is None:
-            return super().title(ctx)
-        return self.style(ctx, f"[{self.name}]", "title")
-
     def visible(self, ctx: PaneContext) -> bool:
         abi = getattr(ctx.snapshot.arch, "abi", None)
         if not abi or not getattr(abi, "int_arg_regs", None):
@@ -24,19 +20,19 @@ class ArgsPane(Pane):
         regs = ctx.snapshot.regs
         return any(reg in regs for reg in abi.int_arg_regs)
 
-    def render(self, ctx: PaneContext) -> list[str]:
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
         snapshot = ctx.snapshot
         arch = snapshot.arch
         abi = getattr(arch, "abi", None)
         regs = snapshot.regs
-        lines = [self.title(ctx)]
+        lines = [self.title_text(ctx)]
         if not abi or not getattr(abi, "int_arg_regs", None):
-            lines.append("(args unavailable)")
+            lines.append(StyledText.plain("(args unavailable)"))
             return lines
 
         arg_regs = [reg for reg in abi.int_arg_regs if reg in regs]
         if not arg_regs:
-            lines.append("(no args)")
+            lines.append(StyledText.plain("(no args)"))
             return lines
 
         ptr_size = arch.ptr_size or 8
@@ -49,19 +45,20 @@ class ArgsPane(Pane):
             lines.append(header)
 
         name_width = max(len(reg) for reg in arg_regs)
+        summaries = deref_summaries(ctx, [regs[reg] for reg in arg_regs], ptr_size)
 
-        for reg_name in arg_regs:
+        for reg_name, info in zip(arg_regs, summaries):
             value = regs[reg_name]
             name_text = f"{reg_name:{name_width}}"
-            name_colored = self.style(ctx, name_text, "reg_name")
             value_text = format_addr(value, ptr_size)
-            value_colored = self.style(ctx, value_text, "value")
-            sep = self.style(ctx, ": ", "label")
-            line = f"{name_colored}{sep}{value_colored}"
+            line = (
+                self.span(ctx, name_text, "reg_name")
+                + self.span(ctx, ": ", "label")
+                + self.span(ctx, value_text, "value")
+            )
 
-            info = deref_summary(ctx, value, ptr_size)
             if info:
-                line = f"{line} {format_deref_suffix(self, ctx, info)}"
+                line = line + " " + format_deref_suffix(self, ctx, info)
 
             lines.append(line)
 
@@ -69,8 +66,8 @@ class ArgsPane(Pane):
 
     def _call_header(
         self, ctx: PaneContext, inst, regs: dict[str, int], ptr_size: int
-    ) -> str:
-        label = self.style(ctx, "call args", "label")
+    ) -> StyledText:
+        label = self.span(ctx, "call args", "label")
         read_pointer = getattr(ctx.reader, "read_pointer", None)
         target = resolve_flow_target(
             inst.mnemonic,
@@ -82,21 +79,20 @@ class ArgsPane(Pane):
         )
         if target is None:
             return label
-        arrow = self.style(ctx, "->", "arrow")
-        addr_text = self.style(ctx, format_addr(target, ptr_size), "addr")
-        line = f"{label} {arrow} {addr_text}"
+        arrow = self.span(ctx, "->", "arrow")
+        addr_text = self.span(ctx, format_addr(target, ptr_size), "addr")
+        line = label + " " + arrow + " " + addr_text
         if ctx.resolver:
             symbol = ctx.resolver.resolve(target)
             if symbol:
-                sym_text = self.style(ctx, format_symbol(symbol), "symbol")
-                line = f"{line} {sym_text}"
+                line = line + " " + self.span(ctx, format_symbol(symbol), "symbol")
         return line
 
-    def _abi_label(self, ctx: PaneContext, abi) -> str | None:
+    def _abi_label(self, ctx: PaneContext, abi) -> StyledText | None:
         name = getattr(abi, "name", "") if abi else ""
         if not name:
             return None
-        return self.style(ctx, f"abi: {name}", "muted")
+        return self.span(ctx, f"abi: {name}", "muted")
 
 
 def _current_call_inst(ctx: PaneContext, arch, pc: int | None):
@@ -104,7 +100,7 @@ def _current_call_inst(ctx: PaneContext, arch, pc: int | None):
         return None
     flavor = arch.disasm_flavor()
     try:
-        insts = read_instructions(ctx.target, pc, 1, flavor)
+        insts = read_instructions(ctx.target, pc, 1, flavor, ctx.decode_cache)
     except Exception:
         return None
     if not insts:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from lldb_mix.context.types import PaneContext
-from lldb_mix.ui.style import colorize
+from lldb_mix.ui.style import colorize, style_text
+from lldb_mix.ui.styled import StyledText, parse_ansi
 
 
 class Pane:
@@ -15,12 +16,29 @@ class Pane:
             return text
         return colorize(text, "title", ctx.theme, ctx.settings.enable_color)
 
+    def title_text(self, ctx: PaneContext) -> StyledText:
+        return self.span(ctx, f"[{self.name}]", "title")
+
     def style(self, ctx: PaneContext, text: str, role: str) -> str:
         return colorize(text, role, ctx.theme, ctx.settings.enable_color)
 
+    def span(self, ctx: PaneContext, text: str, role: str) -> StyledText:
+        return style_text(text, role, ctx.theme, ctx.settings.enable_color)
+
     def visible(self, ctx: PaneContext) -> bool:
         _ = ctx
         return True
 
     def render(self, ctx: PaneContext) -> list[str]:
         return [self.title(ctx), "(not implemented)"]
+
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
+        return [parse_ansi(line) for line in self.render(ctx)]
+
+
+class TextPane(Pane):
+    def render(self, ctx: PaneContext) -> list[str]:
+        return [line.render() for line in self.render_text(ctx)]
+
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
+        return [self.title_text(ctx), StyledText.plain("(not implemented)")]
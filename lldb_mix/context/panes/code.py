@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 
+from lldb_mix.arch.operands import OperandAnalyzer
 from lldb_mix.arch.view import ArchView
 from lldb_mix.context.formatting import deref_summary
-from lldb_mix.context.panes.base import Pane
+from lldb_mix.context.panes.base import TextPane
 from lldb_mix.context.types import PaneContext
 from lldb_mix.core.disasm import read_instructions, read_instructions_around
 from lldb_mix.core.flow import branch_decision, is_branch_like, resolve_flow_target
 from lldb_mix.deref import format_addr, format_symbol
-from lldb_mix.ui.text import pad_ansi, truncate_ansi, visible_len
+from lldb_mix.ui.styled import StyledText
 
 
 BRANCH_VIEW_MIN_WIDTH = 120
@@ -29,22 +29,22 @@ class _CodeState:
 
 
 
-class CodePane(Pane):
+class CodePane(TextPane):
     name = "code"
     full_width = True
 
-    def render(self, ctx: PaneContext) -> list[str]:
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
         snapshot = ctx.snapshot
         arch = snapshot.arch
-        lines = [self.title(ctx)]
+        lines = [self.title_text(ctx)]
         pc = snapshot.pc
         ptr_size = arch.ptr_size or 8
 
         if not snapshot.has_pc():
-            lines.append("(pc unavailable)")
+            lines.append(StyledText.plain("(pc unavailable)"))
             return lines
         if not ctx.target:
-            lines.append("(target unavailable)")
+            lines.append(StyledText.plain("(target unavailable)"))
             return lines
 
         flags = 0
@@ -60,16 +60,18 @@ class CodePane(Pane):
             arch,
             regions=snapshot.maps,
             flavor=flavor,
+            cache=ctx.decode_cache,
+            resolver=ctx.resolver,
         )
         if not insts:
-            lines.append("(disassembly unavailable)")
+            lines.append(StyledText.plain("(disassembly unavailable)"))
             return lines
 
         bytes_texts, bytes_pad = _opcode_texts(insts, ctx.settings.show_opcodes)
 
         current_idx = _pc_index(insts, pc)
         if current_idx is None:
-            lines.append("(disassembly unavailable)")
+            lines.append(StyledText.plain("(disassembly unavailable)"))
             return lines
 
         state = _CodeState(
@@ -79,25 +81,26 @@ class CodePane(Pane):
             bytes_pad=bytes_pad,
             flavor=flavor,
         )
-        branch_lines = _render_branch_split(
-            self,
-            ctx,
-            insts,
-            current_idx,
-            state,
-        )
-        if branch_lines:
-            lines.extend(branch_lines)
-            return lines
+        low = ctx.budget is not None and ctx.budget.low()
+        if not low:
+            branch_lines = _render_branch_split(
+                self,
+                ctx,
+                insts,
+                current_idx,
+                state,
+            )
+            if branch_lines:
+                lines.extend(branch_lines)
+                return lines
 
         lines.extend(_render_linear(self, ctx, insts, state, pc))
+        if low and is_branch_like(insts[current_idx].mnemonic, arch):
+            ctx.budget.skip()
 
         return lines
 
 
-_REG_BOUNDARY = r"(?<![A-Za-z0-9_])(?:{name})(?![A-Za-z0-9_])"
-
-
 def _opcode_texts(insts, show_opcodes: bool) -> tuple[list[str], int]:
     if not show_opcodes:
         return [""] * len(insts), 0
@@ -116,8 +119,8 @@ def _render_linear(
     insts,
     state: _CodeState,
     pc: int,
-) -> list[str]:
-    lines: list[str] = []
+) -> list[StyledText]:
+    lines: list[StyledText] = []
     for idx, inst in enumerate(insts):
         is_pc = inst.address == pc
         bytes_text = state.bytes_texts[idx] if state.bytes_texts else ""
@@ -144,32 +147,15 @@ def _operand_annotations(
     ctx: PaneContext,
     ptr_size: int,
     max_regs: int = 3,
+    next_pc: int | None = None,
 ) -> list[str]:
     if not operands or not regs:
         return []
 
-    reg_map = {name.lower(): name for name in regs}
-    reg_map.update(_alias_registers(ctx.snapshot.arch, regs))
-    reg_names = sorted(reg_map.keys(), key=len, reverse=True)
-    pattern = re.compile(
-        _REG_BOUNDARY.format(name="|".join(re.escape(name) for name in reg_names)),
-        re.IGNORECASE,
-    )
-
-    seen: set[str] = set()
-    reg_hits: list[tuple[str, str]] = []
-    for match in pattern.finditer(operands):
-        key = match.group(0).lower()
-        canon = reg_map.get(key)
-        if not canon or canon in seen:
-            continue
-        seen.add(canon)
-        reg_hits.append((match.group(0), canon))
-        if len(reg_hits) >= max_regs:
-            break
-
+    arch = ctx.snapshot.arch
+    analyzer = arch.operand_analyzer(regs)
     pieces: list[str] = []
-    for display, canon in reg_hits:
+    for display, canon in analyzer.registers(operands)[:max_regs]:
         value = regs[canon]
         addr_text = format_addr(value, ptr_size)
         summary = _annotation_for_addr(ctx, value, ptr_size)
@@ -178,7 +164,7 @@ def _operand_annotations(
         else:
             pieces.append(f"{display}={addr_text}")
 
-    mem_addr = _compute_mem_addr(operands, regs, pattern, ctx.snapshot.arch)
+    mem_addr = _compute_mem_addr(operands, regs, analyzer, arch, next_pc)
     if mem_addr is not None:
         mem_text = format_addr(mem_addr, ptr_size)
         summary = _annotation_for_addr(ctx, mem_addr, ptr_size)
@@ -199,57 +185,20 @@ def _annotation_for_addr(ctx: PaneContext, addr: int, ptr_size: int) -> str | No
 def _compute_mem_addr(
     operands: str,
     regs: dict[str, int],
-    pattern: re.Pattern[str],
+    analyzer: OperandAnalyzer,
     arch: ArchView,
+    next_pc: int | None = None,
 ) -> int | None:
-    targets = arch.mem_operand_targets(operands, regs)
+    targets = arch.mem_operand_targets(operands, regs, next_pc)
     if targets:
         return targets[0]
-    for expr in re.findall(r"\[([^\]]+)\]", operands):
-        cleaned = expr.replace("#", "").replace("!", "")
-        regs_in = _regs_in_text(cleaned, regs, pattern, arch)
-        if len(regs_in) != 1:
-            continue
-        base = regs.get(regs_in[0])
-        if base is None:
-            continue
-        offset = _parse_offset(cleaned)
-        return base + offset
+    for canon, offset in analyzer.mem_bases(operands):
+        base = regs.get(canon)
+        if base is not None:
+            return base + offset
     return None
 
 
-def _regs_in_text(
-    text: str,
-    regs: dict[str, int],
-    pattern: re.Pattern[str],
-    arch: ArchView,
-) -> list[str]:
-    reg_map = {name.lower(): name for name in regs}
-    reg_map.update(_alias_registers(arch, regs))
-    seen: set[str] = set()
-    out: list[str] = []
-    for match in pattern.finditer(text):
-        key = match.group(0).lower()
-        canon = reg_map.get(key)
-        if not canon or canon in seen:
-            continue
-        seen.add(canon)
-        out.append(canon)
-    return out
-
-
-def _parse_offset(expr: str) -> int:
-    match = re.search(r"([+-])\s*(0x[0-9a-fA-F]+|\d+)", expr)
-    if not match:
-        return 0
-    sign = -1 if match.group(1) == "-" else 1
-    try:
-        value = int(match.group(2), 0)
-    except ValueError:
-        return 0
-    return sign * value
-
-
 def _branch_taken_hint(
     mnemonic: str,
     operands: str,
@@ -277,20 +226,13 @@ def _branch_taken_hint(
     return "taken" if taken else "not taken"
 
 
-def _alias_registers(arch: ArchView, regs: dict[str, int]) -> dict[str, str]:
-    try:
-        return arch.register_aliases(regs)
-    except Exception:
-        return {}
-
-
 def _render_branch_split(
     pane: CodePane,
     ctx: PaneContext,
     insts,
     current_idx: int,
     state: _CodeState,
-) -> list[str] | None:
+) -> list[StyledText] | None:
     snapshot = ctx.snapshot
     arch = snapshot.arch
     current = insts[current_idx]
@@ -327,12 +269,12 @@ def _render_branch_split(
     block_lines = max(ctx.settings.code_lines_after, 0)
     if block_lines <= 0:
         return None
-    left_insts = read_instructions(ctx.target, fallthrough, block_lines, state.flavor)
-    right_insts = read_instructions(ctx.target, target, block_lines, state.flavor)
+    left_insts = _branch_arm(ctx, current.address, fallthrough, block_lines, state)
+    right_insts = _branch_arm(ctx, current.address, target, block_lines, state)
     if not left_insts or not right_insts:
         return None
 
-    lines: list[str] = []
+    lines: list[StyledText] = []
     for idx in range(current_idx + 1):
         inst = insts[idx]
         bytes_text = state.bytes_texts[idx] if state.bytes_texts else ""
@@ -420,7 +362,7 @@ def _format_inst_line(
     flags: int,
     include_comment: bool,
     tone: str,
-) -> str:
+) -> StyledText:
     prefix = "=>" if is_pc else "  "
     addr_text = format_addr(inst.address, ptr_size)
     bytes_text = f"{bytes_text:<{bytes_pad}}" if bytes_text else ""
@@ -432,28 +374,23 @@ def _format_inst_line(
         text += f" {inst.mnemonic}"
         if inst.operands:
             text += f" {inst.operands}"
-        return pane.style(ctx, text, "muted")
+        return pane.span(ctx, text, "muted")
 
     prefix_role = "pc_marker" if is_pc else "muted"
-    prefix_colored = pane.style(ctx, prefix, prefix_role)
-    addr_colored = pane.style(ctx, addr_text, "addr")
-    bytes_colored = pane.style(ctx, bytes_text, "opcode") if bytes_text else ""
-    mnemonic_colored = pane.style(ctx, inst.mnemonic, "mnemonic")
-
-    text = f"{prefix_colored} {addr_colored} "
-    if bytes_colored:
-        text += bytes_colored
-        text += " "
-    text += mnemonic_colored
+    line = pane.span(ctx, prefix, prefix_role) + " "
+    line = line + pane.span(ctx, addr_text, "addr") + " "
+    if bytes_text:
+        line = line + pane.span(ctx, bytes_text, "opcode") + " "
+    line = line + pane.span(ctx, inst.mnemonic, "mnemonic")
     if inst.operands:
-        text += f" {inst.operands}"
+        line = line + f" {inst.operands}"
 
     if include_comment:
         comment = _inst_comment(ctx, inst, ptr_size, flags)
         if comment:
-            text += f" {pane.style(ctx, comment, 'comment')}"
+            line = line + " " + pane.span(ctx, comment, "comment")
 
-    return text
+    return line
 
 
 def _inst_comment(ctx: PaneContext, inst, ptr_size: int, flags: int) -> str | None:
@@ -473,6 +410,7 @@ def _inst_comment(ctx: PaneContext, inst, ptr_size: int, flags: int) -> str | No
             ctx.snapshot.regs,
             ctx,
             ptr_size,
+            next_pc=inst.address + inst.byte_size if inst.byte_size else None,
         )
     )
     if is_branch_like(inst.mnemonic, ctx.snapshot.arch):
@@ -500,6 +438,18 @@ def _inst_comment(ctx: PaneContext, inst, ptr_size: int, flags: int) -> str | No
     return "; " + " | ".join(comment_parts)
 
 
+def _branch_arm(
+    ctx: PaneContext, pc: int, addr: int, count: int, state: _CodeState
+) -> list:
+    cache = ctx.decode_cache
+    if cache is not None and ctx.graphs is not None:
+        graph = ctx.graphs.get(cache, ctx.target, pc, ctx.snapshot.arch)
+        arm = graph.arm(addr, count) if graph is not None else None
+        if arm and len(arm) >= count:
+            return arm
+    return read_instructions(ctx.target, addr, count, state.flavor, cache)
+
+
 def _fallthrough_addr(insts, current_idx: int) -> int | None:
     if current_idx + 1 < len(insts):
         return insts[current_idx + 1].address
@@ -515,7 +465,7 @@ def _target_disasm_available(ctx: PaneContext, addr: int) -> bool:
         return True
     flavor = ctx.snapshot.arch.disasm_flavor()
     try:
-        insts = read_instructions(target, addr, 1, flavor)
+        insts = read_instructions(target, addr, 1, flavor, ctx.decode_cache)
     except Exception:
         return True
     return bool(insts)
@@ -524,47 +474,44 @@ def _target_disasm_available(ctx: PaneContext, addr: int) -> bool:
 def _join_branch_blocks(
     pane: CodePane,
     ctx: PaneContext,
-    left_lines: list[str],
-    right_lines: list[str],
+    left_lines: list[StyledText],
+    right_lines: list[StyledText],
     left_width: int,
     right_width: int,
     taken: bool,
-) -> list[str]:
+) -> list[StyledText]:
     height = max(len(left_lines), len(right_lines))
-    left = list(left_lines)
-    right = list(right_lines)
-    if len(left) < height:
-        left.extend([" " * left_width] * (height - len(left)))
-    if len(right) < height:
-        right.extend([" " * right_width] * (height - len(right)))
-
-    lines: list[str] = []
+    blank = StyledText()
+    lines: list[StyledText] = []
     for idx in range(height):
-        left_text = pad_ansi(truncate_ansi(left[idx], left_width), left_width)
-        right_text = pad_ansi(truncate_ansi(right[idx], right_width), right_width)
+        left = left_lines[idx] if idx < len(left_lines) else blank
+        right = right_lines[idx] if idx < len(right_lines) else blank
         gap = _branch_gap(pane, ctx, idx, taken)
-        lines.append(f"{left_text}{gap}{right_text}".rstrip())
+        line = left.fit(left_width) + gap + right.fit(right_width)
+        lines.append(line.rstrip())
     return lines
 
 
-def _branch_gap(pane: CodePane, ctx: PaneContext, row_idx: int, taken: bool) -> str:
+def _branch_gap(
+    pane: CodePane, ctx: PaneContext, row_idx: int, taken: bool
+) -> StyledText:
     if row_idx != 0 or BRANCH_COLUMN_GAP < 2:
-        return " " * BRANCH_COLUMN_GAP
-    arrow = pane.style(ctx, "->", "arrow" if taken else "muted")
+        return StyledText.plain(" " * BRANCH_COLUMN_GAP)
+    arrow = pane.span(ctx, "->", "arrow" if taken else "muted")
     padding = " " * max(BRANCH_COLUMN_GAP - 2, 0)
-    return f"{padding}{arrow}"
+    return padding + arrow
 
 
-def _max_visible_width(lines: list[str]) -> int:
+def _max_visible_width(lines: list[StyledText]) -> int:
     if not lines:
         return 0
-    return max(visible_len(line) for line in lines)
+    return max(line.width for line in lines)
 
 
 def _branch_widths(
     term_width: int,
-    left_lines: list[str],
-    right_lines: list[str],
+    left_lines: list[StyledText],
+    right_lines: list[StyledText],
 ) -> tuple[int, int] | None:
     if term_width < BRANCH_VIEW_MIN_WIDTH:
         return None
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from lldb_mix.context.panes.base import Pane
+from lldb_mix.context.panes.base import TextPane
 from lldb_mix.context.types import PaneContext
 from lldb_mix.core.disasm import read_instructions
 from lldb_mix.core.flow import is_branch_like, resolve_flow_target
 from lldb_mix.deref import format_addr, format_symbol
+from lldb_mix.ui.styled import StyledText
 
 
-class FlowPane(Pane):
+class FlowPane(TextPane):
     name = "flow"
     column = 0
 
@@ -17,27 +18,27 @@ class FlowPane(Pane):
             return False
         return is_branch_like(inst.mnemonic, ctx.snapshot.arch)
 
-    def render(self, ctx: PaneContext) -> list[str]:
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
         snapshot = ctx.snapshot
         arch = snapshot.arch
-        lines = [self.title(ctx)]
+        lines = [self.title_text(ctx)]
         pc = snapshot.pc
         ptr_size = arch.ptr_size or 8
 
         if not snapshot.has_pc():
-            lines.append("(pc unavailable)")
+            lines.append(StyledText.plain("(pc unavailable)"))
             return lines
         if not ctx.target:
-            lines.append("(target unavailable)")
+            lines.append(StyledText.plain("(target unavailable)"))
             return lines
 
         inst = _current_inst(ctx)
         if not inst:
-            lines.append("(flow unavailable)")
+            lines.append(StyledText.plain("(flow unavailable)"))
             return lines
-        mnemonic = self.style(ctx, inst.mnemonic, "mnemonic")
+        mnemonic = self.span(ctx, inst.mnemonic, "mnemonic")
         if inst.operands:
-            lines.append(f"{mnemonic} {inst.operands}")
+            lines.append(mnemonic + " " + inst.operands)
         else:
             lines.append(mnemonic)
         read_pointer = getattr(ctx.reader, "read_pointer", None)
@@ -50,18 +51,18 @@ class FlowPane(Pane):
             ptr_size=ptr_size,
         )
         if target is None:
-            lines.append("(no flow target resolved)")
+            lines.append(StyledText.plain("(no flow target resolved)"))
             return lines
 
-        target_line = self.style(ctx, format_addr(target, ptr_size), "addr")
+        target_line = self.span(ctx, format_addr(target, ptr_size), "addr")
         if ctx.resolver:
             symbol = ctx.resolver.resolve(target)
             if symbol:
-                symbol_text = self.style(ctx, format_symbol(symbol), "symbol")
-                target_line = f"{target_line} {symbol_text}"
+                symbol_text = self.span(ctx, format_symbol(symbol), "symbol")
+                target_line = target_line + " " + symbol_text
 
-        label = self.style(ctx, "target:", "label")
-        lines.append(f"{label} {target_line}")
+        label = self.span(ctx, "target:", "label")
+        lines.append(label + " " + target_line)
         return lines
 
 
@@ -71,7 +72,7 @@ def _current_inst(ctx: PaneContext):
         return None
     flavor = ctx.snapshot.arch.disasm_flavor()
     try:
-        insts = read_instructions(ctx.target, pc, 1, flavor)
+        insts = read_instructions(ctx.target, pc, 1, flavor, ctx.decode_cache)
     except Exception:
         return None
     if not insts:
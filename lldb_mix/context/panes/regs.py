@@ -2,23 +2,24 @@ from __future__ import annotations
 
 from lldb_mix.context.formatting import (
     DerefSummary,
-    deref_summary,
+    deref_summaries,
     format_deref_suffix,
 )
-from lldb_mix.context.panes.base import Pane
+from lldb_mix.context.panes.base import TextPane
 from lldb_mix.context.types import PaneContext
 from lldb_mix.deref import find_region, format_addr, format_region
+from lldb_mix.ui.styled import StyledText, join_text
 
 
-class RegsPane(Pane):
+class RegsPane(TextPane):
     name = "regs"
     column = 0
 
-    def render(self, ctx: PaneContext) -> list[str]:
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
         snapshot = ctx.snapshot
         arch = snapshot.arch
         regs = snapshot.regs
-        lines = [self.title(ctx)]
+        lines = [self.title_text(ctx)]
         ptr_size = arch.ptr_size or 8
         reg_names = [name for name in arch.gpr_names if name in regs]
         flags_reg = arch.flags_reg
@@ -26,13 +27,23 @@ class RegsPane(Pane):
         show_all = pointer_mode == "all"
 
         if not reg_names:
-            lines.append("(no registers)")
+            lines.append(StyledText.plain("(no registers)"))
             return lines
 
         name_width = max(len(name) for name in reg_names)
-        entries: list[tuple[str, int]] = []
+        entries: list[StyledText] = []
         pointers: list[tuple[str, DerefSummary]] = []
 
+        deref_regs: list[str] = []
+        if ctx.settings.aggressive_deref and ctx.reader:
+            deref_regs = [name for name in reg_names if name != flags_reg]
+        summaries = dict(
+            zip(
+                deref_regs,
+                deref_summaries(ctx, [regs[name] for name in deref_regs], ptr_size),
+            )
+        )
+
         for reg_name in reg_names:
             value = regs[reg_name]
             is_flags = bool(flags_reg and reg_name == flags_reg)
@@ -43,16 +54,15 @@ class RegsPane(Pane):
             else:
                 value_text = format_addr(value, ptr_size)
             name_text = f"{reg_name:{name_width}}"
-            name_colored = self.style(ctx, name_text, "reg_name")
             value_role = "reg_changed" if changed else "reg_value"
-            value_colored = self.style(ctx, value_text, value_role)
-            sep = self.style(ctx, " ", "label")
-            cell_text = f"{name_colored}{sep}{value_colored}"
-            cell_plain = f"{name_text} {value_text}"
-            entries.append((cell_text, len(cell_plain)))
+            entries.append(
+                self.span(ctx, name_text, "reg_name")
+                + self.span(ctx, " ", "label")
+                + self.span(ctx, value_text, value_role)
+            )
 
-            if not is_flags and ctx.settings.aggressive_deref and ctx.reader:
-                info = deref_summary(ctx, value, ptr_size)
+            if reg_name in summaries:
+                info = summaries[reg_name]
                 if info:
                     pointers.append((reg_name, info))
                 elif show_all:
@@ -66,29 +76,25 @@ class RegsPane(Pane):
                             )
                         )
 
-        cell_width = max(length for _, length in entries)
+        cell_width = max(entry.width for entry in entries)
         col_sep = 2
         cols = max(1, (ctx.term_width + col_sep) // (cell_width + col_sep))
         cols = min(cols, len(entries))
         for start in range(0, len(entries), cols):
-            row = entries[start : start + cols]
-            line_parts: list[str] = []
-            for text, length in row:
-                padding = " " * (cell_width - length)
-                line_parts.append(f"{text}{padding}")
-            lines.append((" " * col_sep).join(line_parts).rstrip())
+            row = [entry.pad(cell_width) for entry in entries[start : start + cols]]
+            lines.append(join_text(" " * col_sep, row).rstrip())
 
         if pointers:
-            lines.append(self.style(ctx, "pointers:", "label"))
+            lines.append(self.span(ctx, "pointers:", "label"))
             pointer_name_width = max(len(reg_name) for reg_name, *_ in pointers)
             indent = "  "
             for reg_name, info in pointers:
-                reg_text = self.style(
+                reg_text = self.span(
                     ctx,
                     f"{reg_name:<{pointer_name_width}}",
                     "reg_name",
                 )
-                line = f"{indent}{reg_text} {format_deref_suffix(self, ctx, info)}"
-                lines.append(line)
+                suffix = format_deref_suffix(self, ctx, info)
+                lines.append(indent + reg_text + " " + suffix)
 
         return lines
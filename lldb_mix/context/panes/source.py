@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import os
 
-from lldb_mix.context.panes.base import Pane
+from lldb_mix.context.panes.base import TextPane
 from lldb_mix.context.types import PaneContext
+from lldb_mix.ui.styled import StyledText
 
 
-class SourcePane(Pane):
+class SourcePane(TextPane):
     name = "source"
     full_width = True
 
@@ -17,7 +18,7 @@ class SourcePane(Pane):
         path, _ = info
         return bool(path and os.path.isfile(path))
 
-    def render(self, ctx: PaneContext) -> list[str]:
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
         info = _source_info(ctx)
         if not info:
             return []
@@ -26,26 +27,26 @@ class SourcePane(Pane):
         path = _resolve_path(path)
         file_name = os.path.basename(path) if path else ""
 
-        header = self.style(ctx, "[source]", "title")
+        header = self.span(ctx, "[source]", "title")
         if file_name and line > 0:
-            location = self.style(ctx, f"{file_name}:{line}", "label")
-            header = f"{header} {location}"
+            location = self.span(ctx, f"{file_name}:{line}", "label")
+            header = header + " " + location
 
         lines = [header]
         if not path or not os.path.isfile(path):
-            lines.append(self.style(ctx, "(source unavailable)", "muted"))
+            lines.append(self.span(ctx, "(source unavailable)", "muted"))
             return lines
 
         try:
             with open(path, "r", encoding="utf-8", errors="replace") as handle:
                 source_lines = handle.readlines()
         except OSError:
-            lines.append(self.style(ctx, "(source unavailable)", "muted"))
+            lines.append(self.span(ctx, "(source unavailable)", "muted"))
             return lines
 
         total = len(source_lines)
         if line <= 0 or line > total:
-            lines.append(self.style(ctx, "(source unavailable)", "muted"))
+            lines.append(self.span(ctx, "(source unavailable)", "muted"))
             return lines
 
         before = max(ctx.settings.code_lines_before, 0)
@@ -59,9 +60,9 @@ class SourcePane(Pane):
             prefix = "=>" if lineno == line else "  "
             prefix_role = "pc_marker" if lineno == line else "muted"
             number_role = "label" if lineno == line else "muted"
-            prefix_text = self.style(ctx, prefix, prefix_role)
-            number_text = self.style(ctx, f"{lineno:>{number_width}}", number_role)
-            lines.append(f"{prefix_text} {number_text} {text}")
+            prefix_text = self.span(ctx, prefix, prefix_role)
+            number_text = self.span(ctx, f"{lineno:>{number_width}}", number_role)
+            lines.append(prefix_text + " " + number_text + " " + StyledText.plain(text))
 
         return lines
 
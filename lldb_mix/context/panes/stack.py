@@ -1,60 +1,68 @@
 from __future__ import annotations
 
-from lldb_mix.context.formatting import deref_summary, format_deref_suffix
-from lldb_mix.context.panes.base import Pane
+from lldb_mix.context.budget import DEGRADED_STACK_LINES
+from lldb_mix.context.formatting import deref_summaries, format_deref_suffix
+from lldb_mix.context.panes.base import TextPane
 from lldb_mix.context.types import PaneContext
+from lldb_mix.core.memory import read_pointers
 from lldb_mix.deref import format_addr, format_symbol
+from lldb_mix.ui.styled import StyledText
 
 
-class StackPane(Pane):
+class StackPane(TextPane):
     name = "stack"
     column = 1
 
-    def render(self, ctx: PaneContext) -> list[str]:
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
         snapshot = ctx.snapshot
         arch = snapshot.arch
-        lines = [self.title(ctx)]
+        lines = [self.title_text(ctx)]
         sp = snapshot.sp
         ptr_size = arch.ptr_size or 8
 
         if not snapshot.has_sp():
-            lines.append("(sp unavailable)")
+            lines.append(StyledText.plain("(sp unavailable)"))
             return lines
         if not ctx.reader or not hasattr(ctx.reader, "read_pointer"):
-            lines.append("(memory reader unavailable)")
+            lines.append(StyledText.plain("(memory reader unavailable)"))
             return lines
 
-        frame_lines = _frame_lines(ctx, ptr_size, self.style)
+        low = ctx.budget is not None and ctx.budget.low()
+        frame_lines = [] if low else _frame_lines(ctx, ptr_size, self.span)
         if frame_lines:
-            lines.append(self.style(ctx, "frames:", "label"))
+            lines.append(self.span(ctx, "frames:", "label"))
             lines.extend(frame_lines)
 
-        for idx in range(ctx.settings.stack_lines):
-            slot_addr = sp + idx * ptr_size
-            value = ctx.reader.read_pointer(slot_addr, ptr_size)
+        count = ctx.settings.stack_lines
+        if low:
+            count = min(count, DEGRADED_STACK_LINES)
+        slots = [sp + idx * ptr_size for idx in range(count)]
+        values = read_pointers(ctx.reader, slots, ptr_size)
+        readable = [value for value in values if value is not None]
+        summaries = iter(deref_summaries(ctx, readable, ptr_size))
+        for slot_addr, value in zip(slots, values):
+            addr_text = self.span(ctx, format_addr(slot_addr, ptr_size), "addr")
+            label = self.span(ctx, ": ", "label")
             if value is None:
-                addr_text = self.style(ctx, format_addr(slot_addr, ptr_size), "addr")
-                label = self.style(ctx, ": ", "label")
-                unreadable = self.style(ctx, "<unreadable>", "muted")
-                lines.append(f"{addr_text}{label}{unreadable}")
+                unreadable = self.span(ctx, "<unreadable>", "muted")
+                lines.append(addr_text + label + unreadable)
                 continue
 
-            addr_text = self.style(ctx, format_addr(slot_addr, ptr_size), "addr")
             value_text = format_addr(value, ptr_size)
-            value_colored = self.style(ctx, value_text, "value")
-            label = self.style(ctx, ": ", "label")
-            line = f"{addr_text}{label}{value_colored}"
+            line = addr_text + label + self.span(ctx, value_text, "value")
 
-            info = deref_summary(ctx, value, ptr_size)
+            info = next(summaries)
             if info:
-                line = f"{line} {format_deref_suffix(self, ctx, info)}"
+                line = line + " " + format_deref_suffix(self, ctx, info)
 
             lines.append(line)
 
+        if ctx.budget is not None and count < ctx.settings.stack_lines:
+            ctx.budget.skip()
         return lines
 
 
-def _frame_lines(ctx: PaneContext, ptr_size: int, style) -> list[str]:
+def _frame_lines(ctx: PaneContext, ptr_size: int, style) -> list[StyledText]:
     process = ctx.process
     if not process or not ctx.settings.stack_frame_lines:
         return []
@@ -66,7 +74,7 @@ def _frame_lines(ctx: PaneContext, ptr_size: int, style) -> list[str]:
     if num_frames <= 0:
         return []
 
-    lines: list[str] = []
+    lines: list[StyledText] = []
     for idx in range(num_frames):
         frame = thread.GetFrameAtIndex(idx)
         if not frame:
@@ -86,5 +94,5 @@ def _frame_lines(ctx: PaneContext, ptr_size: int, style) -> list[str]:
         role = "symbol" if name and name != "?" else "muted"
         name_text = style(ctx, name, role)
         addr_text = style(ctx, format_addr(pc, ptr_size), "addr")
-        lines.append(f"  {idx_text} {name_text} {addr_text}")
+        lines.append("  " + idx_text + " " + name_text + " " + addr_text)
     return lines
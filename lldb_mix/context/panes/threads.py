@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from lldb_mix.context.panes.base import Pane
+from lldb_mix.context.panes.base import TextPane
 from lldb_mix.context.types import PaneContext
+from lldb_mix.ui.styled import StyledText
 
 
 def _stop_reason_name(reason: int) -> str:
@@ -26,7 +27,7 @@ def _stop_reason_name(reason: int) -> str:
     return mapping.get(reason, str(reason))
 
 
-class ThreadsPane(Pane):
+class ThreadsPane(TextPane):
     name = "threads"
     column = 0
 
@@ -39,16 +40,16 @@ class ThreadsPane(Pane):
         except Exception:
             return False
 
-    def render(self, ctx: PaneContext) -> list[str]:
-        lines = [self.title(ctx)]
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
+        lines = [self.title_text(ctx)]
         process = ctx.process
         if not process:
-            lines.append("(process unavailable)")
+            lines.append(StyledText.plain("(process unavailable)"))
             return lines
 
         num_threads = process.GetNumThreads()
         if num_threads == 0:
-            lines.append("(no threads)")
+            lines.append(StyledText.plain("(no threads)"))
             return lines
 
         for idx in range(num_threads):
@@ -57,11 +58,11 @@ class ThreadsPane(Pane):
             reason = _stop_reason_name(thread.GetStopReason()) if thread else "unknown"
             name = thread.GetName() if thread and thread.GetName() else ""
             name_suffix = f" ({name})" if name else ""
-            idx_text = self.style(ctx, str(idx), "label")
-            tid_text = self.style(ctx, f"0x{tid:x}", "addr")
-            reason_text = self.style(ctx, reason, "muted")
+            idx_text = self.span(ctx, str(idx), "label")
+            tid_text = self.span(ctx, f"0x{tid:x}", "addr")
+            reason_text = self.span(ctx, reason, "muted")
             lines.append(
-                f"{idx_text}: tid={tid_text} reason={reason_text}{name_suffix}"
+                idx_text + ": tid=" + tid_text + " reason=" + reason_text + name_suffix
             )
 
         return lines
@@ -1,21 +1,22 @@
 from __future__ import annotations
 
 from lldb_mix.core.addressing import AddressResolver
-from lldb_mix.context.formatting import deref_summary, format_deref_suffix
-from lldb_mix.context.panes.base import Pane
+from lldb_mix.context.formatting import deref_summaries, format_deref_suffix
+from lldb_mix.context.panes.base import TextPane
 from lldb_mix.context.types import PaneContext
 from lldb_mix.deref import format_addr
+from lldb_mix.ui.styled import StyledText
 
 
-class WatchPane(Pane):
+class WatchPane(TextPane):
     name = "watch"
     column = 1
 
-    def render(self, ctx: PaneContext) -> list[str]:
-        lines = [self.title(ctx)]
+    def render_text(self, ctx: PaneContext) -> list[StyledText]:
+        lines = [self.title_text(ctx)]
         entries = ctx.watchlist.items()
         if not entries:
-            lines.append("(no watches)")
+            lines.append(StyledText.plain("(no watches)"))
             return lines
 
         snapshot = ctx.snapshot
@@ -23,26 +24,29 @@ class WatchPane(Pane):
         frame = _selected_frame(ctx.process)
         resolver = AddressResolver(snapshot.regs, snapshot.arch, frame)
 
-        for entry in entries:
-            expr_text = self.style(ctx, entry.expr, "reg_name")
-            idx_text = self.style(ctx, f"#{entry.wid}", "label")
-            label_text = ""
+        values = [resolver.resolve(entry.expr) for entry in entries]
+        summaries = iter(
+            deref_summaries(
+                ctx, [value for value in values if value is not None], ptr_size
+            )
+        )
+
+        for entry, value in zip(entries, values):
+            idx_text = self.span(ctx, f"#{entry.wid}", "label")
+            line = "  " + idx_text + " " + self.span(ctx, entry.expr, "reg_name")
             if entry.label:
-                label_text = f" ({self.style(ctx, entry.label, 'label')})"
-            sep = self.style(ctx, " = ", "label")
+                line = line + " (" + self.span(ctx, entry.label, "label") + ")"
+            line = line + self.span(ctx, " = ", "label")
 
-            value = resolver.resolve(entry.expr)
             if value is None:
-                unresolved = self.style(ctx, "<unresolved>", "muted")
-                lines.append(f"  {idx_text} {expr_text}{label_text}{sep}{unresolved}")
+                lines.append(line + self.span(ctx, "<unresolved>", "muted"))
                 continue
 
-            value_text = self.style(ctx, format_addr(value, ptr_size), "value")
-            line = f"  {idx_text} {expr_text}{label_text}{sep}{value_text}"
+            line = line + self.span(ctx, format_addr(value, ptr_size), "value")
 
-            info = deref_summary(ctx, value, ptr_size)
+            info = next(summaries)
             if info:
-                line = f"{line} {format_deref_suffix(self, ctx, info)}"
+                line = line + " " + format_deref_suffix(self, ctx, info)
 
             lines.append(line)
 
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from lldb_mix.context.budget import RenderBudget
+from lldb_mix.core.cfg import GraphCache
+from lldb_mix.core.disasm import InstructionCache
+from lldb_mix.core.profile import RenderProfiler
 from lldb_mix.core.settings import Settings
 from lldb_mix.core.snapshot import ContextSnapshot
 from lldb_mix.core.watchlist import WatchList
+from lldb_mix.deref import DerefCache
 from lldb_mix.ui.theme import Theme
 
 
@@ -21,3 +26,8 @@ class PaneContext:
     watchlist: WatchList
     term_width: int
     term_height: int
+    deref_cache: DerefCache | None = None
+    decode_cache: InstructionCache | None = None
+    graphs: GraphCache | None = None
+    profiler: RenderProfiler | None = None
+    budget: RenderBudget | None = None
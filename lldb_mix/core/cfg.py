@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any
+
+from lldb_mix.arch.view import ArchView
+from lldb_mix.core.disasm import FunctionDisasm, Instruction, InstructionCache
+from lldb_mix.deref import format_addr
+
+MAX_CACHED_GRAPHS = 64
+
+
+@dataclass(frozen=True)
+class BasicBlock:
+    start: int
+    end: int
+    first: int
+    last: int
+    kind: str
+
+    @property
+    def count(self) -> int:
+        return self.last - self.first + 1
+
+
+@dataclass(frozen=True)
+class Edge:
+    src: int
+    dst: int
+    kind: str
+
+
+class FunctionGraph:
+    def __init__(
+        self,
+        disasm: FunctionDisasm,
+        blocks: list[BasicBlock],
+        edges: list[Edge],
+    ):
+        self.disasm = disasm
+        self.blocks = blocks
+        self.edges = edges
+        self._starts = [block.start for block in blocks]
+
+    @property
+    def name(self) -> str:
+        return self.disasm.name
+
+    @property
+    def start(self) -> int:
+        return self.disasm.start
+
+    @property
+    def end(self) -> int:
+        return self.disasm.end
+
+    def block_at(self, addr: int) -> BasicBlock | None:
+        idx = bisect_right(self._starts, addr) - 1
+        if idx < 0:
+            return None
+        block = self.blocks[idx]
+        return block if addr < block.end else None
+
+    def successors(self, block: BasicBlock) -> list[Edge]:
+        return [edge for edge in self.edges if edge.src == block.start]
+
+    def instructions(self, block: BasicBlock) -> list[Instruction]:
+        return self.disasm.slice(block.first, block.last + 1)
+
+    def arm(self, addr: int, count: int) -> list[Instruction] | None:
+        idx = self.disasm.index_of(addr)
+        if idx is None:
+            return None
+        return self.disasm.slice(idx, idx + count)
+
+
+def build_graph(disasm: FunctionDisasm, arch: ArchView) -> FunctionGraph:
+    count = len(disasm)
+    kinds: list[str] = []
+    targets: list[int | None] = []
+    leaders = {disasm.start}
+    for idx in range(count):
+        inst = disasm.instruction(idx)
+        kind = _terminator_kind(inst.mnemonic, arch)
+        target = None
+        if kind in ("cond", "jump"):
+            target = arch.resolve_flow_target(inst.mnemonic, inst.operands, {})
+            if target is not None and disasm.index_of(target) is not None:
+                leaders.add(target)
+        if kind != "fall" and idx + 1 < count:
+            leaders.add(disasm.addrs[idx + 1])
+        kinds.append(kind)
+        targets.append(target)
+
+    blocks: list[BasicBlock] = []
+    first = 0
+    for idx in range(count):
+        at_end = idx + 1 >= count or disasm.addrs[idx + 1] in leaders
+        if not at_end:
+            continue
+        end = disasm.addrs[idx] + disasm.sizes[idx]
+        block = BasicBlock(disasm.addrs[first], end, first, idx, kinds[idx])
+        blocks.append(block)
+        first = idx + 1
+
+    edges: list[Edge] = []
+    for block in blocks:
+        target = targets[block.last]
+        if block.kind in ("cond", "jump") and target is not None:
+            edges.append(Edge(block.start, target, "taken"))
+        if block.kind in ("cond", "fall") and block.last + 1 < count:
+            edges.append(Edge(block.start, block.end, "fallthrough"))
+    return FunctionGraph(disasm, blocks, edges)
+
+
+def _terminator_kind(mnemonic: str, arch: ArchView) -> str:
+    kind = arch.classify(mnemonic)
+    if kind.call:
+        return "fall"
+    if kind.ret:
+        return "return"
+    if kind.conditional:
+        return "cond"
+    if kind.unconditional:
+        return "jump"
+    return "fall"
+
+
+class GraphCache:
+    def __init__(self, max_graphs: int = MAX_CACHED_GRAPHS):
+        self.max_graphs = max_graphs
+        self._graphs: dict[tuple[str, int, str], FunctionGraph] = {}
+
+    def get(
+        self,
+        decodes: InstructionCache,
+        target: Any,
+        addr: int,
+        arch: ArchView,
+    ) -> FunctionGraph | None:
+        flavor = arch.disasm_flavor()
+        disasm = decodes.function(target, addr, flavor)
+        if disasm is None:
+            return None
+        key = (arch.name, disasm.start, flavor)
+        graph = self._graphs.get(key)
+        if graph is not None and graph.disasm is disasm:
+            return graph
+        graph = build_graph(disasm, arch)
+        if len(self._graphs) >= self.max_graphs:
+            self._graphs.clear()
+        self._graphs[key] = graph
+        return graph
+
+    def clear(self) -> None:
+        self._graphs.clear()
+
+
+def format_graph_text(graph: FunctionGraph, ptr_size: int) -> list[str]:
+    lines: list[str] = []
+    for block in graph.blocks:
+        succ = ", ".join(
+            f"{format_addr(edge.dst, ptr_size)} ({edge.kind})"
+            for edge in graph.successors(block)
+        )
+        start = format_addr(block.start, ptr_size)
+        end = format_addr(block.end, ptr_size)
+        header = f"block {start}-{end} [{block.kind}]"
+        if succ:
+            header += f" -> {succ}"
+        lines.append(header)
+        for inst in graph.instructions(block):
+            lines.append(f"  {_inst_line(inst, ptr_size)}")
+    return lines
+
+
+def format_graph_dot(graph: FunctionGraph, ptr_size: int) -> list[str]:
+    name = _dot_escape(graph.name or format_addr(graph.start, ptr_size))
+    lines = [f'digraph "{name}" {{', '  node [shape=box fontname="monospace"];']
+    for block in graph.blocks:
+        body = "".join(
+            _dot_escape(_inst_line(inst, ptr_size)) + "\\l"
+            for inst in graph.instructions(block)
+        )
+        lines.append(f'  "{format_addr(block.start, ptr_size)}" [label="{body}"];')
+    for edge in graph.edges:
+        src = format_addr(edge.src, ptr_size)
+        dst = format_addr(edge.dst, ptr_size)
+        lines.append(f'  "{src}" -> "{dst}" [label="{edge.kind}"];')
+    lines.append("}")
+    return lines
+
+
+def _inst_line(inst: Instruction, ptr_size: int) -> str:
+    text = f"{format_addr(inst.address, ptr_size)} {inst.mnemonic}"
+    if inst.operands:
+        text += f" {inst.operands}"
+    return text
+
+
+def _dot_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"')
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import mmap
+import os
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import Any
+
+from lldb_mix.core.memory import (
+    PAGE_SIZE,
+    MemoryRegion,
+    ProcessMemoryReader,
+    find_region,
+)
+from lldb_mix.core.modules import module_fullpath
+from lldb_mix.core.patches import PatchStore
+
+VERIFY_BYTES = 64
+MAX_UNMAPPED_PAGES = 4096
+
+
+class CodeBytes:
+    def __init__(self, patches: PatchStore | None = None):
+        self.patches = patches
+        self.hits = 0
+        self.fallbacks = 0
+        self._target: Any = None
+        self._process: Any = None
+        self._key: tuple[int, int] | None = None
+        self._regions: Iterable[MemoryRegion] | None = None
+        self._starts: list[int] = []
+        self._spans: list[tuple[int, int, int, mmap.mmap]] = []
+        self._modules: set[str] = set()
+        self._unmapped: set[int] = set()
+        self._files: dict[str, mmap.mmap | None] = {}
+
+    def bind(
+        self, process: Any, regions: Iterable[MemoryRegion] | None = None
+    ) -> None:
+        key = _process_key(process)
+        if key is None or key != self._key:
+            self.close()
+        self._key = key
+        self._process = process
+        self._target = process.GetTarget() if key is not None else None
+        self._regions = regions
+
+    def close(self) -> None:
+        self._starts = []
+        self._spans = []
+        self._modules.clear()
+        self._unmapped.clear()
+        for data in self._files.values():
+            if data is not None:
+                data.close()
+        self._files.clear()
+
+    def read(self, addr: int, size: int) -> bytes | None:
+        if size <= 0 or self._key is None:
+            return None
+        span = self._find(addr)
+        if span is None and self._load_module(addr):
+            span = self._find(addr)
+        if span is None:
+            return None
+        start, end, offset, data = span
+        end = min(end, addr + size)
+        if self._volatile(addr, end):
+            self.fallbacks += 1
+            return None
+        self.hits += 1
+        begin = offset + addr - start
+        return data[begin : begin + end - addr]
+
+    def _find(self, addr: int) -> tuple[int, int, int, mmap.mmap] | None:
+        idx = bisect_right(self._starts, addr) - 1
+        if idx < 0:
+            return None
+        span = self._spans[idx]
+        return span if addr < span[1] else None
+
+    def _volatile(self, start: int, end: int) -> bool:
+        if self._regions is not None:
+            region = find_region(start, self._regions)
+            if region is None or region.write or region.end < end:
+                return True
+        if self.patches is not None:
+            for entry in self.patches.list():
+                if entry.addr < end and start < entry.addr + entry.size:
+                    return True
+        return False
+
+    def _load_module(self, addr: int) -> bool:
+        page = addr // PAGE_SIZE
+        if page in self._unmapped or not self._target:
+            return False
+        module = _module_at(self._target, addr)
+        path = module_fullpath(module) if module is not None else ""
+        if not path or path in self._modules:
+            if len(self._unmapped) >= MAX_UNMAPPED_PAGES:
+                self._unmapped.clear()
+            self._unmapped.add(page)
+            return False
+        self._modules.add(path)
+        data = self._file(path)
+        if data is None:
+            return False
+        reader = ProcessMemoryReader(self._process)
+        added = False
+        for start, end, offset in _code_sections(self._target, module):
+            if offset + end - start > len(data):
+                continue
+            if not _verify(reader, data, start, end, offset):
+                continue
+            idx = bisect_right(self._starts, start)
+            self._starts.insert(idx, start)
+            self._spans.insert(idx, (start, end, offset, data))
+            added = True
+        return added
+
+    def _file(self, path: str) -> mmap.mmap | None:
+        if not path:
+            return None
+        if path in self._files:
+            return self._files[path]
+        data = None
+        try:
+            if os.path.isfile(path):
+                with open(path, "rb") as handle:
+                    data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            data = None
+        self._files[path] = data
+        return data
+
+
+def _process_key(process: Any) -> tuple[int, int] | None:
+    try:
+        if not process or not process.IsValid():
+            return None
+        target = process.GetTarget()
+        return int(process.GetUniqueID()), int(target.GetNumModules())
+    except Exception:
+        return None
+
+
+def _module_at(target: Any, addr: int) -> Any:
+    try:
+        module = target.ResolveLoadAddress(addr).GetModule()
+    except Exception:
+        return None
+    if not module or not module.IsValid():
+        return None
+    return module
+
+
+def _code_sections(target: Any, module: Any) -> list[tuple[int, int, int]]:
+    try:
+        import lldb
+    except Exception:
+        return []
+    sections = []
+    try:
+        for idx in range(module.GetNumSections()):
+            section = module.GetSectionAtIndex(idx)
+            if not section or not section.IsValid():
+                continue
+            perms = section.GetPermissions()
+            if not perms & lldb.ePermissionsExecutable:
+                continue
+            if perms & lldb.ePermissionsWritable:
+                continue
+            start = section.GetLoadAddress(target)
+            size = min(section.GetByteSize(), section.GetFileByteSize())
+            if start == lldb.LLDB_INVALID_ADDRESS or size <= 0:
+                continue
+            sections.append((start, start + size, section.GetFileOffset()))
+    except Exception:
+        return []
+    return sections
+
+
+def _verify(
+    reader: ProcessMemoryReader, data: mmap.mmap, start: int, end: int, offset: int
+) -> bool:
+    size = min(VERIFY_BYTES, end - start)
+    live = reader.read(start, size)
+    return bool(live) and live == data[offset : offset + size]
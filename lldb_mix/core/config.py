@@ -209,6 +209,42 @@ def _parse_pointer_mode(tokens: list[str]) -> str:
     raise ValueError("invalid pointer mode (choices: smart, all)")
 
 
+def _parse_region_cache(tokens: list[str]) -> str:
+    if len(tokens) != 1:
+        raise ValueError("expected one value")
+    value = tokens[0].strip().lower()
+    if value in ("stop", "modules"):
+        return value
+    raise ValueError("invalid region cache mode (choices: stop, modules)")
+
+
+def _parse_render_mode(tokens: list[str]) -> str:
+    if len(tokens) != 1:
+        raise ValueError("expected one value")
+    value = tokens[0].strip().lower()
+    if value in ("full", "diff"):
+        return value
+    raise ValueError("invalid render mode (choices: full, diff)")
+
+
+def _parse_register_capture(tokens: list[str]) -> str:
+    if len(tokens) != 1:
+        raise ValueError("expected one value")
+    value = tokens[0].strip().lower()
+    if value in ("gpr", "all"):
+        return value
+    raise ValueError("invalid register capture (choices: gpr, all)")
+
+
+def _parse_memory_backend(tokens: list[str]) -> str:
+    if len(tokens) != 1:
+        raise ValueError("expected one value")
+    value = tokens[0].strip().lower()
+    if value in ("auto", "lldb"):
+        return value
+    raise ValueError("invalid memory backend (choices: auto, lldb)")
+
+
 def _fmt_bool(value: object) -> str:
     return "on" if bool(value) else "off"
 
@@ -267,6 +303,22 @@ def _is_pointer_mode(value: object) -> bool:
     return isinstance(value, str) and value in ("smart", "all")
 
 
+def _is_region_cache(value: object) -> bool:
+    return isinstance(value, str) and value in ("stop", "modules")
+
+
+def _is_render_mode(value: object) -> bool:
+    return isinstance(value, str) and value in ("full", "diff")
+
+
+def _is_register_capture(value: object) -> bool:
+    return isinstance(value, str) and value in ("gpr", "all")
+
+
+def _is_memory_backend(value: object) -> bool:
+    return isinstance(value, str) and value in ("auto", "lldb")
+
+
 _SPECS: list[SettingSpec] = [
     SettingSpec(
         key="enable_color",
@@ -396,4 +448,44 @@ _SPECS: list[SettingSpec] = [
         format=_fmt_bool,
         validate=_is_bool,
     ),
+    SettingSpec(
+        key="region_cache",
+        attr="region_cache",
+        type_name="region_cache",
+        parse=_parse_region_cache,
+        format=_fmt_value,
+        validate=_is_region_cache,
+    ),
+    SettingSpec(
+        key="memory_backend",
+        attr="memory_backend",
+        type_name="memory_backend",
+        parse=_parse_memory_backend,
+        format=_fmt_value,
+        validate=_is_memory_backend,
+    ),
+    SettingSpec(
+        key="render_mode",
+        attr="render_mode",
+        type_name="render_mode",
+        parse=_parse_render_mode,
+        format=_fmt_value,
+        validate=_is_render_mode,
+    ),
+    SettingSpec(
+        key="render_budget_ms",
+        attr="render_budget_ms",
+        type_name="int",
+        parse=_parse_int,
+        format=_fmt_value,
+        validate=_is_int_nonneg,
+    ),
+    SettingSpec(
+        key="register_capture",
+        attr="register_capture",
+        type_name="register_capture",
+        parse=_parse_register_capture,
+        format=_fmt_value,
+        validate=_is_register_capture,
+    ),
 ]
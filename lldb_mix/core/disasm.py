@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Protocol
 
 from lldb_mix.arch.view import ArchView
-from lldb_mix.core.memory import MemoryRegion
+from lldb_mix.core.memory import MemoryRegion, find_region
+from lldb_mix.core.symbols import SymbolRange, symbol_range
+
+MAX_CACHED_INSTRUCTIONS = 8192
+MAX_ANCHOR_DISTANCE = 0x1000
+MAX_FETCH_BYTES = 16
+MAX_FUNCTION_BYTES = 0x10000
+MAX_CACHED_FUNCTIONS = 64
 
 
 @dataclass(frozen=True)
@@ -58,8 +68,316 @@ def disasm_flavor(arch) -> str:
     return ""
 
 
+class FunctionDisasm:
+    __slots__ = ("name", "start", "end", "addrs", "sizes", "code", "text", "offsets")
+
+    def __init__(
+        self,
+        name: str,
+        start: int,
+        end: int,
+        addrs: array,
+        sizes: array,
+        code: bytes,
+        text: str,
+        offsets: array,
+    ):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.addrs = addrs
+        self.sizes = sizes
+        self.code = code
+        self.text = text
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, name: str, insts: list[Instruction]) -> FunctionDisasm:
+        addrs = array("Q")
+        sizes = array("H")
+        offsets = array("I", [0])
+        code = bytearray()
+        parts: list[str] = []
+        length = 0
+        for inst in insts:
+            addrs.append(inst.address)
+            sizes.append(inst.byte_size)
+            code += inst.opcode_bytes.ljust(inst.byte_size, b"\x00")
+            for part in (inst.mnemonic or "", inst.operands or ""):
+                parts.append(part)
+                length += len(part)
+                offsets.append(length)
+        start = insts[0].address
+        end = insts[-1].address + insts[-1].byte_size
+        return cls(name, start, end, addrs, sizes, bytes(code), "".join(parts), offsets)
+
+    def __len__(self) -> int:
+        return len(self.addrs)
+
+    def __contains__(self, addr: int) -> bool:
+        return self.start <= addr < self.end
+
+    def index_of(self, addr: int) -> int | None:
+        idx = bisect_right(self.addrs, addr) - 1
+        if idx < 0 or self.addrs[idx] != addr:
+            return None
+        return idx
+
+    def instruction(self, idx: int) -> Instruction:
+        addr = self.addrs[idx]
+        size = self.sizes[idx]
+        offset = addr - self.start
+        text, offsets = self.text, self.offsets
+        return Instruction(
+            address=addr,
+            bytes=self.code[offset : offset + size],
+            mnemonic=text[offsets[idx * 2] : offsets[idx * 2 + 1]],
+            operands=text[offsets[idx * 2 + 1] : offsets[idx * 2 + 2]],
+            byte_size=size,
+        )
+
+    def slice(self, start: int, end: int) -> list[Instruction]:
+        end = min(end, len(self.addrs))
+        return [self.instruction(idx) for idx in range(max(start, 0), end)]
+
+
+class CodeBytesProvider(Protocol):
+    def bind(
+        self, process: Any, regions: Iterable[MemoryRegion] | None = None
+    ) -> None: ...
+
+    def read(self, addr: int, size: int) -> bytes | None: ...
+
+
+class SymbolRangeProvider(Protocol):
+    def bind(self, target: Any) -> "SymbolRangeProvider": ...
+
+    def lookup(self, addr: int) -> SymbolRange | None: ...
+
+
+class InstructionCache:
+    def __init__(
+        self,
+        max_entries: int = MAX_CACHED_INSTRUCTIONS,
+        code_bytes: CodeBytesProvider | None = None,
+        symbols: SymbolRangeProvider | None = None,
+    ):
+        self.max_entries = max_entries
+        self.code_bytes = code_bytes
+        self.symbols = symbols
+        self.hits = 0
+        self.misses = 0
+        self._key: tuple[int, int] | None = None
+        self._stop: int | None = None
+        self._regions: Iterable[MemoryRegion] | None = None
+        self._insts: dict[tuple[int, str], Instruction] = {}
+        self._volatile: set[tuple[int, str]] = set()
+        self._boundaries: dict[tuple[int | None, str], list[int]] = {}
+        self._functions: dict[str, dict[int, FunctionDisasm]] = {}
+        self._function_starts: dict[str, list[int]] = {}
+        self._no_function: set[tuple[int, str]] = set()
+
+    def bind(
+        self, process: Any, regions: Iterable[MemoryRegion] | None = None
+    ) -> None:
+        key, stop = _process_code_key(process)
+        if key is None or key != self._key:
+            self.invalidate()
+        elif stop != self._stop:
+            for entry in self._volatile:
+                self._insts.pop(entry, None)
+            self._volatile.clear()
+            for bucket in list(self._boundaries):
+                start = bucket[0]
+                region = None if start is None else find_region(start, regions or [])
+                if region is None or region.write:
+                    del self._boundaries[bucket]
+            for flavor, functions in self._functions.items():
+                for start in list(functions):
+                    region = find_region(start, regions or [])
+                    if region is None or region.write:
+                        del functions[start]
+                self._function_starts[flavor] = sorted(functions)
+            for entry in list(self._no_function):
+                region = find_region(entry[0], regions or [])
+                if region is None or region.write:
+                    self._no_function.discard(entry)
+        self._key = key
+        self._stop = stop
+        self._regions = regions
+        if self.code_bytes is not None:
+            self.code_bytes.bind(process, regions)
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self) -> None:
+        self._insts.clear()
+        self._volatile.clear()
+        self._boundaries.clear()
+        self._functions.clear()
+        self._function_starts.clear()
+        self._no_function.clear()
+
+    def function(self, target: Any, addr: int, flavor: str) -> FunctionDisasm | None:
+        cached = self._cached_function(addr, flavor)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        found = self._symbol_range(target, addr)
+        if not found:
+            return None
+        info, start, end = found
+        functions = self._functions.setdefault(flavor, {})
+        if start in functions:
+            return functions[start]
+        if (start, flavor) in self._no_function:
+            return None
+        if end <= start or end - start > MAX_FUNCTION_BYTES:
+            self._skip_function(start, flavor)
+            return None
+        self.misses += 1
+        insts = self._decode_range(target, start, end, flavor)
+        if not insts or insts[0].address != start:
+            self._skip_function(start, flavor)
+            return None
+        disasm = FunctionDisasm.build(info.name, insts)
+        if len(functions) >= MAX_CACHED_FUNCTIONS:
+            functions.clear()
+        functions[start] = disasm
+        self._function_starts[flavor] = sorted(functions)
+        return disasm
+
+    def _symbol_range(self, target: Any, addr: int) -> SymbolRange | None:
+        if self.symbols is None:
+            return symbol_range(target, addr)
+        return self.symbols.bind(target).lookup(addr)
+
+    def _skip_function(self, start: int, flavor: str) -> None:
+        if len(self._no_function) >= MAX_CACHED_FUNCTIONS:
+            self._no_function.clear()
+        self._no_function.add((start, flavor))
+
+    def _cached_function(self, addr: int, flavor: str) -> FunctionDisasm | None:
+        starts = self._function_starts.get(flavor)
+        if not starts:
+            return None
+        idx = bisect_right(starts, addr) - 1
+        if idx < 0:
+            return None
+        disasm = self._functions[flavor][starts[idx]]
+        return disasm if addr in disasm else None
+
+    def _decode_range(
+        self, target: Any, start: int, end: int, flavor: str
+    ) -> list[Instruction]:
+        insts: list[Instruction] = []
+        current = start
+        while current < end:
+            count = (end - current) // 2 + 1
+            chunk = _decode_instructions(
+                target, current, count, flavor, self.code_bytes
+            )
+            progressed = False
+            for inst in chunk:
+                if current >= end or inst.address != current or inst.byte_size <= 0:
+                    break
+                insts.append(inst)
+                current += inst.byte_size
+                progressed = True
+            if not progressed:
+                break
+        return insts
+
+    def mark_boundaries(self, insts: Iterable[Instruction], flavor: str) -> None:
+        for inst in insts:
+            bounds = self._boundaries.setdefault(self._bucket(inst.address, flavor), [])
+            idx = bisect_right(bounds, inst.address)
+            if idx and bounds[idx - 1] == inst.address:
+                continue
+            bounds.insert(idx, inst.address)
+
+    def boundary_before(self, addr: int, count: int, flavor: str) -> int | None:
+        bounds = self._boundaries.get(self._bucket(addr, flavor))
+        if not bounds:
+            return None
+        idx = bisect_right(bounds, addr) - 1
+        if idx < 0:
+            return None
+        idx -= count if bounds[idx] == addr else count - 1
+        anchor = bounds[max(idx, 0)]
+        if addr - anchor > MAX_ANCHOR_DISTANCE:
+            return None
+        return anchor
+
+    def _bucket(self, addr: int, flavor: str) -> tuple[int | None, str]:
+        region = find_region(addr, self._regions or [])
+        return (region.start if region else None), flavor
+
+    def read(
+        self, target: Any, addr: int, count: int, flavor: str
+    ) -> list[Instruction]:
+        disasm = self._cached_function(addr, flavor)
+        if disasm is not None:
+            idx = disasm.index_of(addr)
+            if idx is not None and idx + count <= len(disasm):
+                self.hits += 1
+                return disasm.slice(idx, idx + count)
+        output: list[Instruction] = []
+        current = addr
+        while len(output) < count:
+            inst = self._insts.get((current, flavor))
+            if inst is None or inst.byte_size <= 0:
+                break
+            output.append(inst)
+            current += inst.byte_size
+        if len(output) >= count:
+            self.hits += 1
+            return output
+        self.misses += 1
+        decoded = _decode_instructions(
+            target, current, count - len(output), flavor, self.code_bytes
+        )
+        if len(self._insts) + len(decoded) > self.max_entries:
+            self._insts.clear()
+            self._volatile.clear()
+        for inst in decoded:
+            entry = (inst.address, flavor)
+            self._insts[entry] = inst
+            region = find_region(inst.address, self._regions or [])
+            if region is None or region.write:
+                self._volatile.add(entry)
+        return output + decoded
+
+
+def _process_code_key(process: Any) -> tuple[tuple[int, int] | None, int | None]:
+    try:
+        if not process or not process.IsValid():
+            return None, None
+        target = process.GetTarget()
+        key = (int(process.GetUniqueID()), int(target.GetNumModules()))
+        return key, int(process.GetStopID(True))
+    except Exception:
+        return None, None
+
+
 def read_instructions(
-    target: Any, addr: int, count: int, flavor: str = "intel"
+    target: Any,
+    addr: int,
+    count: int,
+    flavor: str = "intel",
+    cache: InstructionCache | None = None,
+) -> list[Instruction]:
+    if cache is not None:
+        return cache.read(target, addr, count, flavor)
+    return _decode_instructions(target, addr, count, flavor)
+
+
+def _decode_instructions(
+    target: Any,
+    addr: int,
+    count: int,
+    flavor: str,
+    code_bytes: CodeBytesProvider | None = None,
 ) -> list[Instruction]:
     try:
         import lldb
@@ -71,7 +389,25 @@ def read_instructions(
 
     sb_addr = lldb.SBAddress()
     sb_addr.SetLoadAddress(addr, target)
+    data = code_bytes.read(addr, count * MAX_FETCH_BYTES) if code_bytes else None
+    if data:
+        insts = target.GetInstructionsWithFlavor(sb_addr, flavor, data)
+        output = _convert_instructions(target, insts)[:count]
+        if output and len(output) < count:
+            last = output[-1]
+            output.extend(
+                _decode_instructions(
+                    target, last.address + last.byte_size, count - len(output), flavor
+                )
+            )
+        if output:
+            return output
+
     insts = target.ReadInstructions(sb_addr, count, flavor)
+    return _convert_instructions(target, insts)
+
+
+def _convert_instructions(target: Any, insts: Any) -> list[Instruction]:
     output: list[Instruction] = []
     for inst in insts:
         inst_addr = inst.GetAddress().GetLoadAddress(target)
@@ -98,36 +434,109 @@ def read_instructions_around(
     before: int,
     after: int,
     arch: ArchView,
-    regions: list[MemoryRegion] | None = None,
+    regions: Iterable[MemoryRegion] | None = None,
     flavor: str = "intel",
+    cache: InstructionCache | None = None,
+    resolver: Any = None,
 ) -> list[Instruction]:
     total = before + after + 1
     if pc is None or total <= 0:
         return []
 
     if before <= 0:
-        return read_instructions(target, pc, total, flavor)
+        return read_instructions(target, pc, total, flavor, cache)
+
+    if cache is not None:
+        disasm = cache.function(target, pc, flavor)
+        idx = disasm.index_of(pc) if disasm is not None else None
+        if idx is not None and before <= idx < len(disasm) - after:
+            return disasm.slice(idx - before, idx + after + 1)
+
+    region = find_region(pc, regions) if regions else None
+    floor = region.start if region else 0
+    for anchor in _anchors(pc, before, floor, flavor, cache, resolver):
+        insts = _decode_from(target, anchor, pc, after, flavor, cache)
+        if insts is None:
+            continue
+        idx = len(insts) - after - 1
+        if idx < before and anchor > floor:
+            continue
+        if cache is not None:
+            cache.mark_boundaries(insts, flavor)
+        return insts[max(0, idx - before) :]
 
     max_inst = max(arch.max_inst_bytes, 1)
     start = pc - (before * max_inst)
     if start < 0:
         start = 0
-    if regions:
-        region = next((region for region in regions if region.contains(pc)), None)
-        if region and start < region.start:
-            start = region.start
-            if start > pc:
-                return read_instructions(target, pc, total, flavor)
+    if region and start < region.start:
+        start = region.start
+        if start > pc:
+            return read_instructions(target, pc, total, flavor, cache)
 
     fetch_count = total + before * 3
-    insts = read_instructions(target, start, fetch_count, flavor)
+    insts = read_instructions(target, start, fetch_count, flavor, cache)
     if not insts:
         return []
 
     idx = next((i for i, inst in enumerate(insts) if inst.address == pc), None)
     if idx is None:
-        return read_instructions(target, pc, total, flavor)
+        return read_instructions(target, pc, total, flavor, cache)
 
     start_idx = max(0, idx - before)
     end_idx = min(len(insts), idx + after + 1)
+    if cache is not None:
+        cache.mark_boundaries(insts[idx:end_idx], flavor)
     return insts[start_idx:end_idx]
+
+
+def _anchors(
+    pc: int,
+    before: int,
+    floor: int,
+    flavor: str,
+    cache: InstructionCache | None,
+    resolver: Any,
+) -> list[int]:
+    anchors: list[int] = []
+    if cache is not None:
+        anchor = cache.boundary_before(pc, before, flavor)
+        if anchor is not None and anchor < pc:
+            anchors.append(anchor)
+    if resolver is not None:
+        symbol = resolver.resolve(pc)
+        if symbol and 0 < symbol.offset <= MAX_ANCHOR_DISTANCE:
+            anchor = pc - symbol.offset
+            if anchor >= floor and anchor not in anchors:
+                anchors.append(anchor)
+    return sorted(anchors, reverse=True)
+
+
+def _decode_from(
+    target: Any,
+    anchor: int,
+    pc: int,
+    after: int,
+    flavor: str,
+    cache: InstructionCache | None,
+) -> list[Instruction] | None:
+    insts: list[Instruction] = []
+    current = anchor
+    while current < pc:
+        count = (pc - current) // 2 + 1
+        chunk = read_instructions(target, current, count, flavor, cache)
+        if not chunk:
+            return None
+        for inst in chunk:
+            if current >= pc:
+                break
+            if inst.address != current or inst.byte_size <= 0:
+                return None
+            insts.append(inst)
+            current += inst.byte_size
+    if current != pc:
+        return None
+    tail = read_instructions(target, pc, after + 1, flavor, cache)
+    if not tail or tail[0].address != pc:
+        return None
+    return insts + tail
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import re
+
+_ENTRY = re.compile(r"^\s*(\d+):\s?(.*)$")
+_STEP_COMMANDS = {"s", "si", "n", "ni", "step", "stepi", "next", "nexti"}
+_STEP_PREFIXES = ("thread step-in", "thread step-over", "thread step-inst")
+
+HistoryEntry = tuple[int, str]
+
+
+def last_history_entry(output: str) -> HistoryEntry | None:
+    for line in reversed(output.splitlines()):
+        match = _ENTRY.match(line)
+        if match:
+            return int(match.group(1)), match.group(2).strip()
+    return None
+
+
+def is_step_command(command: str) -> bool:
+    text = " ".join(command.split())
+    if text.split(" ", 1)[0] in _STEP_COMMANDS:
+        return True
+    return text.startswith(_STEP_PREFIXES)
+
+
+StopKey = tuple[int, int]
+
+
+class HistoryWatch:
+    def __init__(self) -> None:
+        self._mark: HistoryEntry | None = None
+        self._stop: StopKey | None = None
+
+    def reset(self) -> None:
+        self._mark = None
+        self._stop = None
+
+    def quiet_step(self, output: str, stop: StopKey | None) -> bool:
+        mark = last_history_entry(output)
+        previous, self._mark = self._mark, mark
+        last_stop, self._stop = self._stop, stop
+        if mark is None or previous is None or stop is None or last_stop is None:
+            return False
+        if stop[0] != last_stop[0] or stop[1] != last_stop[1] + 1:
+            return False
+        if mark == previous:
+            return True
+        return mark[0] == previous[0] + 1 and is_step_command(mark[1])
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
+import os
+import sys
 from typing import Any
 
+PAGE_SIZE = 0x1000
+MAX_CACHED_PAGES = 16
+MAX_PROC_BUFFER = 16 * PAGE_SIZE
+
 
 @dataclass(frozen=True)
 class MemoryRegion:
@@ -17,6 +25,81 @@ class MemoryRegion:
         return self.start <= addr < self.end
 
 
+class RegionMap:
+    __slots__ = ("_regions", "_ends")
+
+    def __init__(self, regions: Iterable[MemoryRegion] = ()):
+        ordered = sorted(regions, key=lambda region: (region.start, region.end))
+        self._regions: tuple[MemoryRegion, ...] = tuple(ordered)
+        self._ends: tuple[int, ...] = tuple(region.end for region in ordered)
+
+    @classmethod
+    def of(cls, regions: Iterable[MemoryRegion] | None) -> "RegionMap":
+        if isinstance(regions, RegionMap):
+            return regions
+        return cls(regions or ())
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __iter__(self) -> Iterator[MemoryRegion]:
+        return iter(self._regions)
+
+    def __getitem__(self, idx: int) -> MemoryRegion:
+        return self._regions[idx]
+
+    def find(self, addr: int) -> MemoryRegion | None:
+        idx = bisect_right(self._ends, addr)
+        if idx >= len(self._regions):
+            return None
+        region = self._regions[idx]
+        if region.start <= addr:
+            return region
+        return None
+
+    def overlaps(self, start: int, end: int) -> list[MemoryRegion]:
+        if end <= start:
+            return []
+        out: list[MemoryRegion] = []
+        idx = bisect_right(self._ends, start)
+        while idx < len(self._regions):
+            region = self._regions[idx]
+            if region.start >= end:
+                break
+            out.append(region)
+            idx += 1
+        return out
+
+    def next_readable(self, addr: int) -> MemoryRegion | None:
+        idx = bisect_right(self._ends, addr)
+        while idx < len(self._regions):
+            region = self._regions[idx]
+            if region.read:
+                return region
+            idx += 1
+        return None
+
+
+def find_region(addr: int, regions: Iterable[MemoryRegion]) -> MemoryRegion | None:
+    if isinstance(regions, RegionMap):
+        return regions.find(addr)
+    for region in regions:
+        if region.contains(addr):
+            return region
+    return None
+
+
+class ReadCounters:
+    __slots__ = ("reads", "bytes")
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.bytes = 0
+
+
+READ_COUNTERS = ReadCounters()
+
+
 class ProcessMemoryReader:
     def __init__(self, process: Any):
         self.process = process
@@ -32,8 +115,10 @@ class ProcessMemoryReader:
 
         error = lldb.SBError()
         data = self.process.ReadMemory(addr, size, error)
+        READ_COUNTERS.reads += 1
         if not error.Success():
             return None
+        READ_COUNTERS.bytes += len(data)
         return data
 
     def read_pointer(self, addr: int, ptr_size: int) -> int | None:
@@ -42,6 +127,411 @@ class ProcessMemoryReader:
             return None
         return int.from_bytes(data[:ptr_size], byteorder="little")
 
+    def read_many(self, ranges: Sequence[tuple[int, int]]) -> list[bytes | None]:
+        return read_ranges(self.read, ranges)
+
+    def stop_key(self) -> tuple[int, int] | None:
+        return process_stop_key(self.process)
+
+
+class ProcMemReader:
+    def __init__(
+        self,
+        fd: int,
+        fallback: ProcessMemoryReader,
+        code_regions: Callable[[Any], RegionMap] | None = None,
+    ):
+        self.fd = fd
+        self.fallback = fallback
+        self.code_regions = code_regions
+        self._buffer = bytearray(PAGE_SIZE)
+
+    @property
+    def process(self) -> Any:
+        return self.fallback.process
+
+    @classmethod
+    def open(
+        cls,
+        process: Any,
+        code_regions: Callable[[Any], RegionMap] | None = None,
+    ) -> "ProcMemReader | None":
+        pid = _local_linux_pid(process)
+        if pid is None:
+            return None
+        try:
+            fd = os.open(f"/proc/{pid}/mem", os.O_RDONLY)
+        except OSError:
+            return None
+        reader = cls(fd, ProcessMemoryReader(process), code_regions)
+        if not reader._verify():
+            reader.close()
+            return None
+        return reader
+
+    def close(self) -> None:
+        if self.fd < 0:
+            return
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+        self.fd = -1
+
+    def read(self, addr: int, size: int) -> bytes | None:
+        return self._read(addr, size, self._code_map())
+
+    def read_pointer(self, addr: int, ptr_size: int) -> int | None:
+        data = self.read(addr, ptr_size)
+        if not data or len(data) < ptr_size:
+            return None
+        return int.from_bytes(data[:ptr_size], byteorder="little")
+
+    def read_many(self, ranges: Sequence[tuple[int, int]]) -> list[bytes | None]:
+        regions = self._code_map()
+        return read_ranges(lambda addr, size: self._read(addr, size, regions), ranges)
+
+    def stop_key(self) -> tuple[int, int] | None:
+        return self.fallback.stop_key()
+
+    def _read(self, addr: int, size: int, regions: RegionMap | None) -> bytes | None:
+        if self.fd < 0 or size <= 0 or addr < 0:
+            return self.fallback.read(addr, size)
+        if regions is not None and _touches_code(regions, addr, size):
+            return self.fallback.read(addr, size)
+        view = memoryview(self._scratch(size))[:size]
+        try:
+            count = _pread_into(self.fd, view, addr)
+        except (OSError, OverflowError, ValueError):
+            count = -1
+        READ_COUNTERS.reads += 1
+        if count != size:
+            return self.fallback.read(addr, size)
+        READ_COUNTERS.bytes += size
+        return bytes(view)
+
+    def _scratch(self, size: int) -> bytearray:
+        if size > MAX_PROC_BUFFER:
+            return bytearray(size)
+        if len(self._buffer) < size:
+            self._buffer = bytearray(size)
+        return self._buffer
+
+    def _code_map(self) -> RegionMap | None:
+        if not self.code_regions:
+            return None
+        return self.code_regions(self.process)
+
+    def _verify(self) -> bool:
+        if not self.code_regions:
+            return True
+        regions = self.code_regions(self.process)
+        region = next(
+            (region for region in regions if region.read and not region.execute),
+            None,
+        )
+        if not region:
+            return True
+        size = min(region.end - region.start, 64)
+        return self.read(region.start, size) == self.fallback.read(region.start, size)
+
+
+class ReaderSelector:
+    def __init__(self, code_regions: Callable[[Any], RegionMap] | None = None):
+        self.code_regions = code_regions
+        self._key: tuple[int, str] | None = None
+        self._reader: ProcessMemoryReader | ProcMemReader | None = None
+
+    def get(
+        self, process: Any, backend: str = "auto"
+    ) -> ProcessMemoryReader | ProcMemReader:
+        stop_key = process_stop_key(process)
+        if stop_key is None:
+            return ProcessMemoryReader(process)
+        key = (stop_key[0], backend)
+        if self._reader is not None and key == self._key:
+            return self._reader
+        self.close()
+        reader: ProcessMemoryReader | ProcMemReader | None = None
+        if backend == "auto":
+            reader = ProcMemReader.open(process, self.code_regions)
+        if reader is None:
+            reader = ProcessMemoryReader(process)
+        self._key = key
+        self._reader = reader
+        return reader
+
+    def close(self) -> None:
+        if isinstance(self._reader, ProcMemReader):
+            self._reader.close()
+        self._key = None
+        self._reader = None
+
+
+def _touches_code(regions: RegionMap, addr: int, size: int) -> bool:
+    return any(region.execute for region in regions.overlaps(addr, addr + size))
+
+
+def _local_linux_pid(process: Any) -> int | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    if not process:
+        return None
+    try:
+        if not process.IsValid():
+            return None
+        plugin = (process.GetPluginName() or "").lower()
+        if "core" in plugin or "minidump" in plugin:
+            return None
+        platform = process.GetTarget().GetPlatform()
+        if not platform or (platform.GetName() or "") != "host":
+            return None
+        pid = int(process.GetProcessID())
+    except Exception:
+        return None
+    if pid <= 0:
+        return None
+    return pid
+
+
+def _pread_into(fd: int, view: memoryview, addr: int) -> int:
+    if hasattr(os, "preadv"):
+        return os.preadv(fd, [view], addr)
+    data = os.pread(fd, len(view), addr)
+    view[: len(data)] = data
+    return len(data)
+
+
+@dataclass(frozen=True)
+class ReadStats:
+    hits: int
+    misses: int
+
+
+class CachedMemoryReader:
+    def __init__(
+        self,
+        reader: Any,
+        page_size: int = PAGE_SIZE,
+        max_pages: int = MAX_CACHED_PAGES,
+    ):
+        self.reader = reader
+        self.page_size = max(page_size, 1)
+        self.max_pages = max(max_pages, 1)
+        self.hits = 0
+        self.misses = 0
+        self._pages: dict[int, bytes | None] = {}
+        self._key: object | None = None
+
+    def read(self, addr: int, size: int) -> bytes | None:
+        self._sync()
+        pages = self._span(addr, size)
+        if pages is None:
+            self.misses += 1
+            return self.reader.read(addr, size)
+
+        chunks: list[bytes] = []
+        for page in pages:
+            data = self._page(page)
+            if data is None:
+                self.misses += 1
+                return self.reader.read(addr, size)
+            chunks.append(data)
+        offset = addr - pages.start
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        return data[offset : offset + size]
+
+    def read_pointer(self, addr: int, ptr_size: int) -> int | None:
+        data = self.read(addr, ptr_size)
+        if not data or len(data) < ptr_size:
+            return None
+        return int.from_bytes(data[:ptr_size], byteorder="little")
+
+    def read_many(self, ranges: Sequence[tuple[int, int]]) -> list[bytes | None]:
+        self._sync()
+        missing: set[int] = set()
+        for addr, size in ranges:
+            pages = self._span(addr, size)
+            if pages is not None:
+                missing.update(page for page in pages if page not in self._pages)
+        if missing:
+            ordered = sorted(missing)
+            fetched = batch_read(
+                self.reader, [(page, self.page_size) for page in ordered]
+            )
+            for page, data in zip(ordered, fetched):
+                if not data or len(data) < self.page_size:
+                    self._pages[page] = None
+                else:
+                    self.misses += 1
+                    self._pages[page] = bytes(data)
+        return [self.read(addr, size) for addr, size in ranges]
+
+    def stop_key(self) -> object | None:
+        stop_key = getattr(self.reader, "stop_key", None)
+        if not callable(stop_key):
+            return None
+        return stop_key()
+
+    def stats(self) -> ReadStats:
+        return ReadStats(hits=self.hits, misses=self.misses)
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self) -> None:
+        self._pages.clear()
+
+    def _sync(self) -> None:
+        key = self.stop_key()
+        if key != self._key:
+            self._pages.clear()
+            self._key = key
+
+    def _span(self, addr: int, size: int) -> range | None:
+        if size <= 0 or addr < 0:
+            return None
+        first = addr - (addr % self.page_size)
+        last = addr + size - 1
+        last -= last % self.page_size
+        if (last - first) // self.page_size + 1 > self.max_pages:
+            return None
+        return range(first, last + 1, self.page_size)
+
+    def _page(self, page: int) -> bytes | None:
+        if page in self._pages:
+            data = self._pages[page]
+            if data is not None:
+                self.hits += 1
+            return data
+        data = self.reader.read(page, self.page_size)
+        if not data or len(data) < self.page_size:
+            data = None
+        else:
+            self.misses += 1
+            data = bytes(data)
+        self._pages[page] = data
+        return data
+
+
+def coalesce_ranges(
+    ranges: Sequence[tuple[int, int]],
+) -> list[tuple[int, int, list[int]]]:
+    order = sorted(
+        (idx for idx, (_, size) in enumerate(ranges) if size > 0),
+        key=lambda idx: ranges[idx][0],
+    )
+    groups: list[tuple[int, int, list[int]]] = []
+    for idx in order:
+        addr, size = ranges[idx]
+        end = addr + size
+        if groups and addr <= groups[-1][1]:
+            start, group_end, indices = groups[-1]
+            indices.append(idx)
+            groups[-1] = (start, max(group_end, end), indices)
+            continue
+        groups.append((addr, end, [idx]))
+    return groups
+
+
+def read_ranges(
+    read: Callable[[int, int], bytes | None],
+    ranges: Sequence[tuple[int, int]],
+) -> list[bytes | None]:
+    results: list[bytes | None] = [None] * len(ranges)
+    for start, end, indices in coalesce_ranges(ranges):
+        data = read(start, end - start)
+        for idx in indices:
+            addr, size = ranges[idx]
+            offset = addr - start
+            if data is not None and len(data) >= offset + size:
+                results[idx] = data[offset : offset + size]
+            elif len(indices) > 1:
+                results[idx] = read(addr, size)
+    return results
+
+
+def batch_read(reader: Any, ranges: Sequence[tuple[int, int]]) -> list[bytes | None]:
+    read_many = getattr(reader, "read_many", None)
+    if callable(read_many):
+        return read_many(ranges)
+    return [reader.read(addr, size) if size > 0 else None for addr, size in ranges]
+
+
+def read_pointers(
+    reader: Any, addrs: Sequence[int], ptr_size: int
+) -> list[int | None]:
+    values: list[int | None] = []
+    for data in batch_read(reader, [(addr, ptr_size) for addr in addrs]):
+        if not data or len(data) < ptr_size:
+            values.append(None)
+            continue
+        values.append(int.from_bytes(data[:ptr_size], byteorder="little"))
+    return values
+
+
+def process_stop_key(process: Any) -> tuple[int, int] | None:
+    if not process:
+        return None
+    try:
+        if not process.IsValid():
+            return None
+        return int(process.GetUniqueID()), int(process.GetStopID(True))
+    except Exception:
+        return None
+
+
+class RegionCache:
+    def __init__(self) -> None:
+        self._key: tuple[object, ...] | None = None
+        self._maps: RegionMap | None = None
+        self.reads = 0
+
+    def get(
+        self,
+        process: Any,
+        reuse: str = "stop",
+        probes: Iterable[int | None] = (),
+        refresh: bool = False,
+    ) -> RegionMap:
+        stop_key = process_stop_key(process)
+        if stop_key is None:
+            return RegionMap(read_memory_regions(process))
+        if reuse == "modules":
+            key: tuple[object, ...] = ("modules", stop_key[0], _module_count(process))
+        else:
+            key = ("stop",) + stop_key
+        maps = self._maps
+        if (
+            refresh
+            or maps is None
+            or key != self._key
+            or (reuse == "modules" and _missing_probe(maps, probes))
+        ):
+            maps = RegionMap(read_memory_regions(process))
+            self.reads += 1
+            self._key = key
+            self._maps = maps
+        return maps
+
+    def invalidate(self) -> None:
+        self._key = None
+        self._maps = None
+
+
+def _missing_probe(maps: RegionMap, probes: Iterable[int | None]) -> bool:
+    if not maps:
+        return False
+    return any(addr is not None and maps.find(addr) is None for addr in probes)
+
+
+def _module_count(process: Any) -> int:
+    try:
+        return int(process.GetTarget().GetNumModules())
+    except Exception:
+        return -1
+
 
 def read_memory_regions(process: Any) -> list[MemoryRegion]:
     try:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 import re
 
@@ -18,6 +19,10 @@ class PatchEntry:
 class PatchStore:
     def __init__(self) -> None:
         self._entries: dict[int, PatchEntry] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    def on_change(self, callback: Callable[[], None]) -> None:
+        self._listeners.append(callback)
 
     def list(self) -> list[PatchEntry]:
         return [self._entries[key] for key in sorted(self._entries.keys())]
@@ -36,13 +41,22 @@ class PatchStore:
         if overlap is not None:
             return False, f"patch overlaps existing patch at 0x{overlap.addr:x}"
         self._entries[addr] = PatchEntry(addr=addr, original=original, patched=patched)
+        self._changed()
         return True, None
 
     def remove(self, addr: int) -> bool:
-        return self._entries.pop(addr, None) is not None
+        if self._entries.pop(addr, None) is None:
+            return False
+        self._changed()
+        return True
 
     def clear(self) -> None:
         self._entries.clear()
+        self._changed()
+
+    def _changed(self) -> None:
+        for callback in self._listeners:
+            callback()
 
     def _find_overlap(self, addr: int, size: int) -> PatchEntry | None:
         end = addr + size
@@ -57,6 +57,15 @@ def session_path(target) -> str:
     return os.path.join(sessions_dir(), name)
 
 
+def symbols_dir() -> str:
+    return os.path.join(state_dir(), "symbols")
+
+
+def symbol_index_path(build_id: str, root: str | None = None) -> str:
+    name = f"{_sanitize_filename(build_id)}.symidx"
+    return os.path.join(root or symbols_dir(), name)
+
+
 def _platform_kind() -> str:
     if sys.platform == "darwin":
         return "darwin"
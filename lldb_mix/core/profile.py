@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from lldb_mix.ui.table import Column, StyleFn, render_table
+
+Counters = Callable[[], tuple[int, int, int, int]]
+
+PROFILE_WINDOW = 32
+
+
+@dataclass
+class PaneStats:
+    seconds: float = 0.0
+    reads: int = 0
+    bytes: int = 0
+    decode_misses: int = 0
+    symbols: int = 0
+
+    def add(self, other: "PaneStats") -> None:
+        self.seconds += other.seconds
+        self.reads += other.reads
+        self.bytes += other.bytes
+        self.decode_misses += other.decode_misses
+        self.symbols += other.symbols
+
+    def scaled(self, count: int) -> "PaneStats":
+        if count <= 1:
+            return PaneStats(
+                self.seconds, self.reads, self.bytes, self.decode_misses, self.symbols
+            )
+        return PaneStats(
+            self.seconds / count,
+            self.reads // count,
+            self.bytes // count,
+            self.decode_misses // count,
+            self.symbols // count,
+        )
+
+
+class RenderProfiler:
+    def __init__(self, counters: Counters, window: int = PROFILE_WINDOW):
+        self.counters = counters
+        self.window = max(window, 1)
+        self.enabled = False
+        self.renders = 0
+        self.last: dict[str, PaneStats] = {}
+        self._samples: dict[str, deque[PaneStats]] = {}
+
+    def begin(self) -> None:
+        self.last = {}
+
+    def measure(self, name: str, render: Callable[[], list[str]]) -> list[str]:
+        before = self.counters()
+        start = time.perf_counter()
+        lines = render()
+        elapsed = time.perf_counter() - start
+        after = self.counters()
+        reads, size, decode_misses, symbols = (b - a for a, b in zip(before, after))
+        sample = PaneStats(elapsed, reads, size, decode_misses, symbols)
+        stats = self.last.get(name)
+        if stats is None:
+            self.last[name] = sample
+        else:
+            stats.add(sample)
+        return lines
+
+    def end(self) -> None:
+        self.renders += 1
+        total = PaneStats()
+        for name, stats in self.last.items():
+            total.add(stats)
+            self._accumulate(name, stats)
+        self.last["total"] = total
+        self._accumulate("total", total)
+
+    def averages(self) -> dict[str, PaneStats]:
+        averages: dict[str, PaneStats] = {}
+        for name, samples in self._samples.items():
+            total = PaneStats()
+            for stats in samples:
+                total.add(stats)
+            averages[name] = total.scaled(len(samples))
+        return averages
+
+    def reset(self) -> None:
+        self.renders = 0
+        self.last = {}
+        self._samples.clear()
+
+    def _accumulate(self, name: str, stats: PaneStats) -> None:
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+        samples.append(stats)
+
+
+def format_profile(
+    stats: dict[str, PaneStats], term_width: int, style: StyleFn
+) -> list[str]:
+    rows = [
+        {
+            "pane": name,
+            "ms": f"{item.seconds * 1000:.2f}",
+            "reads": item.reads,
+            "bytes": item.bytes,
+            "decode_misses": item.decode_misses,
+            "symbols": item.symbols,
+        }
+        for name, item in stats.items()
+    ]
+    return render_table(rows, _COLUMNS, term_width, style)
+
+
+_COLUMNS = [
+    Column("pane", "PANE", role="label"),
+    Column("ms", "MS", role="value", align="right"),
+    Column("reads", "READS", role="value", align="right"),
+    Column("bytes", "BYTES", role="value", align="right"),
+    Column("decode_misses", "DECODE MISSES", role="value", align="right"),
+    Column("symbols", "SYMBOLS", role="value", align="right"),
+]
@@ -22,6 +22,65 @@ def iter_registers(frame: Any) -> Iterable[Any]:
     return regs
 
 
+def read_register_set(frame: Any, set_name: str) -> dict[str, int]:
+    values: dict[str, int] = {}
+    if not frame or not set_name:
+        return values
+    try:
+        reg_set = frame.GetRegisters().GetFirstValueByName(set_name)
+    except Exception:
+        return values
+    if not reg_set or not reg_set.IsValid():
+        return values
+    try:
+        for reg in reg_set:
+            name = reg.GetName() or ""
+            if not name:
+                continue
+            try:
+                values[name.lower()] = int(reg.GetValueAsUnsigned())
+            except Exception:
+                continue
+    except Exception:
+        return values
+    return values
+
+
+class FrameRegisters(dict):
+    def __init__(self, values: dict[str, int], frame: Any = None):
+        super().__init__(values)
+        self.frame = frame
+        self._absent: set[str] = set()
+
+    def fetch(self, name: str) -> int | None:
+        key = name.lower()
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if self.frame is None or key in self._absent:
+            return None
+        value = read_register_u64(self.frame, key)
+        if value is None:
+            self._absent.add(key)
+            return None
+        self[key] = value
+        return value
+
+    def __missing__(self, key: str) -> int:
+        value = self.fetch(key) if isinstance(key, str) else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if dict.__contains__(self, key):
+            return True
+        return isinstance(key, str) and self.fetch(key) is not None
+
+    def get(self, key: str, default: int | None = None) -> int | None:
+        value = self.fetch(key) if isinstance(key, str) else None
+        return default if value is None else value
+
+
 def find_register(frame: Any, name: str):
     if not frame or not name:
         return None
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from typing import Any
 
-from lldb_mix.arch.registry import detect_arch
-from lldb_mix.core.regs import iter_registers
-from lldb_mix.core.state import SETTINGS
+from lldb_mix.arch.view import ArchView
+from lldb_mix.core.regs import (
+    FrameRegisters,
+    iter_registers,
+    read_register_set,
+    read_register_u64,
+)
+from lldb_mix.core.state import ARCHES, SETTINGS
 
 
 class Session:
@@ -49,12 +54,16 @@ class Session:
     def arch(self):
         target = self.target()
         frame = self.frame()
-        return detect_arch(target, frame, SETTINGS.abi)
+        return ARCHES.get(target, frame, SETTINGS.abi)
 
-    def read_registers(self) -> dict[str, int]:
+    def read_registers(self, arch: ArchView | None = None) -> dict[str, int]:
         frame = self.frame()
         if not frame:
             return {}
+        if arch is not None and SETTINGS.register_capture == "gpr":
+            gprs = self._read_gpr_set(frame, arch)
+            if gprs is not None:
+                return gprs
         regs: dict[str, int] = {}
         for reg in self._iter_registers(frame):
             name = reg.GetName() or ""
@@ -69,11 +78,24 @@ class Session:
 
     def read_gprs(self) -> dict[str, int]:
         arch = self.arch()
-        regs = self.read_registers()
+        regs = self.read_registers(arch)
         if not arch.gpr_names:
             return {}
         return {name: regs[name] for name in arch.gpr_names if name in regs}
 
+    @staticmethod
+    def _read_gpr_set(frame: Any, arch: ArchView) -> FrameRegisters | None:
+        regs = read_register_set(frame, arch.info.gpr_set)
+        if not regs:
+            return None
+        for name in (*arch.gpr_names, arch.flags_reg, arch.pc_reg, arch.sp_reg):
+            if not name or name in regs:
+                continue
+            value = read_register_u64(frame, name)
+            if value is not None:
+                regs[name] = value
+        return FrameRegisters(regs, frame)
+
     @staticmethod
     def _iter_registers(frame: Any):
         return iter_registers(frame)
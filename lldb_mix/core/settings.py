@@ -32,3 +32,8 @@ class Settings:
     code_lines_before: int = 3
     code_lines_after: int = 6
     show_opcodes: bool = True
+    region_cache: str = "stop"
+    memory_backend: str = "auto"
+    render_mode: str = "full"
+    render_budget_ms: int = 0
+    register_capture: str = "gpr"
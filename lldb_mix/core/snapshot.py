@@ -4,8 +4,9 @@ from dataclasses import dataclass
 import time
 
 from lldb_mix.arch.view import ArchView
-from lldb_mix.core.memory import MemoryRegion, read_memory_regions
+from lldb_mix.core.memory import RegionMap
 from lldb_mix.core.session import Session
+from lldb_mix.core.state import REGIONS, SETTINGS
 
 
 @dataclass(frozen=True)
@@ -14,7 +15,7 @@ class ContextSnapshot:
     pc: int | None
     sp: int | None
     regs: dict[str, int]
-    maps: list[MemoryRegion]
+    maps: RegionMap
     timestamp: float
 
     def has_pc(self) -> bool:
@@ -29,7 +30,7 @@ def capture_snapshot(session: Session) -> ContextSnapshot | None:
         return None
 
     arch = session.arch()
-    regs = session.read_registers()
+    regs = session.read_registers(arch)
     pc = arch.pc_value
     if pc is None and arch.pc_reg:
         pc = regs.get(arch.pc_reg)
@@ -37,7 +38,11 @@ def capture_snapshot(session: Session) -> ContextSnapshot | None:
     if sp is None and arch.sp_reg:
         sp = regs.get(arch.sp_reg)
     process = session.process()
-    maps = read_memory_regions(process) if process else []
+    maps = (
+        REGIONS.get(process, reuse=SETTINGS.region_cache, probes=(pc, sp))
+        if process
+        else RegionMap()
+    )
 
     return ContextSnapshot(
         arch=arch,
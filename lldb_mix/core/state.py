@@ -1,9 +1,35 @@
 from __future__ import annotations
 
+from lldb_mix.arch.registry import ArchCache
+from lldb_mix.core.cfg import GraphCache
+from lldb_mix.core.code_bytes import CodeBytes
+from lldb_mix.core.disasm import InstructionCache
+from lldb_mix.core.memory import READ_COUNTERS, ReaderSelector, RegionCache
 from lldb_mix.core.patches import PatchStore
+from lldb_mix.core.profile import RenderProfiler
 from lldb_mix.core.settings import Settings
+from lldb_mix.core.symbol_store import SymbolStore
+from lldb_mix.core.symbols import CachedSymbolResolver
 from lldb_mix.core.watchlist import WatchList
 
 SETTINGS = Settings()
+ARCHES = ArchCache()
 WATCHLIST = WatchList()
 PATCHES = PatchStore()
+CODE_BYTES = CodeBytes(PATCHES)
+SYMBOLS = CachedSymbolResolver(store=SymbolStore())
+DECODES = InstructionCache(code_bytes=CODE_BYTES, symbols=SYMBOLS)
+PATCHES.on_change(DECODES.invalidate)
+GRAPHS = GraphCache()
+REGIONS = RegionCache()
+READERS = ReaderSelector(
+    lambda process: REGIONS.get(process, reuse=SETTINGS.region_cache)
+)
+PROFILER = RenderProfiler(
+    lambda: (
+        READ_COUNTERS.reads,
+        READ_COUNTERS.bytes,
+        DECODES.misses,
+        SYMBOLS.hits + SYMBOLS.misses,
+    )
+)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from lldb_mix.core.paths import symbol_index_path, symbols_dir
+from lldb_mix.core.symbols import SymbolIndex
+
+MAGIC = b"LMXSYMIX"
+VERSION = 2
+MAX_STORE_BYTES = 256 * 1024 * 1024
+_HEADER = struct.Struct("<8sIIQQQ")
+_BYTEORDER = 0 if sys.byteorder == "little" else 1
+
+
+class SymbolStore:
+    def __init__(self, root: str | None = None, max_bytes: int = MAX_STORE_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def path(self, build_id: str) -> str:
+        return symbol_index_path(build_id, self.root or symbols_dir())
+
+    def load(self, build_id: str, slide: int = 0) -> SymbolIndex | None:
+        if not build_id:
+            return None
+        path = self.path(build_id)
+        index = load_symbol_index(path, slide)
+        if index is None:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return index
+
+    def save(self, build_id: str, index: SymbolIndex) -> bool:
+        if not build_id:
+            return False
+        path = self.path(build_id)
+        if not save_symbol_index(path, index):
+            return False
+        self.evict(keep=path)
+        return True
+
+    def evict(self, keep: str | None = None) -> int:
+        root = self.root or symbols_dir()
+        entries = []
+        try:
+            names = os.listdir(root)
+        except OSError:
+            return 0
+        for name in names:
+            if not name.endswith(".symidx"):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+
+def save_symbol_index(path: str, index: SymbolIndex) -> bool:
+    module = index.module.encode("utf-8", errors="replace")
+    count = len(index.starts)
+    header = _HEADER.pack(
+        MAGIC, VERSION, _BYTEORDER, count, len(module), len(index.names)
+    )
+    tmp_name = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb",
+            dir=os.path.dirname(path),
+            delete=False,
+        ) as handle:
+            tmp_name = handle.name
+            handle.write(header)
+            handle.write(_pad(module))
+            handle.write(array("Q", index.starts).tobytes())
+            handle.write(array("Q", index.ends).tobytes())
+            handle.write(array("Q", index.name_offsets).tobytes())
+            handle.write(index.names)
+        os.replace(tmp_name, path)
+    except Exception:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+        return False
+    return True
+
+
+def load_symbol_index(path: str, slide: int = 0) -> SymbolIndex | None:
+    try:
+        with open(path, "rb") as handle:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        return _reject(view, data)
+    magic, version, byteorder, count, module_len, names_len = _HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION or byteorder != _BYTEORDER:
+        return _reject(view, data)
+    offset = _HEADER.size
+    module = bytes(view[offset : offset + module_len]).decode("utf-8", "replace")
+    offset += len(_pad(b"\x00" * module_len))
+    sizes = (count * 8, count * 8, (count + 1) * 8)
+    if offset + sum(sizes) + names_len != len(view):
+        return _reject(view, data)
+    arrays = []
+    for size in sizes:
+        arrays.append(view[offset : offset + size].cast("Q"))
+        offset += size
+    names = view[offset : offset + names_len]
+    starts, ends, name_offsets = arrays
+    return SymbolIndex(module, starts, ends, name_offsets, names, slide)
+
+
+def _reject(view: memoryview, data: mmap.mmap) -> None:
+    view.release()
+    data.close()
+    return None
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\x00" * (-len(data) % 8)
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Protocol
+
+from lldb_mix.core.modules import module_fullpath, module_name
+
+MAX_CACHED_SYMBOLS = 0x10000
 
 
 @dataclass(frozen=True)
@@ -11,6 +18,9 @@ class SymbolInfo:
     offset: int
 
 
+SymbolRange = tuple[SymbolInfo, int, int]
+
+
 class TargetSymbolResolver:
     def __init__(self, target: Any):
         self.target = target
@@ -19,6 +29,238 @@ class TargetSymbolResolver:
         return resolve_symbol(self.target, addr)
 
 
+class SymbolIndex:
+    __slots__ = (
+        "module",
+        "slide",
+        "starts",
+        "ends",
+        "name_offsets",
+        "names",
+        "_parents",
+    )
+
+    def __init__(
+        self,
+        module: str,
+        starts: Sequence[int],
+        ends: Sequence[int],
+        name_offsets: Sequence[int],
+        names: bytes | memoryview,
+        slide: int = 0,
+    ):
+        self.module = module
+        self.slide = slide
+        self.starts = starts
+        self.ends = ends
+        self.name_offsets = name_offsets
+        self.names = names
+        self._parents: array | None = None
+
+    @classmethod
+    def build(
+        cls,
+        module: str,
+        symbols: Iterable[tuple[int, int, str]],
+        slide: int = 0,
+    ) -> SymbolIndex:
+        starts = array("Q")
+        ends = array("Q")
+        name_offsets = array("Q", [0])
+        names = bytearray()
+        last = None
+        for start, end, name in sorted(symbols, key=_widest_first):
+            if start == last or is_placeholder_symbol(name):
+                continue
+            last = start
+            starts.append(start)
+            ends.append(max(end, start))
+            names += name.encode("utf-8", errors="replace")
+            name_offsets.append(len(names))
+        return cls(module, starts, ends, name_offsets, bytes(names), slide)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def name_at(self, idx: int) -> str:
+        start = self.name_offsets[idx]
+        end = self.name_offsets[idx + 1]
+        return bytes(self.names[start:end]).decode("utf-8", errors="replace")
+
+    def lookup(self, addr: int) -> SymbolRange | None:
+        file_addr = addr - self.slide
+        idx = bisect_right(self.starts, file_addr) - 1
+        if idx < 0:
+            return None
+        if file_addr >= self.ends[idx]:
+            idx = self._enclosing(idx, file_addr)
+            if idx < 0:
+                return None
+        start = self.starts[idx]
+        info = SymbolInfo(
+            name=self.name_at(idx), module=self.module, offset=file_addr - start
+        )
+        return info, start + self.slide, self.ends[idx] + self.slide
+
+    def resolve(self, addr: int) -> SymbolInfo | None:
+        found = self.lookup(addr)
+        return found[0] if found else None
+
+    def _enclosing(self, idx: int, file_addr: int) -> int:
+        if self._parents is None:
+            self._parents = self._build_parents()
+        parents = self._parents
+        ends = self.ends
+        while idx >= 0 and file_addr >= ends[idx]:
+            idx = parents[idx]
+        return idx
+
+    def _build_parents(self) -> array:
+        parents = array("q")
+        open_ranges: list[int] = []
+        starts = self.starts
+        ends = self.ends
+        for idx in range(len(starts)):
+            start = starts[idx]
+            while open_ranges and ends[open_ranges[-1]] <= start:
+                open_ranges.pop()
+            parents.append(open_ranges[-1] if open_ranges else -1)
+            open_ranges.append(idx)
+        return parents
+
+
+class SymbolIndexStore(Protocol):
+    def load(self, build_id: str, slide: int = 0) -> SymbolIndex | None: ...
+
+    def save(self, build_id: str, index: SymbolIndex) -> bool: ...
+
+
+class ModuleIndexes:
+    def __init__(self, target: Any = None, store: SymbolIndexStore | None = None):
+        self.target = target
+        self.store = store
+        self._loaded = False
+        self._lows: list[int] = []
+        self._spans: list[tuple[int, int, tuple[str, int], Any]] = []
+        self._indexes: dict[tuple[str, int], SymbolIndex | None] = {}
+
+    def reset(self, target: Any) -> None:
+        self.target = target
+        self._loaded = False
+        self._lows = []
+        self._spans = []
+
+    def lookup(self, addr: int) -> SymbolRange | None:
+        index = self.index_for(addr)
+        return index.lookup(addr) if index else None
+
+    def index_for(self, addr: int) -> SymbolIndex | None:
+        if not self._loaded:
+            self._load()
+        idx = bisect_right(self._lows, addr) - 1
+        if idx < 0:
+            return None
+        _, high, key, module = self._spans[idx]
+        if addr >= high:
+            return None
+        if key not in self._indexes:
+            self._indexes[key] = self._index(module, key[1])
+        return self._indexes[key]
+
+    def _index(self, module: Any, base: int) -> SymbolIndex | None:
+        build_id = _build_id(module) if self.store is not None else ""
+        if build_id:
+            file_base = _file_base(module)
+            if file_base is None:
+                return None
+            index = self.store.load(build_id, base - file_base)
+            if index is not None:
+                return index
+        index = build_symbol_index(self.target, module, base)
+        if index is not None and build_id:
+            self.store.save(build_id, index)
+        return index
+
+    def _load(self) -> None:
+        self._loaded = True
+        spans = []
+        for module in _target_modules(self.target):
+            key = _index_key(self.target, module)
+            if key is None:
+                continue
+            for low, high in _section_spans(self.target, module):
+                spans.append((low, high, key, module))
+        spans.sort(key=lambda span: span[0])
+        self._spans = spans
+        self._lows = [span[0] for span in spans]
+
+
+class CachedSymbolResolver:
+    def __init__(self, target: Any = None, store: SymbolIndexStore | None = None):
+        self.target = target
+        self.hits = 0
+        self.misses = 0
+        self._key: tuple[int, int] | None = None
+        self._cache: dict[int, SymbolRange | None] = {}
+        self.indexes = ModuleIndexes(target, store)
+
+    def bind(self, target: Any) -> "CachedSymbolResolver":
+        if not _same_target(self.target, target):
+            self.target = target
+            self.invalidate()
+        key = _module_key(target)
+        if key is None or key != self._key:
+            self.invalidate()
+            self.indexes.reset(target)
+            self._key = key
+        return self
+
+    def invalidate(self) -> None:
+        self._key = None
+        self._cache.clear()
+
+    def resolve(self, addr: int) -> SymbolInfo | None:
+        found = self.lookup(addr)
+        return found[0] if found else None
+
+    def lookup(self, addr: int) -> SymbolRange | None:
+        if addr in self._cache:
+            self.hits += 1
+            return self._cache[addr]
+        self.misses += 1
+        index = self.indexes.index_for(addr)
+        if index is not None:
+            found = index.lookup(addr)
+        else:
+            found = symbol_range(self.target, addr)
+        if len(self._cache) >= MAX_CACHED_SYMBOLS:
+            self._cache.clear()
+        self._cache[addr] = found
+        return found
+
+
+def _same_target(left: Any, right: Any) -> bool:
+    if left is None or right is None:
+        return left is right
+    try:
+        return bool(left == right)
+    except Exception:
+        return left is right
+
+
+def _module_key(target: Any) -> tuple[int, int] | None:
+    if not target:
+        return None
+    try:
+        if not target.IsValid():
+            return None
+        process = target.GetProcess()
+        process_id = int(process.GetUniqueID()) if process and process.IsValid() else 0
+        return process_id, int(target.GetNumModules())
+    except Exception:
+        return None
+
+
 def is_placeholder_symbol(name: str) -> bool:
     if not name:
         return True
@@ -29,6 +271,13 @@ def is_placeholder_symbol(name: str) -> bool:
 
 
 def resolve_symbol(target: Any, address: int) -> SymbolInfo | None:
+    found = symbol_range(target, address)
+    if not found:
+        return None
+    return found[0]
+
+
+def symbol_range(target: Any, address: int) -> SymbolRange | None:
     try:
         import lldb
     except Exception:
@@ -54,6 +303,127 @@ def resolve_symbol(target: Any, address: int) -> SymbolInfo | None:
         module = spec.GetFilename() if spec else ""
 
     start = symbol.GetStartAddress().GetLoadAddress(target)
-    offset = address - start if start != lldb.LLDB_INVALID_ADDRESS else 0
+    end = symbol.GetEndAddress().GetLoadAddress(target)
+    if start == lldb.LLDB_INVALID_ADDRESS:
+        return SymbolInfo(name=name, module=module, offset=0), address, address
+    if end == lldb.LLDB_INVALID_ADDRESS or end <= start:
+        end = start
+    info = SymbolInfo(name=name, module=module, offset=address - start)
+    return info, start, end
 
-    return SymbolInfo(name=name, module=module, offset=offset)
+
+def _widest_first(symbol: tuple[int, int, str]) -> tuple[int, int]:
+    return symbol[0], -symbol[1]
+
+
+def build_symbol_index(target: Any, module: Any, base: int) -> SymbolIndex | None:
+    try:
+        import lldb
+    except Exception:
+        return None
+
+    invalid = lldb.LLDB_INVALID_ADDRESS
+    indexed = {
+        lldb.eSymbolTypeCode,
+        lldb.eSymbolTypeResolver,
+        lldb.eSymbolTypeTrampoline,
+        lldb.eSymbolTypeData,
+    }
+    file_base = _file_base(module)
+    if file_base is None:
+        return None
+    try:
+        symbols = []
+        for idx in range(module.GetNumSymbols()):
+            symbol = module.GetSymbolAtIndex(idx)
+            if not symbol or not symbol.IsValid():
+                continue
+            if symbol.GetType() not in indexed:
+                continue
+            start = symbol.GetStartAddress().GetFileAddress()
+            if start == invalid:
+                continue
+            end = symbol.GetEndAddress().GetFileAddress()
+            if end == invalid:
+                end = start
+            symbols.append((start, end, symbol.GetName() or ""))
+    except Exception:
+        return None
+    return SymbolIndex.build(module_name(module), symbols, base - file_base)
+
+
+def _file_base(module: Any) -> int | None:
+    try:
+        import lldb
+    except Exception:
+        return None
+    try:
+        header = module.GetObjectFileHeaderAddress()
+        if not header or not header.IsValid():
+            return None
+        base = header.GetFileAddress()
+    except Exception:
+        return None
+    if base == lldb.LLDB_INVALID_ADDRESS:
+        return None
+    return base
+
+
+def _build_id(module: Any) -> str:
+    try:
+        return module.GetUUIDString() or ""
+    except Exception:
+        return ""
+
+
+def _target_modules(target: Any) -> list[Any]:
+    if not target:
+        return []
+    try:
+        if not target.IsValid():
+            return []
+        count = target.GetNumModules()
+        return [target.GetModuleAtIndex(idx) for idx in range(count)]
+    except Exception:
+        return []
+
+
+def _index_key(target: Any, module: Any) -> tuple[str, int] | None:
+    try:
+        import lldb
+    except Exception:
+        return None
+    try:
+        if not module or not module.IsValid():
+            return None
+        ident = module.GetUUIDString() or module_fullpath(module)
+        header = module.GetObjectFileHeaderAddress()
+        if not ident or not header or not header.IsValid():
+            return None
+        base = header.GetLoadAddress(target)
+    except Exception:
+        return None
+    if base == lldb.LLDB_INVALID_ADDRESS:
+        return None
+    return ident, base
+
+
+def _section_spans(target: Any, module: Any) -> list[tuple[int, int]]:
+    try:
+        import lldb
+    except Exception:
+        return []
+    spans = []
+    try:
+        for idx in range(module.GetNumSections()):
+            section = module.GetSectionAtIndex(idx)
+            if not section or not section.IsValid():
+                continue
+            start = section.GetLoadAddress(target)
+            size = section.GetByteSize()
+            if start == lldb.LLDB_INVALID_ADDRESS or size <= 0:
+                continue
+            spans.append((start, start + size))
+    except Exception:
+        return []
+    return spans
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Protocol
 
-from lldb_mix.core.memory import MemoryRegion
+from lldb_mix.core.memory import (
+    MemoryRegion,
+    batch_read,
+    find_region,
+    read_pointers,
+)
 from lldb_mix.core.settings import Settings
 from lldb_mix.core.symbols import SymbolInfo
 
@@ -13,11 +18,37 @@ class MemoryReader(Protocol):
 
     def read_pointer(self, addr: int, ptr_size: int) -> int | None: ...
 
+    def read_many(self, ranges: Sequence[tuple[int, int]]) -> list[bytes | None]: ...
+
 
 class SymbolResolver(Protocol):
     def resolve(self, addr: int) -> SymbolInfo | None: ...
 
 
+class DerefNode:
+    __slots__ = ("kind", "address", "symbol", "region", "string")
+
+    def __init__(
+        self,
+        kind: str,
+        address: int | None = None,
+        symbol: SymbolInfo | None = None,
+        region: MemoryRegion | None = None,
+        string: str | None = None,
+    ):
+        self.kind = kind
+        self.address = address
+        self.symbol = symbol
+        self.region = region
+        self.string = string
+
+    def __repr__(self) -> str:
+        return f"DerefNode({self.kind!r}, {self.address!r})"
+
+
+_LOOP_NODE = DerefNode("loop")
+
+
 def deref_chain(
     addr: int,
     reader: MemoryReader,
@@ -26,101 +57,210 @@ def deref_chain(
     settings: Settings,
     ptr_size: int,
 ) -> list[str]:
+    return deref_chains([addr], reader, regions, resolver, settings, ptr_size)[0]
+
+
+def deref_chains(
+    addrs: Sequence[int],
+    reader: MemoryReader,
+    regions: Iterable[MemoryRegion],
+    resolver: SymbolResolver | None,
+    settings: Settings,
+    ptr_size: int,
+) -> list[list[str]]:
+    chains = deref_nodes(addrs, reader, regions, resolver, settings, ptr_size)
+    width = ptr_size if ptr_size > 0 else 1
+    return [format_chain(nodes, width) for nodes in chains]
+
+
+class _ChainState:
+    __slots__ = ("nodes", "seen", "current", "depth")
+
+    def __init__(self, addr: int, depth: int):
+        self.nodes = [DerefNode("addr", addr)]
+        self.seen: set[int] = set()
+        self.current = addr
+        self.depth = depth
+
+
+def deref_nodes(
+    addrs: Sequence[int],
+    reader: MemoryReader,
+    regions: Iterable[MemoryRegion],
+    resolver: SymbolResolver | None,
+    settings: Settings,
+    ptr_size: int,
+) -> list[list[DerefNode]]:
     if ptr_size <= 0:
-        return [format_addr(addr, 1)]
-    if addr == 0:
-        return [format_addr(addr, ptr_size)]
-
-    chain = [format_addr(addr, ptr_size)]
-    seen = set()
-    current = addr
-    depth = settings.max_deref_depth
-
-    while depth > 0:
-        if current in seen:
-            chain.append("[loop]")
-            break
-        seen.add(current)
-
-        region = find_region(current, regions)
-        if not region:
-            break
-        if region.execute:
-            if resolver:
-                symbol = resolver.resolve(current)
-                if symbol:
-                    chain.append(format_symbol(symbol))
-                    break
-            chain.append(format_region(region))
-            break
-        if not region.read:
-            break
-
-        ptr = reader.read_pointer(current, ptr_size)
-        if ptr is None:
-            break
-
-        chain.append(format_addr(ptr, ptr_size))
-        if ptr == 0:
-            break
-
-        if resolver:
-            symbol = resolver.resolve(ptr)
-            if symbol:
-                chain.append(format_symbol(symbol))
-                break
-
-        target_region = find_region(ptr, regions)
-        if target_region and target_region.read and not target_region.execute:
-            string_val = read_cstring(reader, ptr, settings.max_string_length)
-            if string_val:
-                chain.append(f'"{string_val}"')
-                break
+        return [[DerefNode("addr", addr)] for addr in addrs]
 
-        current = ptr
-        depth -= 1
+    states = [_ChainState(addr, settings.max_deref_depth) for addr in addrs]
+    active = [state for state in states if state.current != 0 and state.depth > 0]
 
-    return chain
+    while active:
+        pending: list[_ChainState] = []
+        for state in active:
+            current = state.current
+            if current in state.seen:
+                state.nodes.append(_LOOP_NODE)
+                continue
+            state.seen.add(current)
+
+            region = find_region(current, regions)
+            if not region:
+                continue
+            if region.execute:
+                if resolver:
+                    symbol = resolver.resolve(current)
+                    if symbol:
+                        state.nodes.append(DerefNode("symbol", current, symbol, region))
+                        continue
+                state.nodes.append(DerefNode("region", current, region=region))
+                continue
+            if not region.read:
+                continue
+            pending.append(state)
+
+        ptrs = read_pointers(reader, [state.current for state in pending], ptr_size)
+        probes: list[tuple[_ChainState, int]] = []
+        next_active: list[_ChainState] = []
+        for state, ptr in zip(pending, ptrs):
+            if ptr is None:
+                continue
+            state.nodes.append(DerefNode("addr", ptr))
+            if ptr == 0:
+                continue
 
+            if resolver:
+                symbol = resolver.resolve(ptr)
+                if symbol:
+                    state.nodes.append(DerefNode("symbol", ptr, symbol))
+                    continue
 
-def summarize_chain(chain: list[str]) -> str | None:
-    if len(chain) <= 1:
+            target_region = find_region(ptr, regions)
+            if target_region and target_region.read and not target_region.execute:
+                probes.append((state, ptr))
+                continue
+            _advance(state, ptr, next_active)
+
+        strings = read_cstrings(
+            reader, [ptr for _, ptr in probes], settings.max_string_length
+        )
+        for (state, ptr), string_val in zip(probes, strings):
+            if string_val:
+                state.nodes.append(DerefNode("string", ptr, string=string_val))
+                continue
+            _advance(state, ptr, next_active)
+
+        active = next_active
+
+    return [state.nodes for state in states]
+
+
+class DerefCache:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._key: object | None = None
+        self._chains: dict[tuple[int, int, int, int], list[DerefNode]] = {}
+
+    def bind(self, key: object | None) -> None:
+        if key is None or key != self._key:
+            self._chains.clear()
+        self._key = key
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        self._chains.clear()
+
+    def nodes(
+        self,
+        addrs: Sequence[int],
+        reader: MemoryReader,
+        regions: Iterable[MemoryRegion],
+        resolver: SymbolResolver | None,
+        settings: Settings,
+        ptr_size: int,
+    ) -> list[list[DerefNode]]:
+        shape = (ptr_size, settings.max_deref_depth, settings.max_string_length)
+        keys = [(addr,) + shape for addr in addrs]
+        missing: list[int] = []
+        pending: set[tuple[int, int, int, int]] = set()
+        for addr, key in zip(addrs, keys):
+            if key in self._chains or key in pending:
+                continue
+            pending.add(key)
+            missing.append(addr)
+        if missing:
+            computed = deref_nodes(
+                missing, reader, regions, resolver, settings, ptr_size
+            )
+            for addr, nodes in zip(missing, computed):
+                self._chains[(addr,) + shape] = nodes
+        self.misses += len(missing)
+        self.hits += len(addrs) - len(missing)
+        return [self._chains[key] for key in keys]
+
+
+def _advance(state: _ChainState, ptr: int, active: list[_ChainState]) -> None:
+    state.current = ptr
+    state.depth -= 1
+    if state.depth > 0:
+        active.append(state)
+
+
+def summarize_chain(nodes: list[DerefNode]) -> DerefNode | None:
+    if len(nodes) <= 1:
         return None
-    summary = _pick_best_token(chain[1:])
-    if summary == chain[0]:
+    summary = _pick_best_node(nodes[1:])
+    first = nodes[0]
+    if summary.kind == first.kind and summary.address == first.address:
         return None
     return summary
 
 
-def classify_token(token: str) -> str:
-    if token == "[loop]":
-        return "loop"
-    if token.startswith('"') and token.endswith('"'):
-        return "string"
-    if "!" in token:
-        return "symbol"
-    if token.startswith("[") and token.endswith("]"):
-        return "region"
-    if token.startswith("0x"):
-        return "addr"
-    return "other"
-
-
-def _pick_best_token(tokens: list[str]) -> str:
-    for token in reversed(tokens):
-        if classify_token(token) == "string":
-            return token
-    for token in reversed(tokens):
-        if classify_token(token) == "symbol":
-            return token
-    for token in reversed(tokens):
-        if classify_token(token) == "region":
-            return token
-    return tokens[-1]
+def _pick_best_node(nodes: list[DerefNode]) -> DerefNode:
+    for kind in ("string", "symbol", "region"):
+        for node in reversed(nodes):
+            if node.kind == kind:
+                return node
+    return nodes[-1]
+
+
+def format_node(node: DerefNode, ptr_size: int) -> str:
+    kind = node.kind
+    if kind == "addr":
+        return format_addr(node.address or 0, ptr_size)
+    if kind == "string":
+        return f'"{node.string}"'
+    if kind == "symbol" and node.symbol:
+        return format_symbol(node.symbol)
+    if kind == "region" and node.region:
+        return format_region(node.region)
+    if kind == "loop":
+        return "[loop]"
+    return ""
+
+
+def format_chain(nodes: list[DerefNode], ptr_size: int) -> list[str]:
+    return [format_node(node, ptr_size) for node in nodes]
 
 
 def read_cstring(reader: MemoryReader, addr: int, max_len: int) -> str | None:
-    data = reader.read(addr, max_len)
+    return _decode_cstring(reader.read(addr, max_len))
+
+
+def read_cstrings(
+    reader: MemoryReader, addrs: Sequence[int], max_len: int
+) -> list[str | None]:
+    if not addrs:
+        return []
+    datas = batch_read(reader, [(addr, max_len) for addr in addrs])
+    return [_decode_cstring(data) for data in datas]
+
+
+def _decode_cstring(data: bytes | None) -> str | None:
     if not data:
         return None
 
@@ -145,13 +285,6 @@ def is_printable_ascii(data: bytes) -> bool:
     return True
 
 
-def find_region(addr: int, regions: Iterable[MemoryRegion]) -> MemoryRegion | None:
-    for region in regions:
-        if region.contains(addr):
-            return region
-    return None
-
-
 def format_addr(addr: int, ptr_size: int) -> str:
     width = max(ptr_size * 2, 1)
     return f"0x{addr:0{width}x}"
@@ -178,13 +311,10 @@ def format_region(region: MemoryRegion) -> str:
     return f"[{perms}]"
 
 
-def last_addr(chain: list[str]) -> int | None:
-    for token in reversed(chain):
-        if token.startswith("0x"):
-            try:
-                return int(token, 16)
-            except ValueError:
-                continue
+def last_addr(nodes: list[DerefNode]) -> int | None:
+    for node in reversed(nodes):
+        if node.kind == "addr":
+            return node.address
     return None
 
 
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from lldb_mix.ui.terminal import clear_screen_code
+
+STOP_TEXT_ROWS = 4
+
+
+def move_cursor_code(row: int, col: int = 1) -> str:
+    return f"\x1b[{row};{col}H"
+
+
+def clear_line_code() -> str:
+    return "\x1b[K"
+
+
+def clear_below_code() -> str:
+    return "\x1b[J"
+
+
+class DiffRenderer:
+    def __init__(self) -> None:
+        self._lines: list[str] | None = None
+        self._size: tuple[int, int] | None = None
+
+    def reset(self) -> None:
+        self._lines = None
+        self._size = None
+
+    def frame(
+        self, lines: list[str], size: tuple[int, int], full: bool = False
+    ) -> str:
+        previous = self._lines
+        self._lines = list(lines)
+        self._size, old_size = size, self._size
+        if (
+            full
+            or previous is None
+            or size != old_size
+            or max(len(lines), len(previous)) + STOP_TEXT_ROWS >= size[1]
+        ):
+            return clear_screen_code() + "\n".join(lines)
+        parts: list[str] = []
+        for idx, line in enumerate(lines):
+            if idx < len(previous) and previous[idx] == line:
+                continue
+            parts.append(move_cursor_code(idx + 1) + line + clear_line_code())
+        parts.append(move_cursor_code(len(lines) + 1) + clear_below_code())
+        return "".join(parts)
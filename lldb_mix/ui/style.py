@@ -1,16 +1,34 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from lldb_mix.ui.ansi import RESET, escape
+from lldb_mix.ui.styled import StyledText
 from lldb_mix.ui.theme import Theme
 
 
-def colorize(text: str, role: str, theme: Theme, enabled: bool) -> str:
+def role_prefix(role: str, theme: Theme, enabled: bool) -> str:
     if not enabled:
-        return text
+        return ""
     tokens = theme.colors.get(role)
     if not tokens:
-        return text
-    prefix = escape(tokens)
+        return ""
+    return escape(tokens)
+
+
+def colorize(text: str, role: str, theme: Theme, enabled: bool) -> str:
+    prefix = role_prefix(role, theme, enabled)
     if not prefix:
         return text
     return f"{prefix}{text}{RESET}"
+
+
+def style_text(text: str, role: str, theme: Theme, enabled: bool) -> StyledText:
+    return StyledText([(text, role_prefix(role, theme, enabled))])
+
+
+def span_style(theme: Theme, enabled: bool) -> Callable[[str, str], StyledText]:
+    def style(text: str, role: str) -> StyledText:
+        return style_text(text, role, theme, enabled)
+
+    return style
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from lldb_mix.ui.ansi import RESET
+
+Span = tuple[str, str]
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class StyledText:
+    __slots__ = ("spans", "width")
+
+    def __init__(self, spans: Iterable[Span] = ()):
+        self.spans: list[Span] = [span for span in spans if span[0]]
+        self.width = sum(len(text) for text, _ in self.spans)
+
+    @classmethod
+    def plain(cls, text: str) -> "StyledText":
+        return cls([(text, "")])
+
+    @property
+    def text(self) -> str:
+        return "".join(text for text, _ in self.spans)
+
+    def __add__(self, other: "StyledText | str") -> "StyledText":
+        return StyledText(self.spans + as_text(other).spans)
+
+    def __radd__(self, other: str) -> "StyledText":
+        return StyledText(as_text(other).spans + self.spans)
+
+    def __repr__(self) -> str:
+        return f"StyledText({self.spans!r})"
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def truncate(self, width: int) -> "StyledText":
+        if width <= 0:
+            return StyledText()
+        if self.width <= width:
+            return self
+        if width <= 3:
+            return StyledText.plain(self.text[:width])
+        remaining = width - 3
+        spans: list[Span] = []
+        prefix = ""
+        for text, prefix in self.spans:
+            if len(text) >= remaining:
+                spans.append((text[:remaining], prefix))
+                break
+            spans.append((text, prefix))
+            remaining -= len(text)
+        spans.append(("...", prefix))
+        return StyledText(spans)
+
+    def pad(self, width: int) -> "StyledText":
+        if self.width >= width:
+            return self
+        return StyledText(self.spans + [(" " * (width - self.width), "")])
+
+    def fit(self, width: int) -> "StyledText":
+        return self.truncate(width).pad(width)
+
+    def rstrip(self) -> "StyledText":
+        spans = list(self.spans)
+        while spans and not spans[-1][1]:
+            text = spans[-1][0].rstrip()
+            if text:
+                spans[-1] = (text, "")
+                break
+            spans.pop()
+        return StyledText(spans)
+
+    def render(self) -> str:
+        return "".join(
+            f"{prefix}{text}{RESET}" if prefix else text for text, prefix in self.spans
+        )
+
+
+def as_text(value: StyledText | str) -> StyledText:
+    if isinstance(value, StyledText):
+        return value
+    return parse_ansi(value)
+
+
+def join_text(sep: StyledText | str, parts: Iterable[StyledText | str]) -> StyledText:
+    sep_spans = as_text(sep).spans
+    spans: list[Span] = []
+    for idx, part in enumerate(parts):
+        if idx:
+            spans.extend(sep_spans)
+        spans.extend(as_text(part).spans)
+    return StyledText(spans)
+
+
+def parse_ansi(text: str) -> StyledText:
+    if "\x1b" not in text:
+        return StyledText.plain(text)
+    spans: list[Span] = []
+    prefix = ""
+    pos = 0
+    for match in _ANSI_RE.finditer(text):
+        spans.append((text[pos : match.start()], prefix))
+        code = match.group(0)
+        prefix = "" if code == RESET else prefix + code
+        pos = match.end()
+    spans.append((text[pos:], prefix))
+    return StyledText(spans)
+
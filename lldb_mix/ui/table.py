@@ -3,10 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Iterable
 
-from lldb_mix.ui.text import pad_ansi, truncate_ansi, visible_len
+from lldb_mix.ui.styled import StyledText, join_text
 
 
-StyleFn = Callable[[str, str], str]
+StyleFn = Callable[[str, str], StyledText]
 
 
 @dataclass(frozen=True)
@@ -40,6 +40,16 @@ def render_table(
     term_width: int,
     style: StyleFn,
 ) -> list[str]:
+    lines = render_table_text(rows, columns, term_width, style)
+    return [line.render() for line in lines]
+
+
+def render_table_text(
+    rows: Iterable[dict[str, object]],
+    columns: list[Column],
+    term_width: int,
+    style: StyleFn,
+) -> list[StyledText]:
     items = [dict(row) for row in rows]
     if not columns:
         return []
@@ -55,17 +65,19 @@ def render_table(
 
     header_parts = []
     for col, spec in zip(active_columns, active_layout):
-        header_parts.append(_pad_cell(style(col.label, "label"), spec.width, col.align))
-    header = " ".join(header_parts)
-    lines = [header, style("-" * max(table_width, 0), "separator")]
+        label = style(col.label, "label")
+        header_parts.append(_pad_cell(label, spec.width, col.align))
+    separator = style("-" * max(table_width, 0), "separator")
+    lines = [join_text(" ", header_parts), separator]
 
     for row in items:
         parts = []
         for col, spec in zip(active_columns, active_layout):
             raw = _stringify(row.get(col.key))
             raw = _truncate(raw, spec.width, col.truncate)
-            parts.append(_pad_cell(style(raw, col.role), spec.width, col.align))
-        lines.append(" ".join(parts).rstrip())
+            cell = style(raw, col.role)
+            parts.append(_pad_cell(cell, spec.width, col.align))
+        lines.append(join_text(" ", parts).rstrip())
 
     return lines
 
@@ -202,19 +214,16 @@ def _truncate(text: str, width: int, mode: str) -> str:
     return text[: width - 3] + "..."
 
 
-def _pad_cell(text: str, width: int, align: str) -> str:
+def _pad_cell(text: StyledText, width: int, align: str) -> StyledText:
     if width <= 0:
-        return ""
-    if visible_len(text) > width:
-        text = truncate_ansi(text, width)
-    length = visible_len(text)
-    if length >= width:
+        return StyledText()
+    text = text.truncate(width)
+    padding = width - text.width
+    if padding <= 0:
         return text
-    padding = width - length
     if align == "right":
-        return (" " * padding) + text
+        return " " * padding + text
     if align == "center":
         left = padding // 2
-        right = padding - left
-        return (" " * left) + text + (" " * right)
-    return pad_ansi(text, width)
+        return " " * left + text + " " * (padding - left)
+    return text.pad(width)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lldb_mix.arch.arm32 import ARM32_ARCH  # noqa: E402
+from lldb_mix.arch.arm64 import ARM64_ARCH  # noqa: E402
+from lldb_mix.arch.riscv import RISCV64_ABI_ARCH  # noqa: E402
+from lldb_mix.arch.x64 import X64_ARCH  # noqa: E402
+
+_PLAIN = {
+    "x64": ("mov", "lea", "add", "sub", "cmp", "test", "push", "pop", "xor", "and"),
+    "arm64": ("mov", "ldr", "str", "add", "sub", "cmp", "stp", "ldp", "adrp", "orr"),
+    "arm32": ("mov", "ldr", "str", "add", "sub", "cmp", "push", "pop", "moveq", "orr"),
+    "riscv64": ("addi", "ld", "sd", "mv", "li", "lui", "add", "sub", "auipc", "slli"),
+}
+
+_PROFILES = {
+    "x64": X64_ARCH,
+    "arm64": ARM64_ARCH,
+    "arm32": ARM32_ARCH,
+    "riscv64": RISCV64_ABI_ARCH,
+}
+
+
+def _stream(profile, plain: tuple[str, ...], count: int) -> list[str]:
+    rng = random.Random(0)
+    branches = [name for name in profile.known_mnemonics() if name.islower()]
+    return [
+        rng.choice(branches) if rng.random() < 0.2 else rng.choice(plain)
+        for _ in range(count)
+    ]
+
+
+def _uncached(profile, stream: list[str]) -> float:
+    branch_like = profile._branch_like
+    start = time.perf_counter()
+    for mnem in stream:
+        branch_like(mnem.lower())
+    return time.perf_counter() - start
+
+
+def _table(profile, stream: list[str]) -> float:
+    branch_like = profile.is_branch_like
+    start = time.perf_counter()
+    for mnem in stream:
+        branch_like(mnem)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time is_branch_like over a synthetic mnemonic stream."
+    )
+    parser.add_argument("--count", type=int, default=500_000)
+    args = parser.parse_args()
+
+    print(f"{'ARCH':<8} {'UNCACHED ms':>12} {'TABLE ms':>10} {'SPEEDUP':>8}")
+    for name, profile in _PROFILES.items():
+        stream = _stream(profile, _PLAIN[name], args.count)
+        before = _uncached(profile, stream)
+        after = _table(profile, stream)
+        print(
+            f"{name:<8} {before * 1000:>12.1f} {after * 1000:>10.1f} "
+            f"{before / after:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+import unittest
+
+from lldb_mix.arch.registry import ArchCache
+from lldb_mix.arch.x64 import X64_ARCH
+
+
+class FakeReg:
+    def __init__(self, name):
+        self.name = name
+
+    def GetName(self):
+        return self.name
+
+    def GetByteSize(self):
+        return 8
+
+
+class FakeSet:
+    def __init__(self, name, regs):
+        self.name = name
+        self.regs = [FakeReg(reg) for reg in regs]
+
+    def GetName(self):
+        return self.name
+
+    def GetNumChildren(self):
+        return len(self.regs)
+
+    def GetChildAtIndex(self, idx):
+        return self.regs[idx]
+
+
+class FakeSets(list):
+    def GetSize(self):
+        return len(self)
+
+    def GetValueAtIndex(self, idx):
+        return self[idx]
+
+
+class FakeThread:
+    def __init__(self, tid):
+        self.tid = tid
+
+    def GetThreadID(self):
+        return self.tid
+
+
+class FakeFrame:
+    def __init__(self, pc, sp, tid=1):
+        self.pc = pc
+        self.sp = sp
+        self.tid = tid
+        self.layout_reads = 0
+
+    def GetThread(self):
+        return FakeThread(self.tid)
+
+    def GetRegisters(self):
+        self.layout_reads += 1
+        regs = ("rax", "rsp", "rip", "rflags")
+        return FakeSets([FakeSet("General Purpose Registers", regs)])
+
+    def GetPC(self):
+        return self.pc
+
+    def GetSP(self):
+        return self.sp
+
+
+class FakeArchitecture:
+    def GetName(self):
+        return "x86_64"
+
+
+class FakeProcess:
+    def __init__(self, uid):
+        self.uid = uid
+
+    def IsValid(self):
+        return True
+
+    def GetUniqueID(self):
+        return self.uid
+
+
+class FakeTarget:
+    def __init__(self, uid=1):
+        self.process = FakeProcess(uid)
+
+    def GetTriple(self):
+        return "x86_64-unknown-linux-gnu"
+
+    def GetArchitecture(self):
+        return FakeArchitecture()
+
+    def GetAddressByteSize(self):
+        return 8
+
+    def GetProcess(self):
+        return self.process
+
+
+class TestArchCache(unittest.TestCase):
+    def test_reuses_layout_and_refreshes_pc_sp(self):
+        cache = ArchCache()
+        target = FakeTarget()
+        first = cache.get(target, FakeFrame(0x1000, 0x7000))
+        frame = FakeFrame(0x2000, 0x6000)
+        second = cache.get(target, frame)
+        self.assertEqual(first.name, X64_ARCH.name)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(frame.layout_reads, 0)
+        self.assertEqual((second.pc_value, second.sp_value), (0x2000, 0x6000))
+        self.assertEqual(second.gpr_names, first.gpr_names)
+        self.assertIs(second.profile, first.profile)
+
+    def test_keyed_by_process_and_abi(self):
+        cache = ArchCache()
+        cache.get(FakeTarget(1), FakeFrame(0, 0))
+        cache.get(FakeTarget(2), FakeFrame(0, 0))
+        win = cache.get(FakeTarget(2), FakeFrame(0, 0), "win64")
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(win.abi.name, "win64")
+
+    def test_keyed_by_thread(self):
+        cache = ArchCache()
+        target = FakeTarget()
+        cache.get(target, FakeFrame(0, 0, tid=1))
+        frame = FakeFrame(0, 0, tid=2)
+        cache.get(target, frame)
+        cache.get(target, FakeFrame(0, 0, tid=2))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(frame.layout_reads, 1)
+
+    def test_no_frame_is_not_cached(self):
+        cache = ArchCache()
+        cache.get(FakeTarget(), None)
+        cache.get(FakeTarget(), None)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from lldb_mix.arch.x64 import X64_ARCH
+from lldb_mix.core.cfg import build_graph, format_graph_dot, format_graph_text
+from lldb_mix.core.disasm import FunctionDisasm, Instruction
+from tests.arch_test_utils import make_arch_view
+
+
+def _inst(addr, size, mnemonic, operands=""):
+    return Instruction(addr, b"\x90" * size, mnemonic, operands)
+
+
+class TestCfg(unittest.TestCase):
+    def setUp(self):
+        self.arch = make_arch_view(X64_ARCH)
+        self.disasm = FunctionDisasm.build(
+            "f",
+            [
+                _inst(0x1000, 3, "cmp", "edi, 0x0"),
+                _inst(0x1003, 2, "je", "0x100b"),
+                _inst(0x1005, 5, "call", "0x2000"),
+                _inst(0x100A, 1, "nop"),
+                _inst(0x100B, 2, "jmp", "0x1003"),
+                _inst(0x100D, 1, "ret"),
+            ],
+        )
+        self.graph = build_graph(self.disasm, self.arch)
+
+    def test_blocks(self):
+        spans = [(b.start, b.end, b.kind) for b in self.graph.blocks]
+        self.assertEqual(
+            spans,
+            [
+                (0x1000, 0x1003, "fall"),
+                (0x1003, 0x1005, "cond"),
+                (0x1005, 0x100B, "fall"),
+                (0x100B, 0x100D, "jump"),
+                (0x100D, 0x100E, "return"),
+            ],
+        )
+        self.assertEqual(self.graph.block_at(0x1007).start, 0x1005)
+        self.assertIsNone(self.graph.block_at(0x100E))
+
+    def test_edges(self):
+        edges = [(e.src, e.dst, e.kind) for e in self.graph.edges]
+        self.assertEqual(
+            edges,
+            [
+                (0x1000, 0x1003, "fallthrough"),
+                (0x1003, 0x100B, "taken"),
+                (0x1003, 0x1005, "fallthrough"),
+                (0x1005, 0x100B, "fallthrough"),
+                (0x100B, 0x1003, "taken"),
+            ],
+        )
+
+    def test_arm_slices_cached_function(self):
+        arm = self.graph.arm(0x100B, 2)
+        self.assertEqual([inst.mnemonic for inst in arm], ["jmp", "ret"])
+        self.assertIsNone(self.graph.arm(0x100C, 2))
+
+    def test_format(self):
+        text = format_graph_text(self.graph, 2)
+        self.assertEqual(text[0], "block 0x1000-0x1003 [fall] -> 0x1003 (fallthrough)")
+        self.assertEqual(text[1], "  0x1000 cmp edi, 0x0")
+        dot = format_graph_dot(self.graph, 2)
+        self.assertEqual(dot[0], 'digraph "f" {')
+        self.assertIn('  "0x1003" -> "0x100b" [label="taken"];', dot)
+        self.assertEqual(dot[-1], "}")
+
+
+if __name__ == "__main__":
+    unittest.main()
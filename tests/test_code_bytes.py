@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from lldb_mix.core.code_bytes import CodeBytes
+from lldb_mix.core.memory import MemoryRegion, RegionMap
+from lldb_mix.core.patches import PatchStore
+
+FILE_BYTES = bytes(range(256)) * 2
+
+
+class FakeTarget:
+    def __init__(self, path):
+        self.path = path
+
+    def GetNumModules(self):
+        return 1
+
+    def GetModuleAtIndex(self, idx):
+        return self.path
+
+
+class FakeProcess:
+    def __init__(self, path):
+        self.target = FakeTarget(path)
+        self.unique_id = 5
+        self.valid = True
+
+    def IsValid(self):
+        return self.valid
+
+    def GetUniqueID(self):
+        return self.unique_id
+
+    def GetTarget(self):
+        return self.target
+
+
+class TestCodeBytes(unittest.TestCase):
+    def setUp(self):
+        handle = tempfile.NamedTemporaryFile(delete=False)
+        handle.write(FILE_BYTES)
+        handle.close()
+        self.addCleanup(os.remove, handle.name)
+        self.live = {0x400000: FILE_BYTES[0x100:0x140]}
+        patchers = [
+            patch("lldb_mix.core.code_bytes.module_fullpath", side_effect=str),
+            patch(
+                "lldb_mix.core.code_bytes._code_sections",
+                return_value=[(0x400000, 0x400100, 0x100)],
+            ),
+            patch(
+                "lldb_mix.core.code_bytes.ProcessMemoryReader.read",
+                side_effect=lambda addr, size: self.live.get(addr),
+            ),
+            patch(
+                "lldb_mix.core.code_bytes._module_at",
+                side_effect=self._module_at,
+            ),
+        ]
+        self.module_lookups = 0
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.patches = PatchStore()
+        self.code = CodeBytes(self.patches)
+        self.addCleanup(self.code.close)
+        self.regions = RegionMap(
+            [MemoryRegion(0x400000, 0x401000, True, False, True, "text")]
+        )
+        self.process = FakeProcess(handle.name)
+        self.code.bind(self.process, self.regions)
+
+    def _module_at(self, target, addr):
+        self.module_lookups += 1
+        if 0x400000 <= addr < 0x401000:
+            return target.path
+        return None
+
+    def test_reads_file_bytes_at_load_address(self):
+        self.assertEqual(self.code.read(0x400010, 4), FILE_BYTES[0x110:0x114])
+        self.assertEqual(self.code.read(0x4000FE, 8), FILE_BYTES[0x1FE:0x200])
+        self.assertIsNone(self.code.read(0x400100, 4))
+        self.assertIsNone(self.code.read(0x3FFFFF, 4))
+
+    def test_patched_bytes_fall_back(self):
+        self.patches.add(0x400020, b"\x00", b"\xcc")
+        self.assertIsNone(self.code.read(0x40001C, 8))
+        self.assertIsNotNone(self.code.read(0x400021, 8))
+        self.assertEqual(self.code.fallbacks, 1)
+
+    def test_writable_region_falls_back(self):
+        regions = RegionMap(
+            [MemoryRegion(0x400000, 0x401000, True, True, True, "rwx")]
+        )
+        self.code.bind(self.process, regions)
+        self.assertIsNone(self.code.read(0x400010, 4))
+
+    def test_unloaded_module_file_is_closed(self):
+        self.code.read(0x400010, 4)
+        data = self.code._files[self.process.target.path]
+        self.process.target.path = "/nonexistent/libgone.so"
+        self.process.unique_id = 6
+        self.code.bind(self.process, self.regions)
+        self.assertIsNone(self.code.read(0x400010, 4))
+        self.assertTrue(data.closed)
+
+    def test_dead_process_closes_files(self):
+        self.code.read(0x400010, 4)
+        data = self.code._files[self.process.target.path]
+        self.process.valid = False
+        self.code.bind(self.process, self.regions)
+        self.assertTrue(data.closed)
+        self.assertEqual(self.code._files, {})
+
+    def test_modules_load_lazily(self):
+        self.assertIsNone(self.code.read(0x500000, 4))
+        self.assertIsNone(self.code.read(0x500010, 4))
+        self.assertEqual(self.code._files, {})
+        self.assertEqual(self.module_lookups, 1)
+        self.code.read(0x400010, 4)
+        self.code.read(0x400020, 4)
+        self.assertEqual(self.module_lookups, 2)
+        self.assertEqual(len(self.code._files), 1)
+
+    def test_mismatched_file_is_ignored(self):
+        self.live[0x400000] = b"\xff" * 0x40
+        code = CodeBytes(self.patches)
+        self.addCleanup(code.close)
+        code.bind(self.process, self.regions)
+        self.assertIsNone(code.read(0x400010, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
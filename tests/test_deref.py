@@ -3,7 +3,14 @@ import unittest
 from lldb_mix.core.memory import MemoryRegion
 from lldb_mix.core.settings import Settings
 from lldb_mix.core.symbols import SymbolInfo
-from lldb_mix.deref import deref_chain
+from lldb_mix.deref import (
+    DerefCache,
+    deref_chain,
+    deref_chains,
+    deref_nodes,
+    last_addr,
+    summarize_chain,
+)
 
 
 class FakeReader:
@@ -79,6 +86,57 @@ class TestDerefChain(unittest.TestCase):
             ],
         )
 
+    def test_deref_chains_batch_matches_single(self):
+        reader = FakeReader(
+            [
+                (
+                    0x1000,
+                    (0x2000).to_bytes(8, "little") + (0x1008).to_bytes(8, "little"),
+                ),
+                (0x2000, b"hello\x00" + (b"\x00" * 64)),
+            ]
+        )
+        regions = [MemoryRegion(0x1000, 0x3000, True, True, False, None)]
+        addrs = [0x1000, 0x1008, 0, 0x9000]
+        batch = deref_chains(addrs, reader, regions, None, Settings(), 8)
+        single = [
+            deref_chain(addr, reader, regions, None, Settings(), 8) for addr in addrs
+        ]
+        self.assertEqual(batch, single)
+        self.assertEqual(batch[1][-1], "[loop]")
+
+    def test_deref_nodes_summary(self):
+        reader = FakeReader([(0x1000, (0x2000).to_bytes(8, "little"))])
+        regions = [MemoryRegion(0x1000, 0x3000, True, True, False, None)]
+        resolver = FakeResolver({0x2000: SymbolInfo("func", "", 0)})
+        nodes = deref_nodes([0x1000], reader, regions, resolver, Settings(), 8)[0]
+        self.assertEqual([node.kind for node in nodes], ["addr", "addr", "symbol"])
+        summary = summarize_chain(nodes)
+        self.assertEqual(summary.kind, "symbol")
+        self.assertEqual(summary.symbol.name, "func")
+        self.assertEqual(last_addr(nodes), 0x2000)
+
+
+class TestDerefCache(unittest.TestCase):
+    def test_reuses_chains_within_stop(self):
+        reader = FakeReader([(0x1000, (0x2000).to_bytes(8, "little"))])
+        regions = [MemoryRegion(0x1000, 0x3000, True, True, False, None)]
+        cache = DerefCache()
+        cache.bind((1, 1))
+        first = cache.nodes([0x1000, 0x1000], reader, regions, None, Settings(), 8)
+        second = cache.nodes([0x1000], reader, regions, None, Settings(), 8)
+        self.assertIs(first[0], second[0])
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        settings = Settings()
+        settings.max_deref_depth = 1
+        cache.nodes([0x1000], reader, regions, None, settings, 8)
+        self.assertEqual(cache.misses, 2)
+
+        cache.bind((1, 2))
+        cache.nodes([0x1000], reader, regions, None, Settings(), 8)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
 
 if __name__ == "__main__":
     unittest.main()
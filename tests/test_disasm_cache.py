@@ -0,0 +1,295 @@
+import unittest
+from unittest.mock import patch
+
+from lldb_mix.core.disasm import (
+    MAX_FUNCTION_BYTES,
+    FunctionDisasm,
+    Instruction,
+    InstructionCache,
+    read_instructions,
+    read_instructions_around,
+)
+from lldb_mix.core.memory import MemoryRegion, RegionMap
+from lldb_mix.core.patches import PatchStore
+from lldb_mix.core.symbols import SymbolInfo
+
+
+class FakeTarget:
+    def GetNumModules(self):
+        return 1
+
+
+class FakeProcess:
+    def __init__(self):
+        self.stop_id = 1
+        self.expression_stops = 0
+        self.target = FakeTarget()
+
+    def IsValid(self):
+        return True
+
+    def GetUniqueID(self):
+        return 9
+
+    def GetStopID(self, include_expression_stops=False):
+        if include_expression_stops:
+            return self.stop_id + self.expression_stops
+        return self.stop_id
+
+    def GetTarget(self):
+        return self.target
+
+
+def _decode(target, addr, count, flavor, code_bytes=None):
+    return [
+        Instruction(addr + idx * 2, b"\x90\x90", "nop", "") for idx in range(count)
+    ]
+
+
+class TestInstructionCache(unittest.TestCase):
+    def setUp(self):
+        patcher = patch(
+            "lldb_mix.core.disasm._decode_instructions", side_effect=_decode
+        )
+        self.decode = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.process = FakeProcess()
+        self.regions = RegionMap(
+            [
+                MemoryRegion(0x1000, 0x2000, True, False, True, "text"),
+                MemoryRegion(0x8000, 0x9000, True, True, True, "jit"),
+            ]
+        )
+        self.cache = InstructionCache()
+        self.cache.bind(self.process, self.regions)
+
+    def test_reuses_decoded_instructions(self):
+        first = read_instructions(None, 0x1000, 4, "intel", self.cache)
+        again = read_instructions(None, 0x1004, 2, "intel", self.cache)
+        self.assertEqual(again, first[2:])
+        self.assertEqual(self.decode.call_count, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_extends_cached_prefix(self):
+        read_instructions(None, 0x1000, 2, "intel", self.cache)
+        insts = read_instructions(None, 0x1000, 3, "intel", self.cache)
+        self.assertEqual([inst.address for inst in insts], [0x1000, 0x1002, 0x1004])
+        self.assertEqual(self.decode.call_args[0][1:3], (0x1004, 1))
+
+    def test_flavor_is_part_of_key(self):
+        read_instructions(None, 0x1000, 1, "intel", self.cache)
+        read_instructions(None, 0x1000, 1, "att", self.cache)
+        self.assertEqual(self.decode.call_count, 2)
+
+    def test_writable_code_dropped_on_new_stop(self):
+        read_instructions(None, 0x1000, 1, "intel", self.cache)
+        read_instructions(None, 0x8000, 1, "intel", self.cache)
+        self.process.stop_id = 2
+        self.cache.bind(self.process, self.regions)
+        read_instructions(None, 0x1000, 1, "intel", self.cache)
+        read_instructions(None, 0x8000, 1, "intel", self.cache)
+        self.assertEqual(self.decode.call_count, 3)
+
+    def test_overflow_keeps_boundaries(self):
+        cache = InstructionCache(max_entries=4)
+        cache.bind(self.process, self.regions)
+        insts = read_instructions(None, 0x1000, 4, "intel", cache)
+        cache.mark_boundaries(insts, "intel")
+        read_instructions(None, 0x1100, 2, "intel", cache)
+        self.assertEqual(cache.boundary_before(0x1006, 2, "intel"), 0x1002)
+        read_instructions(None, 0x1100, 2, "intel", cache)
+        self.assertEqual(self.decode.call_count, 2)
+
+    def test_expression_stop_drops_writable_code(self):
+        read_instructions(None, 0x8000, 1, "intel", self.cache)
+        self.process.expression_stops = 1
+        self.cache.bind(self.process, self.regions)
+        read_instructions(None, 0x8000, 1, "intel", self.cache)
+        self.assertEqual(self.decode.call_count, 2)
+
+    def test_patch_changes_invalidate(self):
+        patches = PatchStore()
+        patches.on_change(self.cache.invalidate)
+        read_instructions(None, 0x1000, 1, "intel", self.cache)
+        patches.add(0x1000, b"\x90", b"\xcc")
+        read_instructions(None, 0x1000, 1, "intel", self.cache)
+        self.assertEqual(self.decode.call_count, 2)
+
+
+_LENGTHS = [1, 5, 3, 2, 7, 4, 1, 6, 3, 2] * 8
+_BOUNDARIES = {}
+_addr = 0x1000
+for _size in _LENGTHS:
+    _BOUNDARIES[_addr] = _size
+    _addr += _size
+
+
+def _decode_x86(target, addr, count, flavor, code_bytes=None):
+    insts = []
+    for _ in range(count):
+        size = _BOUNDARIES.get(addr, 3)
+        insts.append(Instruction(addr, b"\x90" * size, "op", ""))
+        addr += size
+    return insts
+
+
+class FakeArch:
+    max_inst_bytes = 15
+
+
+class FakeResolver:
+    def __init__(self, start):
+        self.start = start
+
+    def resolve(self, addr):
+        return SymbolInfo("fn", "a.out", addr - self.start)
+
+
+class TestAnchoredDisassembly(unittest.TestCase):
+    def setUp(self):
+        patcher = patch(
+            "lldb_mix.core.disasm._decode_instructions", side_effect=_decode_x86
+        )
+        self.decode = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.regions = RegionMap(
+            [MemoryRegion(0x1000, 0x2000, True, False, True, "text")]
+        )
+        self.cache = InstructionCache()
+        self.cache.bind(FakeProcess(), self.regions)
+        self.pcs = sorted(_BOUNDARIES)
+
+    def _around(self, pc, resolver=None):
+        return read_instructions_around(
+            None,
+            pc,
+            3,
+            2,
+            FakeArch(),
+            regions=self.regions,
+            cache=self.cache,
+            resolver=resolver,
+        )
+
+    def _expected(self, pc):
+        idx = self.pcs.index(pc)
+        return self.pcs[idx - 3 : idx + 3]
+
+    def test_symbol_anchor(self):
+        pc = self.pcs[20]
+        insts = self._around(pc, FakeResolver(0x1000))
+        self.assertEqual([inst.address for inst in insts], self._expected(pc))
+
+    def test_stepping_reuses_boundaries(self):
+        resolver = FakeResolver(0x1000)
+        self._around(self.pcs[20], resolver)
+        calls = self.decode.call_count
+        for pc in self.pcs[21:24]:
+            insts = self._around(pc, resolver)
+            self.assertEqual([inst.address for inst in insts], self._expected(pc))
+        self.assertEqual(self.decode.call_count, calls)
+
+    def test_boundary_index_without_symbols(self):
+        for pc in self.pcs[10:16]:
+            insts = self._around(pc)
+            self.assertEqual(insts[3].address, pc)
+        self.decode.reset_mock()
+        insts = self._around(self.pcs[14])
+        self.assertEqual([inst.address for inst in insts], self._expected(self.pcs[14]))
+        self.decode.assert_not_called()
+
+
+class FakeSymbols:
+    def __init__(self, ranges):
+        self.ranges = ranges
+        self.binds = 0
+
+    def bind(self, target):
+        self.binds += 1
+        return self
+
+    def lookup(self, addr):
+        return self.ranges.get(addr)
+
+
+class TestFunctionCache(unittest.TestCase):
+    def setUp(self):
+        patchers = [
+            patch("lldb_mix.core.disasm._decode_instructions", side_effect=_decode_x86),
+            patch(
+                "lldb_mix.core.disasm.symbol_range",
+                side_effect=lambda target, addr: (
+                    SymbolInfo("fn", "a.out", addr - 0x1000),
+                    0x1000,
+                    0x1000 + sum(_LENGTHS),
+                ),
+            ),
+        ]
+        self.decode = patchers[0].start()
+        for patcher in patchers[1:]:
+            patcher.start()
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+        self.regions = RegionMap(
+            [MemoryRegion(0x1000, 0x2000, True, False, True, "text")]
+        )
+        self.cache = InstructionCache()
+        self.cache.bind(FakeProcess(), self.regions)
+        self.pcs = sorted(_BOUNDARIES)
+
+    def test_function_arrays(self):
+        disasm = self.cache.function(None, self.pcs[5], "intel")
+        self.assertEqual(list(disasm.addrs), self.pcs)
+        self.assertEqual(disasm.index_of(self.pcs[5]), 5)
+        self.assertIsNone(disasm.index_of(self.pcs[5] + 1))
+        inst = disasm.instruction(4)
+        self.assertEqual((inst.address, inst.byte_size), (self.pcs[4], 7))
+        self.assertEqual((inst.mnemonic, inst.bytes), ("op", b"\x90" * 7))
+        self.assertIs(self.cache.function(None, self.pcs[-1], "intel"), disasm)
+
+    def test_stepping_within_function_decodes_once(self):
+        for pc in self.pcs[10:40]:
+            insts = read_instructions_around(
+                None, pc, 3, 2, FakeArch(), regions=self.regions, cache=self.cache
+            )
+            self.assertEqual(insts[3].address, pc)
+            self.assertEqual(len(insts), 6)
+        calls = self.decode.call_count
+        read_instructions(None, self.pcs[50], 4, "intel", self.cache)
+        self.assertEqual(self.decode.call_count, calls)
+        self.assertLessEqual(calls, 2)
+
+    def test_failed_functions_are_remembered(self):
+        huge = 0x1000 + MAX_FUNCTION_BYTES + 1
+        symbols = FakeSymbols(
+            {
+                0x1000: (SymbolInfo("huge", "a.out", 0), 0x1000, huge),
+                0x1001: (SymbolInfo("odd", "a.out", 0), 0x1001, 0x1040),
+            }
+        )
+        self.decode.side_effect = lambda target, addr, count, flavor, code=None: [
+            Instruction(addr + 1, b"\x90", "nop", "")
+        ]
+        cache = InstructionCache(symbols=symbols)
+        cache.bind(FakeProcess(), self.regions)
+        for _ in range(2):
+            self.assertIsNone(cache.function(None, 0x1000, "intel"))
+            self.assertIsNone(cache.function(None, 0x1001, "intel"))
+        self.assertEqual(self.decode.call_count, 1)
+        self.assertEqual(symbols.binds, 4)
+
+    def test_build_from_instructions(self):
+        disasm = FunctionDisasm.build(
+            "f",
+            [
+                Instruction(0x10, b"\x55", "push", "rbp"),
+                Instruction(0x11, b"\xc3", "ret", ""),
+            ],
+        )
+        self.assertEqual((disasm.start, disasm.end, len(disasm)), (0x10, 0x12, 2))
+        self.assertEqual(disasm.slice(0, 5)[0].operands, "rbp")
+        self.assertNotIn(0x12, disasm)
+
+
+if __name__ == "__main__":
+    unittest.main()
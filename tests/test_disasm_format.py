@@ -49,6 +49,21 @@ class TestDisasmFormat(unittest.TestCase):
         self.assertEqual(lines[0], "=> 0x0000000000001000 nop")
         self.assertEqual(lines[1], "   0x0000000000001001 mov eax, ebx")
 
+    def test_u_marker_index(self):
+        insts = [
+            Instruction(address=0x1000, bytes=b"\x90", mnemonic="nop", operands=""),
+            Instruction(address=0x1001, bytes=b"\xc3", mnemonic="ret", operands=""),
+        ]
+        lines = _format_instructions(
+            insts,
+            ptr_size=8,
+            show_opcodes=False,
+            style=lambda text, role: text,
+            marker=1,
+        )
+        self.assertEqual(lines[0], "   0x0000000000001000 nop")
+        self.assertEqual(lines[1], "=> 0x0000000000001001 ret")
+
 
 if __name__ == "__main__":
     unittest.main()
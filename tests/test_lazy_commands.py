@@ -0,0 +1,60 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from lldb_mix.commands import lazy
+from lldb_mix.commands.registry import COMMANDS, _command_add
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class FakeResult:
+    def __init__(self):
+        self.error = ""
+
+    def SetError(self, message):
+        self.error = message
+
+
+class TestLazyCommands(unittest.TestCase):
+    def test_every_command_has_trampoline(self):
+        for spec in COMMANDS:
+            name = spec.trampoline.rsplit(".", 1)[1]
+            self.assertTrue(callable(getattr(lazy, name)), spec.name)
+            self.assertIn(f"-f {spec.trampoline} {spec.name}", _command_add(spec))
+
+    def test_importing_trampolines_skips_command_modules(self):
+        code = (
+            "import sys\n"
+            "import lldb_mix.commands.lazy\n"
+            "print(','.join(sorted(m for m in sys.modules "
+            "if m.startswith('lldb_mix.'))))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        loaded = set(out.split(","))
+        for spec in COMMANDS:
+            self.assertNotIn(spec.module, loaded)
+        self.assertNotIn("lldb_mix.core.state", loaded)
+
+    def test_handler_resolved_on_first_use(self):
+        spec = next(spec for spec in COMMANDS if spec.name == "mixhelp")
+        handler = lazy.resolve_handler(spec)
+        self.assertEqual(handler.__module__, spec.module)
+        self.assertIs(lazy.resolve_handler(spec), handler)
+
+    def test_import_failure_reported_on_result(self):
+        spec = COMMANDS[0].__class__("broken", "lldb_mix.commands.missing.cmd", "x")
+        result = FakeResult()
+        lazy._trampoline(spec)(None, "", result, {})
+        self.assertIn("failed to import lldb_mix.commands.missing", result.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+
+from lldb_mix.core.memory import (
+    CachedMemoryReader,
+    coalesce_ranges,
+    process_stop_key,
+    read_ranges,
+)
+
+
+class CountingReader:
+    def __init__(self, base, data):
+        self.base = base
+        self.data = data
+        self.calls = []
+        self.key = (1, 1)
+
+    def read(self, addr, size):
+        self.calls.append((addr, size))
+        offset = addr - self.base
+        if offset < 0 or offset + size > len(self.data):
+            return None
+        return self.data[offset : offset + size]
+
+    def stop_key(self):
+        return self.key
+
+
+class TestCachedMemoryReader(unittest.TestCase):
+    def setUp(self):
+        self.backing = CountingReader(0x1000, bytes(range(256)) * 32)
+        self.reader = CachedMemoryReader(self.backing, page_size=0x1000)
+
+    def test_reads_served_from_page(self):
+        self.assertEqual(self.reader.read(0x1010, 4), bytes([0x10, 0x11, 0x12, 0x13]))
+        self.assertEqual(self.reader.read_pointer(0x1020, 8), 0x2726252423222120)
+        self.assertEqual(self.backing.calls, [(0x1000, 0x1000)])
+        stats = self.reader.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
+    def test_read_across_pages(self):
+        data = self.reader.read(0x1FFC, 8)
+        self.assertEqual(data, bytes([0xFC, 0xFD, 0xFE, 0xFF, 0x00, 0x01, 0x02, 0x03]))
+        self.assertEqual(self.backing.calls, [(0x1000, 0x1000), (0x2000, 0x1000)])
+
+    def test_unreadable_page_falls_back(self):
+        self.assertIsNone(self.reader.read(0x9000, 4))
+        self.assertIsNone(self.reader.read(0x9000, 4))
+        self.assertEqual(
+            self.backing.calls,
+            [(0x9000, 0x1000), (0x9000, 4), (0x9000, 4)],
+        )
+        self.assertEqual(self.reader.stats().misses, 2)
+
+    def test_read_many_counts_unreadable_page_once(self):
+        self.assertEqual(self.reader.read_many([(0x9000, 4)]), [None])
+        self.assertEqual(self.reader.stats().misses, 1)
+
+    def test_stop_change_drops_pages(self):
+        self.reader.read(0x1000, 4)
+        self.backing.key = (1, 2)
+        self.reader.read(0x1000, 4)
+        self.assertEqual(len(self.backing.calls), 2)
+
+    def test_invalidate(self):
+        self.reader.read(0x1000, 4)
+        self.reader.invalidate()
+        self.reader.read(0x1000, 4)
+        self.assertEqual(len(self.backing.calls), 2)
+
+    def test_read_many_fetches_missing_pages_once(self):
+        results = self.reader.read_many([(0x1008, 8), (0x2000, 4), (0x1000, 2)])
+        self.assertEqual(results[2], bytes([0x00, 0x01]))
+        self.assertEqual(results[1], bytes([0x00, 0x01, 0x02, 0x03]))
+        self.assertEqual(self.backing.calls, [(0x1000, 0x1000), (0x2000, 0x1000)])
+
+
+class ExpressionProcess:
+    def __init__(self):
+        self.stops = 3
+        self.expression_stops = 0
+
+    def IsValid(self):
+        return True
+
+    def GetUniqueID(self):
+        return 1
+
+    def GetStopID(self, include_expression_stops=False):
+        if include_expression_stops:
+            return self.stops + self.expression_stops
+        return self.stops
+
+
+class TestProcessStopKey(unittest.TestCase):
+    def test_expression_stops_change_key(self):
+        process = ExpressionProcess()
+        before = process_stop_key(process)
+        process.expression_stops = 1
+        self.assertNotEqual(process_stop_key(process), before)
+
+
+class TestReadRanges(unittest.TestCase):
+    def test_coalesce_adjacent_and_overlapping(self):
+        groups = coalesce_ranges([(0x20, 8), (0x10, 8), (0x18, 8), (0x40, 4), (0x42, 4)])
+        self.assertEqual(groups, [(0x10, 0x28, [1, 2, 0]), (0x40, 0x46, [3, 4])])
+
+    def test_read_ranges_splits_results(self):
+        backing = CountingReader(0x1000, bytes(range(64)))
+        results = read_ranges(backing.read, [(0x1000, 4), (0x1004, 4), (0x1010, 2)])
+        self.assertEqual(results, [b"\x00\x01\x02\x03", b"\x04\x05\x06\x07", b"\x10\x11"])
+        self.assertEqual(backing.calls, [(0x1000, 8), (0x1010, 2)])
+
+    def test_read_ranges_falls_back_per_range(self):
+        backing = CountingReader(0x1000, bytes(range(16)))
+        results = read_ranges(backing.read, [(0x1008, 8), (0x1010, 8)])
+        self.assertEqual(results, [bytes(range(8, 16)), None])
+        self.assertEqual(backing.calls, [(0x1008, 16), (0x1008, 8), (0x1010, 8)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from dataclasses import replace
+
+from lldb_mix.arch.arm32 import ARM32_ARCH
+from lldb_mix.arch.arm64 import ARM64_ARCH
+from lldb_mix.arch.base import ArchProfile
+from lldb_mix.arch.mnemonics import PLAIN, MnemonicTable
+from lldb_mix.arch.riscv import RISCV64_ABI_ARCH
+from lldb_mix.arch.x64 import X64_ARCH
+from lldb_mix.arch.x86 import X86_ARCH
+
+PROFILES = (X64_ARCH, X86_ARCH, ARM64_ARCH, ARM32_ARCH, RISCV64_ABI_ARCH)
+
+STREAM = (
+    "mov",
+    "je",
+    "JNE",
+    "jmpq",
+    "callq",
+    "retq",
+    "loop",
+    "jrcxz",
+    "b.eq",
+    "b.hi",
+    "bleq",
+    "bxne",
+    "blx",
+    "cbz",
+    "tbnz",
+    "beqz",
+    "jal",
+    "c.jr",
+    "ret",
+    "add",
+)
+
+
+class TestMnemonicTable(unittest.TestCase):
+    def test_profiles_prebuild_tables_on_registration(self):
+        for profile in PROFILES:
+            self.assertGreater(len(profile.mnemonics), 0, profile.name)
+
+    def test_known_mnemonics_do_not_grow_table(self):
+        size = len(X64_ARCH.mnemonics)
+        X64_ARCH.classify("jne")
+        X64_ARCH.classify("JMP")
+        self.assertEqual(len(X64_ARCH.mnemonics), size)
+
+    def test_table_matches_uncached_classifier(self):
+        for profile in PROFILES:
+            for mnem in STREAM:
+                self.assertEqual(
+                    profile.classify(mnem),
+                    profile._classify(mnem.lower()),
+                    f"{profile.name} {mnem}",
+                )
+
+    def test_x64_classes(self):
+        self.assertTrue(X64_ARCH.is_conditional_branch("JNE"))
+        self.assertTrue(X64_ARCH.is_unconditional_branch("jmpq"))
+        self.assertTrue(X64_ARCH.is_call("callq"))
+        self.assertTrue(X64_ARCH.is_return("retq"))
+        self.assertTrue(X64_ARCH.is_branch_like("jrcxz"))
+        self.assertIs(X64_ARCH.classify("mov"), PLAIN)
+
+    def test_arm_conditions(self):
+        self.assertEqual(ARM64_ARCH.classify("b.ne").condition, "ne")
+        self.assertEqual(ARM64_ARCH.classify("b").condition, "")
+        kind = ARM32_ARCH.classify("bleq")
+        self.assertTrue(kind.conditional)
+        self.assertTrue(kind.call)
+        self.assertEqual(kind.condition, "eq")
+        self.assertEqual(ARM64_ARCH.branch_taken("b.eq", 1 << 30), (True, "z=1"))
+        self.assertEqual(ARM32_ARCH.branch_taken("beq", 0), (False, "z=1"))
+
+    def test_riscv_classes(self):
+        self.assertTrue(RISCV64_ABI_ARCH.is_call("jal"))
+        self.assertTrue(RISCV64_ABI_ARCH.is_unconditional_branch("c.jr"))
+        self.assertTrue(RISCV64_ABI_ARCH.is_branch_like("beqz"))
+        self.assertFalse(RISCV64_ABI_ARCH.is_branch_like("addi"))
+
+    def test_replaced_profile_shares_table(self):
+        variant = replace(X64_ARCH, abi=None)
+        self.assertIs(variant.mnemonics, X64_ARCH.mnemonics)
+        self.assertEqual(variant, X64_ARCH)
+
+    def test_unregistered_profile_memoizes(self):
+        profile = ArchProfile("test", 8, ("pc", "sp"), "pc", "sp")
+        self.assertTrue(profile.is_call("CALL"))
+        self.assertEqual(len(profile.mnemonics), 1)
+        self.assertTrue(profile.is_return("ret"))
+        self.assertEqual(len(profile.mnemonics), 2)
+
+    def test_overflow_keeps_known_entries(self):
+        table = MnemonicTable(max_entries=4)
+        table.build(X64_ARCH._classify, ("je",))
+        for idx in range(8):
+            table.lookup(f"op{idx}", X64_ARCH._classify)
+        self.assertLessEqual(len(table), 4)
+        self.assertTrue(table.lookup("je", X64_ARCH._classify).conditional)
+        self.assertTrue(table.lookup("JE", X64_ARCH._classify).conditional)
+
+
+if __name__ == "__main__":
+    unittest.main()
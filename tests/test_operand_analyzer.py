@@ -0,0 +1,113 @@
+import unittest
+
+from lldb_mix.arch.arm64 import ARM64_ARCH
+from lldb_mix.arch.operands import Operand, operand_analyzer, parse_offset
+from lldb_mix.arch.riscv import RISCV64_ABI_ARCH
+from lldb_mix.arch.x64 import X64_ARCH
+
+
+class TestOperandAnalyzer(unittest.TestCase):
+    def test_analyzer_is_shared_per_arch(self):
+        regs = {"rax": 1, "rbx": 2, "rip": 3}
+        first = operand_analyzer(X64_ARCH, regs)
+        self.assertIs(operand_analyzer(X64_ARCH, dict(regs)), first)
+        self.assertIs(operand_analyzer(X64_ARCH, {"rax": 1}), first)
+        self.assertIsNot(operand_analyzer(ARM64_ARCH, regs), first)
+
+    def test_registers_resolve_aliases(self):
+        analyzer = operand_analyzer(X64_ARCH, {"rax": 1, "rbx": 2, "r8": 3})
+        hits = analyzer.registers("EAX, qword ptr [rbx + r8d*8]")
+        self.assertEqual(hits, (("EAX", "rax"), ("rbx", "rbx"), ("r8d", "r8")))
+        self.assertIs(analyzer.registers("EAX, qword ptr [rbx + r8d*8]"), hits)
+        self.assertEqual(analyzer.registers("raxx, 0x10"), ())
+
+    def test_mem_bases(self):
+        analyzer = operand_analyzer(ARM64_ARCH, {"x0": 0, "x1": 0, "fp": 0, "sp": 0})
+        self.assertEqual(analyzer.mem_bases("w0, [x29, #-0x10]"), (("fp", -0x10),))
+        self.assertEqual(analyzer.mem_bases("x0, [x1]!"), (("x1", 0),))
+        self.assertEqual(analyzer.mem_bases("x0, [x0, x1]"), ())
+
+    def test_operand_forms_are_cached(self):
+        analyzer = operand_analyzer(X64_ARCH, {"rax": 1, "rbx": 2, "r8": 3, "rip": 4})
+        self.assertEqual(analyzer.operand("0x401000 <main+16>"), Operand(disp=0x401000))
+        self.assertEqual(analyzer.operand("EAX"), Operand(base="rax"))
+        mem = analyzer.operand("qword ptr [rbx + 8*r8d - 0x10]")
+        self.assertEqual(mem, Operand("rbx", "r8", 8, -0x10, indirect=True))
+        self.assertIs(analyzer.operand("qword ptr [rbx + 8*r8d - 0x10]"), mem)
+        self.assertEqual(
+            analyzer.operand("[8*rax + 0x1000]"),
+            Operand(None, "rax", 8, 0x1000, indirect=True),
+        )
+        self.assertEqual(
+            analyzer.operand("[rbx + r8*4]"), analyzer.operand("[rbx + 4*r8]")
+        )
+        self.assertIsNone(analyzer.operand("foo"))
+        self.assertIsNone(analyzer.operand("[rbx - rax]"))
+
+    def test_arm64_mem_operands(self):
+        analyzer = operand_analyzer(ARM64_ARCH, {"x0": 0, "x1": 0, "fp": 0, "sp": 0})
+        self.assertEqual(
+            analyzer.mem_operands("w0, [x29, #-0x10]"),
+            (Operand("fp", None, 1, -0x10, indirect=True),),
+        )
+        self.assertEqual(
+            analyzer.mem_operands("x2, [x0, x1, lsl #3]"),
+            (Operand("x0", "x1", 8, 0, indirect=True),),
+        )
+
+    def test_segment_prefixed_operands_are_skipped(self):
+        analyzer = operand_analyzer(X64_ARCH, {"rax": 1, "rbx": 2, "rip": 3})
+        self.assertIsNone(analyzer.operand("qword ptr fs:[rax]"))
+        self.assertIsNone(analyzer.operand("qword ptr [fs:rax]"))
+        self.assertEqual(analyzer.mem_operands("rax, qword ptr fs:[0x28]"), ())
+        self.assertEqual(analyzer.mem_bases("rbx, qword ptr gs:[rax + 0x8]"), ())
+        regs = {"rax": 0x1000, "rip": 0}
+        self.assertEqual(X64_ARCH.mem_operand_targets("rbx, fs:[rax]", regs), [])
+
+    def test_arm64_extended_index(self):
+        regs = {"x0": 0, "x1": 0x1000, "x2": 0xFFFFFFFF, "sp": 0}
+        self.assertEqual(
+            ARM64_ARCH.mem_operand_targets("x0, [x1, w2, sxtw #2]", regs), [0xFFC]
+        )
+        self.assertEqual(
+            ARM64_ARCH.mem_operand_targets("x0, [x1, w2, uxtw #2]", regs),
+            [0x1000 + 0xFFFFFFFF * 4],
+        )
+        regs["x2"] = (1 << 64) - 2
+        self.assertEqual(
+            ARM64_ARCH.mem_operand_targets("x0, [x1, x2, sxtx #3]", regs), [0xFF0]
+        )
+
+    def test_riscv_base_offset(self):
+        analyzer = operand_analyzer(RISCV64_ABI_ARCH, {"sp": 0, "a0": 0})
+        self.assertEqual(
+            analyzer.operand("-8(sp)"), Operand("sp", disp=-8, indirect=True)
+        )
+        self.assertEqual(analyzer.operand("0(a0)"), Operand("a0", indirect=True))
+
+    def test_mem_operand_targets_apply_displacement(self):
+        regs = {"rbp": 0x1000, "rax": 2, "rip": 0}
+        self.assertEqual(X64_ARCH.mem_operand_targets("[rbp - 0x8]", regs), [0xFF8])
+        self.assertEqual(
+            X64_ARCH.mem_operand_targets("eax, [rbp + 4*rax + 0x10]", regs), [0x1018]
+        )
+        self.assertEqual(
+            RISCV64_ABI_ARCH.mem_operand_targets("a0, 16(sp)", {"sp": 0x100}), [0x110]
+        )
+
+    def test_rip_relative_uses_next_instruction(self):
+        regs = {"rax": 0, "rip": 0x1000}
+        operands = "rax, qword ptr [rip + 0x20]"
+        self.assertEqual(X64_ARCH.mem_operand_targets(operands, regs, 0x1007), [0x1027])
+        self.assertEqual(X64_ARCH.mem_operand_targets(operands, regs), [])
+        analyzer = operand_analyzer(X64_ARCH, regs)
+        self.assertEqual(analyzer.mem_bases(operands), ())
+
+    def test_parse_offset(self):
+        self.assertEqual(parse_offset("rbp - 0x8"), -8)
+        self.assertEqual(parse_offset("rsp + 16"), 16)
+        self.assertEqual(parse_offset("rax"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
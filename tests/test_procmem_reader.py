@@ -0,0 +1,85 @@
+import ctypes
+import os
+import sys
+import unittest
+
+from lldb_mix.core.memory import (
+    MAX_PROC_BUFFER,
+    READ_COUNTERS,
+    MemoryRegion,
+    ProcMemReader,
+    RegionMap,
+)
+
+
+class FallbackReader:
+    def __init__(self):
+        self.process = None
+        self.calls = []
+
+    def read(self, addr, size):
+        self.calls.append((addr, size))
+        return b"\xaa" * size
+
+    def stop_key(self):
+        return None
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "requires /proc/<pid>/mem")
+class TestProcMemReader(unittest.TestCase):
+    def setUp(self):
+        try:
+            fd = os.open("/proc/self/mem", os.O_RDONLY)
+        except OSError as exc:
+            raise unittest.SkipTest(f"/proc/self/mem unavailable: {exc}")
+        self.buf = ctypes.create_string_buffer(b"lldb-mix\x00" + b"\x11" * 32)
+        self.addr = ctypes.addressof(self.buf)
+        self.fallback = FallbackReader()
+        self.reader = ProcMemReader(fd, self.fallback)
+        self.addCleanup(self.reader.close)
+
+    def test_read_local_memory(self):
+        self.assertEqual(self.reader.read(self.addr, 8), b"lldb-mix")
+        self.assertEqual(self.reader.read_pointer(self.addr + 9, 8), 0x1111111111111111)
+        self.assertEqual(self.fallback.calls, [])
+
+    def test_read_many(self):
+        results = self.reader.read_many([(self.addr, 4), (self.addr + 4, 4)])
+        self.assertEqual(results, [b"lldb", b"-mix"])
+
+    def test_code_regions_use_fallback(self):
+        code = RegionMap([MemoryRegion(self.addr, self.addr + 8, True, False, True)])
+        self.reader.code_regions = lambda process: code
+        self.assertEqual(self.reader.read(self.addr + 4, 8), b"\xaa" * 8)
+        self.assertEqual(self.fallback.calls, [(self.addr + 4, 8)])
+        self.assertEqual(self.reader.read(self.addr + 8, 1), b"\x00")
+
+    def test_code_regions_checked_once_per_batch(self):
+        calls = []
+
+        def code_regions(process):
+            calls.append(process)
+            return RegionMap()
+
+        self.reader.code_regions = code_regions
+        ranges = [(self.addr, 4), (self.addr + 0x10000, 4), (self.addr + 4, 4)]
+        self.reader.read_many(ranges)
+        self.assertEqual(len(calls), 1)
+
+    def test_reads_are_counted(self):
+        before = READ_COUNTERS.reads, READ_COUNTERS.bytes
+        self.reader.read(self.addr, 8)
+        self.assertEqual(READ_COUNTERS.reads, before[0] + 1)
+        self.assertEqual(READ_COUNTERS.bytes, before[1] + 8)
+
+    def test_large_reads_do_not_grow_buffer(self):
+        self.reader.read(self.addr, MAX_PROC_BUFFER + 1)
+        self.assertLessEqual(len(self.reader._buffer), MAX_PROC_BUFFER)
+
+    def test_closed_reader_uses_fallback(self):
+        self.reader.close()
+        self.assertEqual(self.reader.read(self.addr, 2), b"\xaa\xaa")
+
+
+if __name__ == "__main__":
+    unittest.main()
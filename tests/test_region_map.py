@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import patch
+
+from lldb_mix.core.memory import MemoryRegion, RegionCache, RegionMap, find_region
+
+
+class FakeTarget:
+    def __init__(self):
+        self.modules = 1
+
+    def GetNumModules(self):
+        return self.modules
+
+
+class FakeProcess:
+    def __init__(self):
+        self.stop_id = 1
+        self.target = FakeTarget()
+
+    def IsValid(self):
+        return True
+
+    def GetUniqueID(self):
+        return 7
+
+    def GetStopID(self, include_expression_stops=False):
+        return self.stop_id
+
+    def GetTarget(self):
+        return self.target
+
+
+class TestRegionMap(unittest.TestCase):
+    def setUp(self):
+        self.regions = RegionMap(
+            [
+                MemoryRegion(0x5000, 0x6000, False, False, False, None),
+                MemoryRegion(0x1000, 0x2000, True, False, True, "text"),
+                MemoryRegion(0x3000, 0x4000, True, True, False, "heap"),
+                MemoryRegion(0x6000, 0x8000, True, True, False, "stack"),
+            ]
+        )
+
+    def test_sorted(self):
+        self.assertEqual(
+            [region.start for region in self.regions],
+            [0x1000, 0x3000, 0x5000, 0x6000],
+        )
+
+    def test_find(self):
+        self.assertEqual(self.regions.find(0x1000).name, "text")
+        self.assertEqual(self.regions.find(0x3FFF).name, "heap")
+        self.assertIsNone(self.regions.find(0x2000))
+        self.assertIsNone(self.regions.find(0x0FFF))
+        self.assertIsNone(self.regions.find(0x8000))
+        self.assertEqual(find_region(0x6000, self.regions).name, "stack")
+
+    def test_overlaps(self):
+        names = [region.name for region in self.regions.overlaps(0x1800, 0x3001)]
+        self.assertEqual(names, ["text", "heap"])
+        self.assertEqual(self.regions.overlaps(0x2000, 0x3000), [])
+        self.assertEqual(self.regions.overlaps(0x3000, 0x3000), [])
+
+    def test_next_readable(self):
+        self.assertEqual(self.regions.next_readable(0x1800).name, "text")
+        self.assertEqual(self.regions.next_readable(0x2000).name, "heap")
+        self.assertEqual(self.regions.next_readable(0x4000).name, "stack")
+        self.assertIsNone(self.regions.next_readable(0x8000))
+
+    def test_of(self):
+        self.assertIs(RegionMap.of(self.regions), self.regions)
+        self.assertEqual(len(RegionMap.of(None)), 0)
+
+
+class TestRegionCache(unittest.TestCase):
+    def setUp(self):
+        self.process = FakeProcess()
+        self.cache = RegionCache()
+        patcher = patch(
+            "lldb_mix.core.memory.read_memory_regions",
+            return_value=[MemoryRegion(0x1000, 0x2000, True, True, False, None)],
+        )
+        self.read = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reuse_within_stop(self):
+        first = self.cache.get(self.process)
+        self.assertIs(self.cache.get(self.process), first)
+        self.process.stop_id = 2
+        self.assertIsNot(self.cache.get(self.process), first)
+        self.assertEqual(self.read.call_count, 2)
+
+    def test_refresh(self):
+        self.cache.get(self.process)
+        self.cache.get(self.process, refresh=True)
+        self.assertEqual(self.read.call_count, 2)
+
+    def test_reuse_until_modules_change(self):
+        self.cache.get(self.process, reuse="modules")
+        self.process.stop_id = 2
+        self.cache.get(self.process, reuse="modules", probes=(0x1800, None))
+        self.assertEqual(self.read.call_count, 1)
+        self.process.target.modules = 2
+        self.cache.get(self.process, reuse="modules")
+        self.assertEqual(self.read.call_count, 2)
+
+    def test_unmapped_probe_refreshes(self):
+        self.cache.get(self.process, reuse="modules")
+        self.cache.get(self.process, reuse="modules", probes=(0x9000,))
+        self.assertEqual(self.read.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from lldb_mix.commands.regions import format_regions_table
 from lldb_mix.core.memory import MemoryRegion
+from lldb_mix.ui.styled import StyledText
 
 
 class TestRegionsFormat(unittest.TestCase):
@@ -37,7 +38,7 @@ class TestRegionsFormat(unittest.TestCase):
                 target=object(),
                 lldb_module=None,
                 term_width=120,
-                style=lambda text, role: text,
+                style=lambda text, role: StyledText.plain(text),
             )
 
         self.assertEqual(
@@ -0,0 +1,122 @@
+import unittest
+
+from lldb_mix.arch.info import ArchInfo
+from lldb_mix.arch.view import ArchView
+from lldb_mix.core.regs import FrameRegisters
+from lldb_mix.core.session import Session
+from lldb_mix.core.state import SETTINGS
+
+
+class FakeReg:
+    def __init__(self, name, value, log):
+        self.name = name
+        self.value = value
+        self.log = log
+
+    def IsValid(self):
+        return True
+
+    def GetName(self):
+        return self.name
+
+    def GetValueAsUnsigned(self):
+        self.log.append(self.name)
+        return self.value
+
+
+class FakeSet(list):
+    def __init__(self, name, regs):
+        super().__init__(regs)
+        self.name = name
+
+    def IsValid(self):
+        return True
+
+    def GetName(self):
+        return self.name
+
+
+class FakeSets(list):
+    def GetFirstValueByName(self, name):
+        for reg_set in self:
+            if reg_set.name == name:
+                return reg_set
+        return None
+
+
+class FakeFrame:
+    def __init__(self):
+        self.log = []
+        gpr = [FakeReg(name, idx, self.log) for idx, name in enumerate(("rax", "rip"))]
+        vec = [FakeReg(f"zmm{idx}", idx, self.log) for idx in range(32)]
+        self.sets = FakeSets(
+            [FakeSet("General Purpose Registers", gpr), FakeSet("AVX-512", vec)]
+        )
+
+    def GetRegisters(self):
+        return self.sets
+
+    def FindRegister(self, name):
+        for reg_set in self.sets:
+            for reg in reg_set:
+                if reg.name == name:
+                    return reg
+        return None
+
+
+class FakeSession(Session):
+    def __init__(self, frame):
+        super().__init__(None)
+        self._frame = frame
+
+    def frame(self):
+        return self._frame
+
+
+def _arch():
+    info = ArchInfo.from_register_sets(
+        "x86_64-unknown-linux",
+        "x86_64",
+        8,
+        {
+            "General Purpose Registers": [("rax", 8), ("rip", 8)],
+            "AVX-512": [(f"zmm{idx}", 64) for idx in range(32)],
+        },
+    )
+    return ArchView(info=info)
+
+
+class TestRegisterCapture(unittest.TestCase):
+    def setUp(self):
+        previous = SETTINGS.register_capture
+        self.addCleanup(setattr, SETTINGS, "register_capture", previous)
+        self.frame = FakeFrame()
+        self.session = FakeSession(self.frame)
+
+    def test_gpr_set_name_recorded(self):
+        self.assertEqual(_arch().info.gpr_set, "General Purpose Registers")
+
+    def test_gpr_capture_reads_only_gpr_set(self):
+        SETTINGS.register_capture = "gpr"
+        regs = self.session.read_registers(_arch())
+        self.assertEqual(dict(regs), {"rax": 0, "rip": 1})
+        self.assertEqual(self.frame.log, ["rax", "rip"])
+
+    def test_other_registers_fetched_on_demand(self):
+        SETTINGS.register_capture = "gpr"
+        regs = self.session.read_registers(_arch())
+        self.assertIn("zmm3", regs)
+        self.assertEqual(regs["zmm3"], 3)
+        self.assertIsNone(regs.get("nope"))
+        self.assertNotIn("nope", regs)
+        self.assertEqual(self.frame.log, ["rax", "rip", "zmm3"])
+
+    def test_all_capture_walks_every_set(self):
+        SETTINGS.register_capture = "all"
+        regs = self.session.read_registers(_arch())
+        self.assertNotIsInstance(regs, FrameRegisters)
+        self.assertEqual(len(regs), 34)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+
+from lldb_mix.arch.base import ArchProfile
+from lldb_mix.context.budget import BUDGET_MARK, RenderBudget, render_budget
+from lldb_mix.context.formatting import deref_summaries
+from lldb_mix.context.layout import render_rows
+from lldb_mix.context.panes.stack import StackPane
+from lldb_mix.context.types import PaneContext
+from lldb_mix.core.settings import Settings
+from lldb_mix.core.snapshot import ContextSnapshot
+from lldb_mix.core.watchlist import WatchList
+from lldb_mix.ui.theme import BASE_THEME
+from tests.arch_test_utils import make_arch_view
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Reader:
+    def read_pointer(self, addr, ptr_size):
+        return 0x1000
+
+    def read(self, addr, size):
+        return (0x1000).to_bytes(8, "little") * (size // 8)
+
+
+def _ctx(budget):
+    profile = ArchProfile(
+        name="test",
+        ptr_size=8,
+        gpr_names=("r0",),
+        pc_reg="pc",
+        sp_reg="sp",
+        flags_reg=None,
+    )
+    snapshot = ContextSnapshot(
+        arch=make_arch_view(profile, gpr_names=("r0",)),
+        pc=0,
+        sp=0x7000,
+        regs={"r0": 1},
+        maps=[],
+        timestamp=0.0,
+    )
+    settings = Settings()
+    settings.enable_color = False
+    settings.stack_frame_lines = 0
+    return PaneContext(
+        snapshot=snapshot,
+        settings=settings,
+        theme=BASE_THEME,
+        last_regs={},
+        reader=Reader(),
+        resolver=None,
+        target=None,
+        process=None,
+        watchlist=WatchList(),
+        term_width=80,
+        term_height=24,
+        budget=budget,
+    )
+
+
+class TestRenderBudget(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.budget = RenderBudget(100, clock=self.clock)
+
+    def test_thresholds(self):
+        self.assertFalse(self.budget.low())
+        self.clock.now = 0.06
+        self.assertFalse(self.budget.low())
+        self.clock.now = 0.09
+        self.assertTrue(self.budget.low())
+        self.assertFalse(self.budget.exhausted())
+        self.clock.now = 0.1
+        self.assertTrue(self.budget.exhausted())
+
+    def test_disabled_budget(self):
+        self.assertIsNone(render_budget(0))
+        self.assertIsNotNone(render_budget(50))
+
+    def test_deref_marked_when_low(self):
+        ctx = _ctx(self.budget)
+        self.clock.now = 0.09
+        self.assertEqual(deref_summaries(ctx, [1, 2], 8), [None, None])
+        self.assertEqual(self.budget.skipped, 1)
+
+    def test_stack_lines_reduced_when_low(self):
+        ctx = _ctx(self.budget)
+        full = StackPane().render(ctx)
+        self.clock.now = 0.09
+        degraded = render_rows([[StackPane()]], ctx)
+        self.assertEqual(len(full), 1 + ctx.settings.stack_lines)
+        self.assertEqual(len(degraded), 6)
+        self.assertEqual(degraded[-1], BUDGET_MARK)
+        self.assertEqual(sum(BUDGET_MARK in line for line in degraded), 1)
+
+    def test_exhausted_panes_skipped(self):
+        ctx = _ctx(self.budget)
+        self.clock.now = 0.2
+        lines = render_rows([[StackPane()]], ctx)
+        self.assertEqual(lines, ["[stack]", BUDGET_MARK])
+
+
+if __name__ == "__main__":
+    unittest.main()
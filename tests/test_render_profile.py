@@ -0,0 +1,99 @@
+import unittest
+
+from lldb_mix.context.layout import render_rows
+from lldb_mix.context.panes.base import Pane
+from lldb_mix.core.profile import PaneStats, RenderProfiler, format_profile
+from lldb_mix.ui.styled import StyledText
+
+
+class Counter:
+    def __init__(self):
+        self.reads = 0
+        self.bytes = 0
+        self.decode_misses = 0
+        self.symbols = 0
+
+    def __call__(self):
+        return (self.reads, self.bytes, self.decode_misses, self.symbols)
+
+
+class ReadingPane(Pane):
+    def __init__(self, name, counter, reads):
+        self.name = name
+        self.counter = counter
+        self.reads = reads
+
+    def render(self, ctx):
+        self.counter.reads += self.reads
+        self.counter.bytes += self.reads * 8
+        self.counter.symbols += 1
+        return [f"[{self.name}]"]
+
+
+class Ctx:
+    term_width = 40
+    budget = None
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+
+class TestRenderProfiler(unittest.TestCase):
+    def setUp(self):
+        self.counter = Counter()
+        self.profiler = RenderProfiler(self.counter)
+
+    def _render(self, profiler):
+        panes = [
+            [ReadingPane("regs", self.counter, 2)],
+            [ReadingPane("stack", self.counter, 5)],
+        ]
+        return render_rows(panes, Ctx(profiler))
+
+    def test_measures_each_pane(self):
+        self.profiler.begin()
+        lines = self._render(self.profiler)
+        self.profiler.end()
+        self.assertEqual(lines, ["[regs]", "", "[stack]"])
+        last = self.profiler.last
+        self.assertEqual(last["regs"].reads, 2)
+        self.assertEqual(last["stack"].bytes, 40)
+        self.assertEqual(last["total"].reads, 7)
+        self.assertEqual(last["total"].symbols, 2)
+
+    def test_disabled_profiler_records_nothing(self):
+        self._render(None)
+        self.assertEqual(self.profiler.last, {})
+        self.assertEqual(self.profiler.renders, 0)
+
+    def test_rolling_averages(self):
+        for _ in range(2):
+            self.profiler.begin()
+            self._render(self.profiler)
+            self.profiler.end()
+        averages = self.profiler.averages()
+        self.assertEqual(self.profiler.renders, 2)
+        self.assertEqual(averages["stack"].reads, 5)
+        self.assertEqual(averages["total"].reads, 7)
+        self.profiler.reset()
+        self.assertEqual(self.profiler.averages(), {})
+
+    def test_averages_use_rolling_window(self):
+        profiler = RenderProfiler(self.counter, window=2)
+        for reads in (10, 2, 4):
+            profiler.begin()
+            panes = [[ReadingPane("stack", self.counter, reads)]]
+            render_rows(panes, Ctx(profiler))
+            profiler.end()
+        self.assertEqual(profiler.renders, 3)
+        self.assertEqual(profiler.averages()["stack"].reads, 3)
+
+    def test_format_profile(self):
+        stats = {"code": PaneStats(0.0025, 3, 48, 12, 4)}
+        lines = format_profile(stats, 80, lambda text, role: StyledText.plain(text))
+        self.assertIn("DECODE MISSES", lines[0])
+        self.assertEqual(lines[2].split(), ["code", "2.50", "3", "48", "12", "4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from lldb_mix.core.history import HistoryWatch, is_step_command, last_history_entry
+from lldb_mix.ui.repaint import DiffRenderer
+
+
+def history(*commands):
+    return "\n".join(f"{idx:>4}: {cmd}" for idx, cmd in enumerate(commands))
+
+
+class TestDiffRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = DiffRenderer()
+
+    def test_first_frame_is_full(self):
+        out = self.renderer.frame(["a", "b"], (80, 24))
+        self.assertEqual(out, "\x1b[2J\x1b[Ha\nb")
+
+    def test_only_changed_lines_rewritten(self):
+        self.renderer.frame(["a", "b", "c"], (80, 24))
+        out = self.renderer.frame(["a", "B", "c"], (80, 24))
+        self.assertEqual(out, "\x1b[2;1HB\x1b[K\x1b[4;1H\x1b[J")
+
+    def test_shorter_frame_clears_tail(self):
+        self.renderer.frame(["a", "b", "c"], (80, 24))
+        out = self.renderer.frame(["a", "b"], (80, 24))
+        self.assertEqual(out, "\x1b[3;1H\x1b[J")
+
+    def test_resize_forces_full_redraw(self):
+        self.renderer.frame(["a"], (80, 24))
+        out = self.renderer.frame(["a"], (100, 24))
+        self.assertTrue(out.startswith("\x1b[2J\x1b[H"))
+
+    def test_tall_frame_forces_full_redraw(self):
+        self.renderer.frame(["a"] * 3, (80, 3))
+        out = self.renderer.frame(["a"] * 2, (80, 3))
+        self.assertTrue(out.startswith("\x1b[2J\x1b[H"))
+
+    def test_stop_text_rows_count_toward_height(self):
+        self.renderer.frame(["a"] * 20, (80, 24))
+        out = self.renderer.frame(["b"] * 20, (80, 24))
+        self.assertTrue(out.startswith("\x1b[2J\x1b[H"))
+
+    def test_reset(self):
+        self.renderer.frame(["a"], (80, 24))
+        self.renderer.reset()
+        self.assertTrue(self.renderer.frame(["a"], (80, 24)).startswith("\x1b[2J"))
+
+    def test_full_frame_requested(self):
+        self.renderer.frame(["a"], (80, 24))
+        out = self.renderer.frame(["a"], (80, 24), full=True)
+        self.assertTrue(out.startswith("\x1b[2J"))
+
+    def test_output_between_frames_forces_full_redraw(self):
+        watch = HistoryWatch()
+        watch.quiet_step(history("file a.out", "r"), (1, 1))
+        self.renderer.frame(["a", "b"], (80, 24))
+        print_between = history("file a.out", "r", "p x", "si")
+        full = not watch.quiet_step(print_between, (1, 2))
+        out = self.renderer.frame(["a", "B"], (80, 24), full)
+        self.assertEqual(out, "\x1b[2J\x1b[Ha\nB")
+
+    def test_single_step_allows_diff(self):
+        watch = HistoryWatch()
+        watch.quiet_step(history("r"), (1, 1))
+        self.assertTrue(watch.quiet_step(history("r", "si"), (1, 2)))
+        steps = history("r", "si", "thread step-over")
+        self.assertTrue(watch.quiet_step(steps, (1, 3)))
+        self.assertFalse(watch.quiet_step(steps, (1, 3)))
+        self.assertFalse(watch.quiet_step(history("r", "si", "c"), (1, 5)))
+        self.assertFalse(watch.quiet_step("", (1, 6)))
+
+    def test_repeated_step_without_history_entry_allows_diff(self):
+        watch = HistoryWatch()
+        watch.quiet_step(history("r", "si"), (1, 1))
+        self.assertTrue(watch.quiet_step(history("r", "si"), (1, 2)))
+        self.assertTrue(watch.quiet_step(history("r", "si"), (1, 3)))
+
+    def test_explicit_context_at_same_stop_is_full(self):
+        watch = HistoryWatch()
+        watch.quiet_step(history("r", "si"), (1, 2))
+        self.assertFalse(watch.quiet_step(history("r", "si", "context"), (1, 2)))
+
+    def test_new_process_is_full(self):
+        watch = HistoryWatch()
+        watch.quiet_step(history("r", "si"), (1, 2))
+        self.assertFalse(watch.quiet_step(history("r", "si", "si"), (2, 3)))
+
+
+class TestHistory(unittest.TestCase):
+    def test_last_entry(self):
+        self.assertEqual(last_history_entry(history("r", "ni")), (1, "ni"))
+        self.assertIsNone(last_history_entry("no history"))
+
+    def test_step_commands(self):
+        self.assertTrue(is_step_command("si"))
+        self.assertTrue(is_step_command("next 2"))
+        self.assertFalse(is_step_command("continue"))
+        self.assertFalse(is_step_command("ctx"))
+
+
+if __name__ == "__main__":
+    unittest.main()
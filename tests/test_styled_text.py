@@ -0,0 +1,69 @@
+import unittest
+
+from lldb_mix.context.layout import _join_columns
+from lldb_mix.ui.ansi import RESET, strip_ansi
+from lldb_mix.ui.styled import StyledText, join_text, parse_ansi
+from lldb_mix.ui.table import Column, render_table
+from lldb_mix.ui.text import pad_ansi, truncate_ansi
+
+RED = "\x1b[31m"
+BLUE = "\x1b[34m"
+
+
+def _red(text):
+    return StyledText([(text, RED)])
+
+
+class TestStyledText(unittest.TestCase):
+    def test_width_and_render(self):
+        text = _red("abc") + " " + StyledText.plain("def")
+        self.assertEqual(text.width, 7)
+        self.assertEqual(text.render(), f"{RED}abc{RESET} def")
+
+    def test_parse_round_trip(self):
+        raw = f"{RED}abc{RESET} x {BLUE}yz{RESET}"
+        text = parse_ansi(raw)
+        self.assertEqual(text.width, 8)
+        self.assertEqual(text.render(), raw)
+
+    def test_truncate_matches_legacy_visible_text(self):
+        raw = f"{RED}abcdef{RESET} {BLUE}ghijkl{RESET}"
+        for width in range(0, 16):
+            expected = strip_ansi(pad_ansi(truncate_ansi(raw, width), width))
+            fitted = parse_ansi(raw).fit(width)
+            self.assertEqual(fitted.text, expected)
+            self.assertEqual(fitted.width, max(width, 0))
+
+    def test_truncate_keeps_style_of_cut_span(self):
+        text = (_red("abcdef") + "ghi").truncate(6)
+        self.assertEqual(text.spans, [("abc", RED), ("...", RED)])
+
+    def test_rstrip_keeps_styled_spaces(self):
+        text = _red("a ") + "   "
+        self.assertEqual(text.rstrip().spans, [("a ", RED)])
+
+    def test_join_text(self):
+        text = join_text(", ", [_red("a"), "b"])
+        self.assertEqual(text.render(), f"{RED}a{RESET}, b")
+
+
+class TestStyledLayout(unittest.TestCase):
+    def test_join_columns_pads_short_block(self):
+        left = [_red("ab").fit(4), StyledText.plain("cd").fit(4)]
+        right = [StyledText.plain("x").fit(4)]
+        lines = _join_columns([left, right], 4)
+        self.assertEqual(lines, [f"{RED}ab{RESET}    x", "cd"])
+
+    def test_table_colored_cells_align(self):
+        def style(text, role):
+            return _red(text) if role == "value" else StyledText.plain(text)
+
+        rows = [{"k": "a", "v": "1"}, {"k": "bbb", "v": "22"}]
+        columns = [Column("k", "K"), Column("v", "V", role="value", align="right")]
+        lines = render_table(rows, columns, 40, style)
+        self.assertEqual([strip_ansi(line) for line in lines[2:]], ["a    1", "bbb 22"])
+        self.assertIn(f"{RED}22{RESET}", lines[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import mmap
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from lldb_mix.core.symbol_store import SymbolStore, load_symbol_index
+from lldb_mix.core.symbols import SymbolIndex, SymbolInfo
+
+
+def _index(count=3):
+    symbols = [
+        (0x1000 + idx * 0x100, 0x1080 + idx * 0x100, f"fn{idx}")
+        for idx in range(count)
+    ]
+    return SymbolIndex.build("libbar.so", symbols)
+
+
+class TestSymbolStore(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.store = SymbolStore(self.root)
+
+    def test_round_trip_with_slide(self):
+        self.assertTrue(self.store.save("ABCD-1234", _index()))
+        index = self.store.load("ABCD-1234", slide=0x5550000)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.resolve(0x5551210), SymbolInfo("fn2", "libbar.so", 0x10))
+        self.assertIsNone(index.resolve(0x5551090))
+
+    def test_missing_and_corrupt(self):
+        self.assertIsNone(self.store.load("missing"))
+        self.store.save("bad", _index())
+        path = self.store.path("bad")
+        with open(path, "r+b") as handle:
+            handle.write(b"NOTMAGIC")
+        self.assertIsNone(load_symbol_index(path))
+        with open(path, "ab") as handle:
+            handle.write(b"\x00")
+        self.assertIsNone(self.store.load("bad"))
+
+    def test_rejected_file_is_not_held_open(self):
+        self.store.save("bad", _index())
+        path = self.store.path("bad")
+        with open(path, "r+b") as handle:
+            handle.write(b"NOTMAGIC")
+        opened = []
+        real_mmap = mmap.mmap
+
+        def tracking_mmap(*args, **kwargs):
+            opened.append(real_mmap(*args, **kwargs))
+            return opened[-1]
+
+        with mock.patch("mmap.mmap", side_effect=tracking_mmap):
+            self.assertIsNone(load_symbol_index(path))
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(opened[0].closed)
+
+    def test_failed_save_removes_temp_file(self):
+        with mock.patch("os.replace", side_effect=OSError("boom")):
+            self.assertFalse(self.store.save("fail", _index()))
+        self.assertEqual(os.listdir(self.root), [])
+
+    def test_eviction_keeps_newest(self):
+        self.store.save("old", _index(64))
+        old_path = self.store.path("old")
+        os.utime(old_path, (1, 1))
+        self.store.max_bytes = os.path.getsize(old_path) + 16
+        self.store.save("new", _index(64))
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(self.store.path("new")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,43 @@
 import unittest
+from unittest.mock import patch
 
-from lldb_mix.core.symbols import is_placeholder_symbol
+from lldb_mix.core.symbols import (
+    CachedSymbolResolver,
+    SymbolIndex,
+    SymbolInfo,
+    is_placeholder_symbol,
+)
+
+
+class FakeProcess:
+    def IsValid(self):
+        return True
+
+    def GetUniqueID(self):
+        return 3
+
+
+class FakeTarget:
+    def __init__(self):
+        self.modules = 2
+        self.process = FakeProcess()
+
+    def IsValid(self):
+        return True
+
+    def GetProcess(self):
+        return self.process
+
+    def GetNumModules(self):
+        return self.modules
+
+
+def _lookup(target, addr):
+    if 0x1020 <= addr < 0x1040:
+        return SymbolInfo("inner", "a.out", addr - 0x1020), 0x1020, 0x1040
+    if 0x1000 <= addr < 0x1100:
+        return SymbolInfo("main", "a.out", addr - 0x1000), 0x1000, 0x1100
+    return None
 
 
 class TestSymbols(unittest.TestCase):
@@ -11,5 +48,114 @@ class TestSymbols(unittest.TestCase):
         self.assertFalse(is_placeholder_symbol("main"))
 
 
+class TestCachedSymbolResolver(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("lldb_mix.core.symbols.symbol_range", side_effect=_lookup)
+        self.lookup = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.target = FakeTarget()
+        self.resolver = CachedSymbolResolver().bind(self.target)
+
+    def test_hits_and_misses_cached(self):
+        self.assertEqual(self.resolver.resolve(0x1010).offset, 0x10)
+        self.assertIsNone(self.resolver.resolve(0x9000))
+        self.resolver.resolve(0x1010)
+        self.resolver.resolve(0x9000)
+        self.assertEqual(self.lookup.call_count, 2)
+
+    def test_nested_symbol_independent_of_lookup_order(self):
+        self.assertEqual(self.resolver.resolve(0x1080).name, "main")
+        self.assertEqual(
+            self.resolver.resolve(0x1030), SymbolInfo("inner", "a.out", 0x10)
+        )
+        self.assertEqual(self.lookup.call_count, 2)
+
+    def test_module_change_invalidates(self):
+        self.resolver.resolve(0x9000)
+        self.resolver.bind(self.target)
+        self.resolver.resolve(0x9000)
+        self.assertEqual(self.lookup.call_count, 1)
+        self.target.modules = 3
+        self.resolver.bind(self.target)
+        self.resolver.resolve(0x9000)
+        self.assertEqual(self.lookup.call_count, 2)
+
+    def test_new_target_invalidates(self):
+        self.resolver.resolve(0x9000)
+        self.resolver.bind(FakeTarget())
+        self.resolver.resolve(0x9000)
+        self.assertEqual(self.lookup.call_count, 2)
+
+
+class FakeIndexes:
+    def __init__(self, index):
+        self.index = index
+        self.calls = 0
+
+    def index_for(self, addr):
+        self.calls += 1
+        return self.index
+
+
+class TestSymbolIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SymbolIndex.build(
+            "libfoo.so",
+            [
+                (0x2000, 0x2040, "bar"),
+                (0x1000, 0x1100, "foo"),
+                (0x1000, 0x1010, "foo_alias"),
+                (0x3000, 0x3000, "empty"),
+                (0x4000, 0x4010, "___lldb_unnamed_symbol7"),
+            ],
+            slide=0x7F0000000000,
+        )
+
+    def test_sorted_unique_starts(self):
+        self.assertEqual(list(self.index.starts), [0x1000, 0x2000, 0x3000])
+        self.assertEqual(self.index.name_at(0), "foo")
+        self.assertEqual(len(self.index), 3)
+
+    def test_lookup_applies_slide(self):
+        base = 0x7F0000000000
+        info, start, end = self.index.lookup(base + 0x2010)
+        self.assertEqual(info, SymbolInfo("bar", "libfoo.so", 0x10))
+        self.assertEqual((start, end), (base + 0x2000, base + 0x2040))
+        self.assertIsNone(self.index.resolve(base + 0x2040))
+        self.assertIsNone(self.index.resolve(base + 0x3000))
+        self.assertIsNone(self.index.resolve(base + 0x4004))
+        self.assertIsNone(self.index.resolve(0x1000))
+
+    def test_lookup_falls_back_to_enclosing_symbol(self):
+        index = SymbolIndex.build(
+            "libnest.so",
+            [
+                (0x1000, 0x1400, "outer"),
+                (0x1100, 0x1200, "inner"),
+                (0x1120, 0x1140, "innermost"),
+                (0x2000, 0x2010, "next"),
+            ],
+        )
+        self.assertEqual(index.resolve(0x1130).name, "innermost")
+        self.assertEqual(index.resolve(0x1150), SymbolInfo("inner", "libnest.so", 0x50))
+        info, start, end = index.lookup(0x1300)
+        self.assertEqual(info, SymbolInfo("outer", "libnest.so", 0x300))
+        self.assertEqual((start, end), (0x1000, 0x1400))
+        self.assertIsNone(index.resolve(0x1400))
+        self.assertIsNone(index.resolve(0x2010))
+
+    def test_cached_resolver_uses_index(self):
+        with patch("lldb_mix.core.symbols.symbol_range") as lookup:
+            resolver = CachedSymbolResolver().bind(FakeTarget())
+            resolver.indexes = FakeIndexes(self.index)
+            self.assertEqual(resolver.resolve(0x7F0000002001).name, "bar")
+            self.assertEqual(resolver.resolve(0x7F0000002002).offset, 2)
+            resolver.resolve(0x7F0000002001)
+            self.assertIsNone(resolver.resolve(0x7F0000002040))
+            self.assertIsNone(resolver.resolve(0x7F0000002040))
+            lookup.assert_not_called()
+            self.assertEqual(resolver.indexes.calls, 3)
+
+
 if __name__ == "__main__":
     unittest.main()